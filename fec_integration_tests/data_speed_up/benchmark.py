@@ -0,0 +1,227 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Measures the host side of the data speed up protocol against a
+:py:class:`LoopbackGatherer`.
+
+Run as ``python -m fec_integration_tests.data_speed_up.benchmark --help``
+"""
+from __future__ import annotations
+import argparse
+import os
+import time
+from typing import List, NamedTuple, Optional, Sequence
+
+from spinn_utilities.config_holder import set_config
+
+from spinn_machine.version.version_strings import VersionStrings
+from spinn_machine.virtual_machine import virtual_machine_by_boards
+
+from pacman.model.placements import Placement
+
+from spinn_front_end_common.data.fec_data_writer import FecDataWriter
+from spinn_front_end_common.interface.config_setup import unittest_setup
+from spinn_front_end_common.utility_models import (
+    ExtraMonitorSupportMachineVertex)
+from fec_integration_tests.data_speed_up.loopback_gatherer import (
+    LoopbackGatherer, LoopbackGathererVertex)
+
+_MB = 1024 * 1024
+
+
+class BenchmarkResult(NamedTuple):
+    """
+    The measurements of one transfer.
+    """
+    #: "get_data" or "send_data_into_spinnaker"
+    operation: str
+    #: The number of bytes transferred
+    n_bytes: int
+    #: The wall clock time taken, in seconds
+    seconds: float
+    #: The CPU time of the host thread doing the transfer, in seconds
+    cpu_seconds: float
+    #: The number of data packets sent again
+    retransmissions: int
+    #: The number of times missing data was asked for or reported
+    missing_requests: int
+    #: The number of data packets lost
+    lost: int
+
+    @property
+    def mb_per_second(self) -> float:
+        """
+        The rate of the transfer in MB/s.
+        """
+        return self.n_bytes / _MB / self.seconds
+
+    @property
+    def cpu_seconds_per_mb(self) -> float:
+        """
+        The host CPU time taken per MB transferred.
+        """
+        return self.cpu_seconds / (self.n_bytes / _MB)
+
+    def __str__(self) -> str:
+        return (
+            f"{self.operation:>25} {self.n_bytes:>10} "
+            f"{self.mb_per_second:>8.2f} {self.cpu_seconds_per_mb:>10.4f} "
+            f"{self.retransmissions:>7} {self.missing_requests:>7} "
+            f"{self.lost:>7}")
+
+
+HEADER = (
+    f"{'operation':>25} {'bytes':>10} {'MB/s':>8} {'CPU s/MB':>10} "
+    f"{'resent':>7} {'missing':>7} {'lost':>7}")
+
+
+def setup_loopback_data() -> None:
+    """
+    Set up the data view with a virtual machine of one board, as needed
+    by the gatherer vertex.
+    """
+    unittest_setup()
+    set_config("Machine", "versions", VersionStrings.ANY.text)
+    set_config("Reports", "write_data_speed_up_reports", "False")
+    set_config("Reports", "write_provenance", "True")
+    writer = FecDataWriter.mock()
+    writer.set_machine(virtual_machine_by_boards(1))
+
+
+def _measure(
+        operation: str, n_bytes: int, loopback: LoopbackGatherer,
+        start_time: float, start_cpu: float) -> BenchmarkResult:
+    return BenchmarkResult(
+        operation, n_bytes, time.perf_counter() - start_time,
+        time.thread_time() - start_cpu, loopback.n_retransmitted,
+        loopback.n_missing_requests, loopback.n_packets_lost)
+
+
+def benchmark_get_data(
+        loopback: LoopbackGatherer, gatherer: LoopbackGathererVertex,
+        n_bytes: int, address: int = 0) -> BenchmarkResult:
+    """
+    Time reading the memory of the loopback board through the gatherer,
+    checking that what is read is correct.
+
+    :param loopback: The stand in board
+    :param gatherer: The gatherer vertex talking to the board
+    :param n_bytes: The number of bytes to read
+    :param address: Where to read from
+    :return: The measurements of the transfer
+    """
+    if len(loopback.memory) < address + n_bytes:
+        loopback.memory.extend(
+            bytes(address + n_bytes - len(loopback.memory)))
+    loopback.memory[address:address + n_bytes] = os.urandom(n_bytes)
+    extra_monitor = ExtraMonitorSupportMachineVertex()
+    placement = Placement(extra_monitor, 0, 0, 1)
+    loopback.reset_counts()
+    start_time = time.perf_counter()
+    start_cpu = time.thread_time()
+    data = gatherer.get_data(extra_monitor, placement, address, n_bytes)
+    result = _measure("get_data", n_bytes, loopback, start_time, start_cpu)
+    if bytes(data) != loopback.memory[address:address + n_bytes]:
+        raise ValueError("Data read does not match the memory")
+    return result
+
+
+def benchmark_send_data(
+        loopback: LoopbackGatherer, gatherer: LoopbackGathererVertex,
+        n_bytes: int, address: int = 0) -> BenchmarkResult:
+    """
+    Time writing to the memory of the loopback board through the
+    gatherer, checking that what is written is correct.
+
+    :param loopback: The stand in board
+    :param gatherer: The gatherer vertex talking to the board
+    :param n_bytes: The number of bytes to write
+    :param address: Where to write to
+    :return: The measurements of the transfer
+    """
+    data = os.urandom(n_bytes)
+    loopback.reset_counts()
+    start_time = time.perf_counter()
+    start_cpu = time.thread_time()
+    gatherer.send_data_into_spinnaker(0, 0, address, data)
+    result = _measure(
+        "send_data_into_spinnaker", n_bytes, loopback, start_time,
+        start_cpu)
+    if loopback.memory[address:address + n_bytes] != data:
+        raise ValueError("Data written does not match the data sent")
+    return result
+
+
+def run_benchmarks(
+        n_bytes: int, repeats: int = 1, host: str = "127.0.0.1", *,
+        loss: float = 0.0, reorder: float = 0.0, latency: float = 0.0,
+        bandwidth: Optional[float] = None,
+        seed: Optional[int] = None) -> List[BenchmarkResult]:
+    """
+    Time both directions of the protocol against a loopback board with
+    the given impairments.
+
+    :param n_bytes: The number of bytes in each transfer
+    :param repeats: The number of transfers in each direction
+    :param host: The loopback address to use
+    :param loss: The probability of a data packet being lost
+    :param reorder: The probability of a data packet being reordered
+    :param latency: The delay added to packets sent to the host
+    :param bandwidth: The bytes per second of the board, if limited
+    :param seed: The seed of the random impairments
+    :return: The measurements of each transfer
+    """
+    setup_loopback_data()
+    gatherer = LoopbackGathererVertex(host=host)
+    results = list()
+    with LoopbackGatherer(
+            host, loss=loss, reorder=reorder, latency=latency,
+            bandwidth=bandwidth, seed=seed) as loopback:
+        for _ in range(repeats):
+            results.append(benchmark_get_data(loopback, gatherer, n_bytes))
+        for _ in range(repeats):
+            results.append(benchmark_send_data(loopback, gatherer, n_bytes))
+        gatherer.close_connection()
+    return results
+
+
+def main(args: Optional[Sequence[str]] = None) -> None:
+    """
+    Run the benchmarks from the command line, printing the results.
+
+    :param args: The command line arguments
+    """
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--bytes", type=int, default=4 * _MB)
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--loss", type=float, default=0.0)
+    parser.add_argument("--reorder", type=float, default=0.0)
+    parser.add_argument(
+        "--latency", type=float, default=0.0, help="seconds")
+    parser.add_argument(
+        "--bandwidth", type=float, default=None, help="bytes per second")
+    parser.add_argument("--seed", type=int, default=None)
+    options = parser.parse_args(args)
+    results = run_benchmarks(
+        options.bytes, options.repeats, options.host, loss=options.loss,
+        reorder=options.reorder, latency=options.latency,
+        bandwidth=options.bandwidth, seed=options.seed)
+    print(HEADER)
+    for result in results:
+        print(result)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,407 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from __future__ import annotations
+import heapq
+import random
+import struct
+import time
+from threading import Thread
+from types import TracebackType
+from typing import List, Optional, Tuple, Type
+
+from spinn_utilities.overrides import overrides
+
+from spinnman.connections.udp_packet_connections import UDPConnection
+from spinnman.constants import SCP_SCAMP_PORT
+from spinnman.messages.scp import SCPRequestHeader
+from spinnman.messages.scp.enums import SCPResult
+from spinnman.messages.sdp import SDPHeader, SDPFlag, SDPMessage
+from spinnman.model.enums import SDP_PORTS
+
+from pacman.model.placements import Placement
+
+from spinn_front_end_common.utility_models import (
+    DataSpeedUpPacketGatherMachineVertex)
+from spinn_front_end_common.utility_models.\
+    data_speed_up_packet_gatherer_machine_vertex import (
+        BYTES_IN_FULL_PACKET_WITH_KEY,
+        WORDS_PER_FULL_PACKET_WITH_SEQUENCE_NUM, ceildiv)
+from spinn_front_end_common.utilities.constants import BYTES_PER_WORD
+
+_ONE_WORD = struct.Struct("<I")
+_TWO_WORDS = struct.Struct("<II")
+_THREE_WORDS = struct.Struct("<III")
+
+# The padding and SDP header at the start of each packet from the host
+_SDP_OFFSET = 2 + 8
+
+# Data out commands
+_START_SENDING = 100
+_START_MISSING_SEQ = 1000
+_MISSING_SEQ = 1001
+_CLEAR = 2000
+
+# Data in commands
+_SEND_DATA_TO_LOCATION = 200
+_SEND_SEQ_DATA = 2000
+_SEND_TELL = 2001
+_RECEIVE_MISSING_SEQ_DATA = 2002
+_RECEIVE_FINISHED = 2003
+
+# Flags in sequence numbers
+_LAST_FLAG = 0x80000000
+_END_FLAG = 0xFFFFFFFF
+_MISSING_ALL = 0xFFFFFFFE
+
+#: Bytes of data in a data out packet
+_BYTES_PER_OUT_PACKET = WORDS_PER_FULL_PACKET_WITH_SEQUENCE_NUM * \
+    BYTES_PER_WORD
+
+#: Missing sequence numbers in a data in report (leaving space for the end)
+_SEQS_PER_MISSING_REPORT = WORDS_PER_FULL_PACKET_WITH_SEQUENCE_NUM - 1
+
+
+class _SCPOKMessage(SDPMessage):
+
+    def __init__(self, sequence: int):
+        scp_header = SCPRequestHeader(
+            command=SCPResult.RC_OK, sequence=sequence)
+        sdp_header = SDPHeader(
+            flags=SDPFlag.REPLY_NOT_EXPECTED, destination_port=0,
+            destination_cpu=0, destination_chip_x=0, destination_chip_y=0)
+        sdp_header.update_for_send(0, 0)
+        super().__init__(sdp_header, data=scp_header.bytestring)
+
+
+class _OutStream(object):
+    """
+    A data out stream being sent to the host.
+    """
+    __slots__ = ("transaction_id", "data", "n_packets", "missing",
+                 "n_missing_packets")
+
+    def __init__(self, transaction_id: int, data: bytes):
+        self.transaction_id = transaction_id
+        self.data = data
+        self.n_packets = ceildiv(len(data), _BYTES_PER_OUT_PACKET)
+        self.missing: List[int] = list()
+        self.n_missing_packets = 0
+
+
+class _InStream(object):
+    """
+    A data in stream being received from the host.
+    """
+    __slots__ = ("transaction_id", "address", "received", "n_arrived")
+
+    def __init__(self, transaction_id: int, address: int, n_packets: int):
+        self.transaction_id = transaction_id
+        self.address = address
+        self.received = bytearray(n_packets)
+        self.n_arrived = 0
+
+
+class LoopbackGatherer(Thread):
+    """
+    Stands in for a board running the data speed up packet gatherer and
+    extra monitors, speaking the data speed up protocol over UDP so that
+    the host side of the protocol can be tested and timed without a
+    machine.
+
+    Data packets (but not the commands and replies that control a stream)
+    can be lost and reordered; the packet ending a data out stream is
+    never lost, so that streams recover without waiting for the host to
+    time out.  Packets sent to the host are delayed by the latency and
+    paced to the bandwidth; data in packets arriving faster than the
+    bandwidth are dropped once the buffer is full, as they would be by a
+    busy monitor.
+
+    Use as a context manager to start and stop it.
+    """
+
+    def __init__(
+            self, host: str = "127.0.0.1", memory_size: int = 0, *,
+            loss: float = 0.0, reorder: float = 0.0,
+            reorder_delay: float = 0.001, latency: float = 0.0,
+            bandwidth: Optional[float] = None, buffer_bytes: int = 64 * 1024,
+            seed: Optional[int] = None):
+        """
+        :param host:
+            The address to listen on; the gatherer vertex must be given the
+            same address
+        :param memory_size: The initial size of the memory of the board
+        :param loss: The probability of a data packet being lost
+        :param reorder:
+            The probability of a data packet being held back so that it
+            arrives after later packets
+        :param reorder_delay: How long reordered packets are held back for
+        :param latency: The delay added to each packet sent to the host
+        :param bandwidth:
+            The bytes per second the board can send or receive, or `None`
+            if unlimited
+        :param buffer_bytes:
+            The bytes of data in packets that can be waiting to be received
+            when the bandwidth is limited
+        :param seed: The seed of the random impairments
+        """
+        super().__init__(daemon=True)
+        self._connection = UDPConnection(
+            local_host=host, local_port=SCP_SCAMP_PORT)
+        #: The memory of the board
+        self.memory = bytearray(memory_size)
+        self._loss = loss
+        self._reorder = reorder
+        self._reorder_delay = reorder_delay
+        self._latency = latency
+        self._bandwidth = bandwidth
+        self._buffer_bytes = buffer_bytes
+        self._random = random.Random(seed)
+        self._running = True
+        self._tag_address: Optional[Tuple[str, int]] = None
+        self._pending: List[Tuple[float, int, bytes]] = list()
+        self._n_pending = 0
+        self._send_free_at = 0.0
+        self._receive_free_at = 0.0
+        self._out: Optional[_OutStream] = None
+        self._in: Optional[_InStream] = None
+        self.n_packets_sent = 0
+        self.n_packets_lost = 0
+        self.n_retransmitted = 0
+        self.n_missing_requests = 0
+        self.n_tags_set = 0
+        #: Whether the first byte of each data in packet is written wrongly
+        self.corrupt_writes = False
+
+    def __enter__(self) -> LoopbackGatherer:
+        self.start()
+        return self
+
+    def __exit__(self, exc_type: Optional[Type[BaseException]],
+                 exc_val: Optional[BaseException],
+                 exc_tb: Optional[TracebackType]) -> None:
+        self.stop()
+
+    def reset_counts(self) -> None:
+        """
+        Reset the counts of packets sent, lost and retransmitted.
+        """
+        self.n_packets_sent = 0
+        self.n_packets_lost = 0
+        self.n_retransmitted = 0
+        self.n_missing_requests = 0
+
+    @overrides(Thread.run)
+    def run(self) -> None:
+        while self._running:
+            timeout = 0.1
+            if self._pending:
+                timeout = max(0.0, self._pending[0][0] - time.perf_counter())
+            ready = self._connection.is_ready_to_receive(timeout)
+            if not self._running:
+                break
+            if ready:
+                data, address = self._connection.receive_with_address()
+                self.__receive(data, address)
+            self.__send_due()
+
+    def stop(self) -> None:
+        """
+        Stop responding and close the socket.
+        """
+        self._running = False
+        self._connection.close()
+        self.join()
+
+    def __receive(self, data: bytes, address: Tuple[str, int]) -> None:
+        port = SDPHeader.from_bytestring(data, 2).destination_port
+        if port == 0:
+            # The only SCP expected is the retargeting of the IP tag
+            self.n_tags_set += 1
+            self._tag_address = address
+            self._pending.clear()
+            _result, sequence = struct.unpack_from("<2H", data, _SDP_OFFSET)
+            self._connection.send_to(
+                struct.pack("<2x") + _SCPOKMessage(sequence).bytestring,
+                address)
+        elif port == SDP_PORTS.EXTRA_MONITOR_CORE_DATA_SPEED_UP.value:
+            self.__data_out(data[_SDP_OFFSET:])
+        elif port == SDP_PORTS.EXTRA_MONITOR_CORE_DATA_IN_SPEED_UP.value:
+            self.__data_in(data[_SDP_OFFSET:])
+
+    def __data_out(self, data: bytes) -> None:
+        command, transaction_id = _TWO_WORDS.unpack_from(data)
+        if command == _START_SENDING:
+            address, length = _TWO_WORDS.unpack_from(data, 8)
+            memory = self.memory[address:address + length]
+            stream = _OutStream(
+                transaction_id, bytes(memory) + bytes(length - len(memory)))
+            self._out = stream
+            for seq_num in range(stream.n_packets):
+                self.__send_seq_data(
+                    stream, seq_num, seq_num == stream.n_packets - 1)
+            return
+
+        stream_ = self._out
+        if stream_ is None or stream_.transaction_id != transaction_id:
+            return
+        if command == _CLEAR:
+            self._out = None
+            return
+        if command == _START_MISSING_SEQ:
+            self.n_missing_requests += 1
+            stream_.n_missing_packets, = _ONE_WORD.unpack_from(data, 8)
+            stream_.missing = list(struct.unpack_from(
+                f"<{(len(data) - 12) // BYTES_PER_WORD}I", data, 12))
+        elif command == _MISSING_SEQ:
+            stream_.missing.extend(struct.unpack_from(
+                f"<{(len(data) - 8) // BYTES_PER_WORD}I", data, 8))
+        else:
+            return
+        stream_.n_missing_packets -= 1
+        if stream_.n_missing_packets == 0:
+            for seq_num in stream_.missing:
+                self.n_retransmitted += 1
+                self.__send_seq_data(stream_, seq_num, False)
+            self.__send(_TWO_WORDS.pack(
+                stream_.n_packets | _LAST_FLAG, transaction_id), False)
+
+    def __send_seq_data(
+            self, stream: _OutStream, seq_num: int, last: bool) -> None:
+        offset = seq_num * _BYTES_PER_OUT_PACKET
+        self.__send(_TWO_WORDS.pack(
+            seq_num | (_LAST_FLAG if last else 0), stream.transaction_id) +
+            stream.data[offset:offset + _BYTES_PER_OUT_PACKET], not last)
+
+    def __data_in(self, data: bytes) -> None:
+        command, transaction_id = _TWO_WORDS.unpack_from(data)
+        if command == _SEND_DATA_TO_LOCATION:
+            address, _coord, last_seq_num = _THREE_WORDS.unpack_from(data, 8)
+            if (self._in is None or
+                    self._in.transaction_id != transaction_id):
+                self._in = _InStream(
+                    transaction_id, address, last_seq_num + 1)
+            return
+
+        stream = self._in
+        if stream is None or stream.transaction_id != transaction_id:
+            return
+        if command == _SEND_SEQ_DATA:
+            stream.n_arrived += 1
+            if stream.n_arrived > len(stream.received):
+                self.n_retransmitted += 1
+            if not self.__accept(len(data)):
+                return
+            seq_num, = _ONE_WORD.unpack_from(data, 8)
+            stream.received[seq_num] = 1
+            start = stream.address + seq_num * BYTES_IN_FULL_PACKET_WITH_KEY
+            payload = data[12:]
+            if self.corrupt_writes:
+                payload = bytes([payload[0] ^ 0xFF]) + payload[1:]
+            if start + len(payload) > len(self.memory):
+                self.memory.extend(
+                    bytes(start + len(payload) - len(self.memory)))
+            self.memory[start:start + len(payload)] = payload
+        elif command == _SEND_TELL:
+            missing = [seq_num for seq_num, received
+                       in enumerate(stream.received) if not received]
+            if not missing:
+                self.__send(_TWO_WORDS.pack(
+                    _RECEIVE_FINISHED, transaction_id), False)
+                return
+            self.n_missing_requests += 1
+            if len(missing) == len(stream.received):
+                missing = [_MISSING_ALL]
+            for start in range(0, len(missing), _SEQS_PER_MISSING_REPORT):
+                seq_nums = missing[start:start + _SEQS_PER_MISSING_REPORT]
+                if start + _SEQS_PER_MISSING_REPORT >= len(missing):
+                    seq_nums.append(_END_FLAG)
+                self.__send(struct.pack(
+                    f"<{len(seq_nums) + 2}I", _RECEIVE_MISSING_SEQ_DATA,
+                    transaction_id, *seq_nums), False)
+
+    def __accept(self, n_bytes: int) -> bool:
+        """
+        Decide whether an arriving data packet is lost.
+        """
+        if self._random.random() < self._loss:
+            self.n_packets_lost += 1
+            return False
+        if self._bandwidth is None:
+            return True
+        now = time.perf_counter()
+        backlog = max(0.0, self._receive_free_at - now) * self._bandwidth
+        if backlog + n_bytes > self._buffer_bytes:
+            self.n_packets_lost += 1
+            return False
+        self._receive_free_at = (
+            max(self._receive_free_at, now) + n_bytes / self._bandwidth)
+        return True
+
+    def __send(self, packet: bytes, impaired: bool) -> None:
+        """
+        Queue a packet to be sent to the host through the IP tag.
+        """
+        if impaired and self._random.random() < self._loss:
+            self.n_packets_lost += 1
+            return
+        now = time.perf_counter()
+        due = now + self._latency
+        if impaired and self._random.random() < self._reorder:
+            due += self._reorder_delay
+        if self._bandwidth is not None:
+            self._send_free_at = (
+                max(self._send_free_at, now) +
+                len(packet) / self._bandwidth)
+            due = max(due, self._send_free_at)
+        self._n_pending += 1
+        heapq.heappush(self._pending, (due, self._n_pending, packet))
+        self.__send_due()
+
+    def __send_due(self) -> None:
+        now = time.perf_counter()
+        while self._pending and self._pending[0][0] <= now:
+            _due, _n, packet = heapq.heappop(self._pending)
+            if self._tag_address is not None:
+                self.n_packets_sent += 1
+                self._connection.send_to(packet, self._tag_address)
+
+
+class LoopbackGathererVertex(DataSpeedUpPacketGatherMachineVertex):
+    """
+    A gatherer vertex set up to talk to a :py:class:`LoopbackGatherer`
+    without the vertex having been through mapping.
+    """
+    __slots__ = ("__loopback_placement", )
+
+    def __init__(self, x: int = 0, y: int = 0, p: int = 2,
+                 host: str = "127.0.0.1"):
+        """
+        :param x: The X coordinate of the chip the gatherer is taken to be on
+        :param y: The Y coordinate of the chip the gatherer is taken to be on
+        :param p: The core the gatherer is taken to be on
+        :param host: The address the :py:class:`LoopbackGatherer` is on
+        """
+        super().__init__(x, y, host)
+        self.__loopback_placement = Placement(self, x, y, p)
+        self._remote_tag = 1
+
+    @property
+    def _placement(self) -> Placement:
+        return self.__loopback_placement
+
+    @overrides(DataSpeedUpPacketGatherMachineVertex.
+               _read_transaction_id_from_machine)
+    def _read_transaction_id_from_machine(self) -> None:
+        # The loopback has no user registers; the vertex keeps count
+        pass
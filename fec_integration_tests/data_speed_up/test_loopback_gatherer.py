@@ -0,0 +1,166 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import io
+import os
+import unittest
+from contextlib import redirect_stdout
+from typing import List, Tuple
+
+from spinn_utilities.config_holder import set_config
+from spinn_utilities.overrides import overrides
+
+from spinnman.transceiver.mockable_transceiver import MockableTransceiver
+
+from pacman.model.placements import Placement, Placements
+
+from spinn_front_end_common.data import FecDataView
+from spinn_front_end_common.data.fec_data_writer import FecDataWriter
+from spinn_front_end_common.utility_models import (
+    ExtraMonitorSupportMachineVertex)
+from fec_integration_tests.data_speed_up.benchmark import (
+    HEADER, benchmark_get_data, benchmark_send_data, main,
+    setup_loopback_data)
+from fec_integration_tests.data_speed_up.loopback_gatherer import (
+    LoopbackGatherer, LoopbackGathererVertex)
+
+
+class _LoopbackTransceiver(MockableTransceiver):
+    """
+    Pretend transceiver that reads directly from the loopback memory.
+    """
+
+    def __init__(self, loopback: LoopbackGatherer) -> None:
+        self.loopback = loopback
+        self.reads: List[Tuple[int, int]] = list()
+
+    @overrides(MockableTransceiver.read_memory)
+    def read_memory(
+            self, x: int, y: int, base_address: int, length: int,
+            cpu: int = 0) -> bytearray:
+        self.reads.append((base_address, length))
+        return self.loopback.memory[base_address:base_address + length]
+
+
+class TestLoopbackGatherer(unittest.TestCase):
+
+    def setUp(self) -> None:
+        setup_loopback_data()
+        self.gatherer = LoopbackGathererVertex()
+
+    def tearDown(self) -> None:
+        self.gatherer.close_connection()
+
+    def test_clean(self) -> None:
+        with LoopbackGatherer() as loopback:
+            result = benchmark_get_data(
+                loopback, self.gatherer, 100000, 0x100)
+            self.assertEqual(0, result.retransmissions)
+            self.assertGreater(result.mb_per_second, 0)
+            result = benchmark_send_data(
+                loopback, self.gatherer, 100000, 0x200)
+            self.assertEqual(0, result.retransmissions)
+            self.assertEqual(100000, result.n_bytes)
+            # The thread CPU clock may not have ticked in a short transfer
+            self.assertGreaterEqual(result.cpu_seconds_per_mb, 0)
+
+    def test_loss_and_reorder(self) -> None:
+        with LoopbackGatherer(loss=0.05, reorder=0.05, seed=1) as loopback:
+            result = benchmark_get_data(loopback, self.gatherer, 100000)
+            self.assertGreater(result.lost, 0)
+            self.assertGreaterEqual(result.retransmissions, result.lost)
+            self.assertGreater(result.missing_requests, 0)
+            result = benchmark_send_data(loopback, self.gatherer, 100000)
+            self.assertGreater(result.lost, 0)
+            self.assertGreaterEqual(result.retransmissions, result.lost)
+
+    def test_latency_and_bandwidth(self) -> None:
+        with LoopbackGatherer(
+                latency=0.001, bandwidth=4000000,
+                buffer_bytes=8192) as loopback:
+            benchmark_get_data(loopback, self.gatherer, 50000)
+            benchmark_send_data(loopback, self.gatherer, 50000)
+
+    def test_connection_reused(self) -> None:
+        with LoopbackGatherer() as loopback:
+            # Without streaming, each transfer has its own connection
+            benchmark_get_data(loopback, self.gatherer, 1000)
+            benchmark_send_data(loopback, self.gatherer, 1000)
+            self.assertIsNone(self.gatherer._connection)
+            self.assertEqual(2, loopback.n_tags_set)
+
+            # As set_cores_for_data_streaming does, without the routers
+            self.gatherer._streaming = True
+            for _ in range(3):
+                benchmark_get_data(loopback, self.gatherer, 1000)
+                benchmark_send_data(loopback, self.gatherer, 1000)
+            self.assertEqual(3, loopback.n_tags_set)
+
+            # A broken socket is replaced
+            connection = self.gatherer._connection
+            assert connection is not None
+            connection.close()
+            benchmark_get_data(loopback, self.gatherer, 1000)
+            self.assertEqual(4, loopback.n_tags_set)
+
+            # The connection is closed at the end of streaming
+            self.gatherer._streaming = False
+            self.gatherer.close_connection()
+            self.assertIsNone(self.gatherer._connection)
+            benchmark_send_data(loopback, self.gatherer, 1000)
+            self.assertEqual(5, loopback.n_tags_set)
+            self.assertIsNone(self.gatherer._connection)
+
+    def test_verify_data_in(self) -> None:
+        writer = FecDataWriter.mock()
+        monitor = ExtraMonitorSupportMachineVertex()
+        writer.set_monitor_map({FecDataView.get_chip_at(0, 0): monitor})
+        writer.set_placements(Placements([Placement(monitor, 0, 0, 1)]))
+        data = os.urandom(10000)
+        with LoopbackGatherer() as loopback:
+            transceiver = _LoopbackTransceiver(loopback)
+            writer.set_transceiver(transceiver)
+
+            # Data read back that matches needs no direct reads
+            set_config("Machine", "verify_data_in", "gatherer")
+            self.gatherer.send_data_into_spinnaker(0, 0, 0x100, data)
+            self.assertEqual([], transceiver.reads)
+
+            # Only the blocks that differ are read directly
+            loopback.corrupt_writes = True
+            with self.assertRaises(ValueError):
+                self.gatherer.send_data_into_spinnaker(0, 0, 0x100, data)
+            self.assertEqual([(0x100, 4096)], transceiver.reads)
+
+            # A full check reads everything directly
+            loopback.corrupt_writes = False
+            transceiver.reads.clear()
+            set_config("Machine", "verify_data_in", "full")
+            self.gatherer.send_data_into_spinnaker(0, 0, 0x100, data)
+            self.assertEqual([(0x100, 10000)], transceiver.reads)
+
+    def test_main(self) -> None:
+        output = io.StringIO()
+        with redirect_stdout(output):
+            main(["--bytes", "10000", "--repeats", "1", "--loss", "0.01",
+                  "--seed", "2"])
+        lines = output.getvalue().splitlines()
+        self.assertEqual(HEADER, lines[0])
+        self.assertEqual(3, len(lines))
+        self.assertIn("get_data", lines[1])
+        self.assertIn("send_data_into_spinnaker", lines[2])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,167 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Measures generating data specifications with different numbers of
+threads, for vertices whose generation mostly runs in :py:mod:`numpy`
+(which releases the GIL) or mostly in Python.
+
+Run as
+``python -m fec_integration_tests.interface.interface_functions.dsg_benchmark
+--help``
+"""
+import argparse
+import os
+import time
+from typing import List, Optional, Sequence, Tuple
+
+import numpy
+
+from spinn_utilities.config_holder import set_config
+from spinn_utilities.overrides import overrides
+
+from spinn_machine.version.version_strings import VersionStrings
+from spinn_machine.virtual_machine import virtual_machine_by_boards
+
+from spinnman.model.enums import ExecutableType
+
+from pacman.model.graphs.machine import SimpleMachineVertex
+from pacman.model.placements import Placement, Placements
+from pacman.model.resources import ConstantSDRAM
+
+from spinn_front_end_common.abstract_models import (
+    AbstractHasAssociatedBinary, AbstractGeneratesDataSpecification,
+    AbstractGeneratesThreadSafeDataSpecification)
+from spinn_front_end_common.data.fec_data_writer import FecDataWriter
+from spinn_front_end_common.interface.config_setup import unittest_setup
+from spinn_front_end_common.interface.ds import DataSpecificationGenerator
+from spinn_front_end_common.interface.interface_functions import (
+    graph_data_specification_writer)
+
+#: The kinds of work that generating a specification can be made of
+KINDS = ("numpy", "python")
+
+
+class BenchmarkVertex(
+        SimpleMachineVertex, AbstractHasAssociatedBinary,
+        AbstractGeneratesDataSpecification,
+        AbstractGeneratesThreadSafeDataSpecification):
+    """
+    A vertex whose specification is a matrix of `size` by `size` words,
+    worked out in numpy or in Python.
+    """
+
+    def __init__(self, kind: str, size: int):
+        """
+        :param kind: What the generation mostly runs in; one of `KINDS`
+        :param size: The number of rows and columns of the matrix
+        """
+        super().__init__(ConstantSDRAM(size * size * 4))
+        self._kind = kind
+        self._size = size
+
+    @overrides(AbstractHasAssociatedBinary.get_binary_file_name)
+    def get_binary_file_name(self) -> str:
+        return "benchmark.aplx"
+
+    @overrides(AbstractHasAssociatedBinary.get_binary_start_type)
+    def get_binary_start_type(self) -> ExecutableType:
+        return ExecutableType.USES_SIMULATION_INTERFACE
+
+    @overrides(AbstractGeneratesDataSpecification.generate_data_specification)
+    def generate_data_specification(self, spec: DataSpecificationGenerator,
+                                    placement: Placement) -> None:
+        size = self._size
+        if self._kind == "numpy":
+            matrix = numpy.random.default_rng(placement.p).random(
+                (size, size))
+            for _ in range(8):
+                matrix = numpy.tanh(matrix @ matrix / size)
+            data = (matrix * 1000).astype("uint32").ravel()
+        else:
+            data = numpy.array(
+                [(i * 2654435761 + placement.p) & 0xFFFF
+                 for i in range(size * size)], dtype="uint32")
+        spec.reserve_memory_region(0, data.nbytes)
+        spec.switch_write_focus(0)
+        spec.write_array(data)
+        spec.end_specification()
+
+
+def benchmark_data_specification_writer(
+        kind: str, n_threads: int, n_cores: int, size: int) -> float:
+    """
+    Time generating the specifications of a board of vertices.
+
+    :param kind: What the generation mostly runs in; one of `KINDS`
+    :param n_threads: The number of threads to generate in
+    :param n_cores: The number of cores to generate for
+    :param size: The number of rows and columns of the matrix of each core
+    :return: The wall clock time taken, in seconds
+    """
+    unittest_setup()
+    set_config("Machine", "versions", VersionStrings.ANY.text)
+    set_config("Reports", "write_text_specs", "False")
+    set_config("Mapping", "n_data_specification_threads", str(n_threads))
+    writer = FecDataWriter.mock()
+    writer.set_machine(virtual_machine_by_boards(1))
+    writer.set_max_run_time_steps(100)
+    chips = [(chip.x, chip.y) for chip in writer.get_machine().chips]
+    writer.set_placements(Placements(
+        Placement(BenchmarkVertex(kind, size), *chips[i % len(chips)],
+                  1 + i // len(chips))
+        for i in range(n_cores)))
+    start = time.perf_counter()
+    path = graph_data_specification_writer()
+    seconds = time.perf_counter() - start
+    os.remove(path)
+    return seconds
+
+
+def run_benchmarks(
+        threads: Sequence[int], n_cores: int, size: int) -> List[
+            Tuple[str, int, float]]:
+    """
+    Time each kind of vertex with each number of threads.
+
+    :param threads: The numbers of threads to generate in
+    :param n_cores: The number of cores to generate for
+    :param size: The number of rows and columns of the matrix of each core
+    :return: The kind, the number of threads and the seconds taken
+    """
+    return [
+        (kind, n_threads, benchmark_data_specification_writer(
+            kind, n_threads, n_cores, size))
+        for kind in KINDS for n_threads in threads]
+
+
+def main(args: Optional[Sequence[str]] = None) -> None:
+    """
+    Run the benchmarks from the command line, printing the results.
+
+    :param args: The command line arguments
+    """
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--threads", type=int, nargs="+", default=[1, 4])
+    parser.add_argument("--cores", type=int, default=128)
+    parser.add_argument("--size", type=int, default=256)
+    options = parser.parse_args(args)
+    print(f"{'kind':>8} {'threads':>8} {'seconds':>8}")
+    for kind, n_threads, seconds in run_benchmarks(
+            options.threads, options.cores, options.size):
+        print(f"{kind:>8} {n_threads:>8} {seconds:>8.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,36 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from contextlib import redirect_stdout
+import io
+import unittest
+
+from fec_integration_tests.interface.interface_functions.dsg_benchmark \
+    import main
+
+
+class TestDsgBenchmark(unittest.TestCase):
+
+    def test_main(self) -> None:
+        output = io.StringIO()
+        with redirect_stdout(output):
+            main(["--threads", "1", "2", "--cores", "4", "--size", "8"])
+        lines = output.getvalue().splitlines()
+        self.assertEqual(5, len(lines))
+        self.assertEqual(["numpy", "1"], lines[1].split()[:2])
+        self.assertEqual(["python", "2"], lines[4].split()[:2])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -14,7 +14,11 @@
 
 from .abstract_generates_data_specification import (
     AbstractGeneratesDataSpecification)
+from .abstract_generates_thread_safe_data_specification import (
+    AbstractGeneratesThreadSafeDataSpecification)
 from .abstract_has_associated_binary import AbstractHasAssociatedBinary
+from .abstract_has_data_specification_fingerprint import (
+    AbstractHasDataSpecificationFingerprint)
 from .abstract_rewrites_data_specification import (
     AbstractRewritesDataSpecification)
 from .abstract_send_me_multicast_commands_vertex import (
@@ -27,7 +31,9 @@ from .has_custom_atom_key_map import HasCustomAtomKeyMap
 from .live_output_device import LiveOutputDevice
 
 __all__ = ("AbstractGeneratesDataSpecification",
+           "AbstractGeneratesThreadSafeDataSpecification",
            "AbstractHasAssociatedBinary",
+           "AbstractHasDataSpecificationFingerprint",
            "AbstractRewritesDataSpecification",
            "AbstractSendMeMulticastCommandsVertex",
            "AbstractSupportsDatabaseInjection",
@@ -0,0 +1,38 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from spinn_utilities.abstract_base import AbstractBase
+from spinn_utilities.require_subclass import require_subclass
+from .abstract_generates_data_specification import (
+    AbstractGeneratesDataSpecification)
+
+
+@require_subclass(AbstractGeneratesDataSpecification)
+class AbstractGeneratesThreadSafeDataSpecification(
+        object, metaclass=AbstractBase):
+    """
+    Marks a vertex whose data specification can be generated in a thread
+    while those of other vertices are being generated, when more than one
+    thread is configured by `n_data_specification_threads`.
+
+    `generate_data_specification` of such a vertex must only change the
+    vertex itself and the specification it is given. It must not read
+    anything that generating another vertex may change, nor change anything
+    shared, such as by calling
+    :py:meth:`~spinn_front_end_common.data.FecDataView.get_next_ds_references`.
+    Generation that spends most of its time in code that releases the
+    GIL, such as large :py:mod:`numpy` operations, gains the most.
+    """
+
+    __slots__ = ()
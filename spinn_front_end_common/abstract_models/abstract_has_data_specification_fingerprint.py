@@ -0,0 +1,53 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from typing import Optional
+from spinn_utilities.abstract_base import AbstractBase, abstractmethod
+from spinn_utilities.require_subclass import require_subclass
+from pacman.model.placements import Placement
+from .abstract_generates_data_specification import (
+    AbstractGeneratesDataSpecification)
+
+
+@require_subclass(AbstractGeneratesDataSpecification)
+class AbstractHasDataSpecificationFingerprint(
+        object, metaclass=AbstractBase):
+    """
+    Indicates a vertex whose data specification is fully determined by a
+    fingerprint, so the specification generated before a reset can be
+    reused if the fingerprint has not changed.
+
+    When reused, `generate_data_specification` is *not* called, so the
+    vertex must not rely on it being called to set up any other state.
+    A specification that reserves a referenceable region or references
+    one is never reused, as reference numbers are not kept over a reset.
+    """
+
+    __slots__ = ()
+
+    @abstractmethod
+    def get_data_specification_fingerprint(
+            self, placement: Placement) -> Optional[bytes]:
+        """
+        Get what identifies everything the data specification is
+        generated from, such as the parameters, the slice and the routing
+        keys.
+
+        A digest from :py:mod:`hashlib` is a good choice.
+
+        :param placement: The placement the vertex is located at
+        :return: The fingerprint,
+            or None if the data specification must be generated
+        """
+        raise NotImplementedError
@@ -79,6 +79,7 @@ class _FecDataModel(object):
         "_database_file_path",
         "_database_socket_addresses",
         "_ds_database_path",
+        "_previous_ds_database_path",
         "_executable_targets",
         "_executable_types",
         "_first_machine_time_step",
@@ -138,6 +139,8 @@ class _FecDataModel(object):
         self._simulation_time_step_s: Optional[float] = None
         self._simulation_time_step_us: Optional[int] = None
         self._time_scale_factor: Optional[Union[int, float]] = None
+        self._ds_database_path: Optional[str] = None
+        self._previous_ds_database_path: Optional[str] = None
         self._hard_reset()
 
     def _hard_reset(self) -> None:
@@ -149,7 +152,10 @@ class _FecDataModel(object):
         self._data_in_multicast_routing_tables: Optional[
             MulticastRoutingTables] = None
         self._database_file_path: Optional[str] = None
-        self._ds_database_path: Optional[str] = None
+        # Kept so unchanged data specifications can be reused
+        if self._ds_database_path is not None:
+            self._previous_ds_database_path = self._ds_database_path
+        self._ds_database_path = None
         self._next_ds_reference = 0
         self._executable_targets: Optional[ExecutableTargets] = None
         self._fixed_routes: Optional[Dict[XY, RoutingEntry]] = None
@@ -763,6 +769,27 @@ class FecDataView(PacmanDataView, SpiNNManDataView):
             raise cls._exception("_ds_database+path")
         return cls.__fec_data._ds_database_path
 
+    @classmethod
+    def has_ds_database_path(cls) -> bool:
+        """
+        Detects if the path for the Data Spec database has been set.
+
+        :returns: True if the path is known, False otherwise.
+        """
+        return cls.__fec_data._ds_database_path is not None
+
+    @classmethod
+    def get_previous_ds_database_path(cls) -> Optional[str]:
+        """
+        Gets the path of the last Data Spec database written, even if that
+        was before a reset.
+
+        :returns: The path, or None if no Data Spec database has been written
+        """
+        if cls.__fec_data._ds_database_path is not None:
+            return cls.__fec_data._ds_database_path
+        return cls.__fec_data._previous_ds_database_path
+
     @classmethod
     def has_monitors(cls) -> bool:
         """
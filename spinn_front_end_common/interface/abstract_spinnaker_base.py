@@ -19,6 +19,7 @@ import logging
 import math
 import os
 import re
+import shutil
 import signal
 import sys
 import threading
@@ -89,6 +90,8 @@ from spinn_front_end_common.data.fec_data_view import FecDataView
 from spinn_front_end_common.interface.buffer_management import BufferManager
 from spinn_front_end_common.interface.buffer_management.storage_objects \
     import BufferDatabase
+from spinn_front_end_common.interface.buffer_management.storage_objects.\
+    buffer_database import sidecar_directory
 from spinn_front_end_common.interface.config_handler import (
     ConfigHandler)
 from spinn_front_end_common.interface.interface_functions import (
@@ -292,6 +295,7 @@ class AbstractSpinnakerBase(ConfigHandler):
                 path = get_report_path("path_data_database")
                 if os.path.exists(path):
                     os.remove(path)
+                shutil.rmtree(sidecar_directory(path), ignore_errors=True)
 
             if not get_config_bool("Reports", "keep_stack_trace"):
                 os.remove(get_timestamp_path("tpath_stack_trace"))
@@ -1823,6 +1827,20 @@ class AbstractSpinnakerBase(ConfigHandler):
         self._execute_graph_provenance()
         self._execute_placements_provenance_gatherer()
         self._execute_profile_data_gatherer()
+        self._execute_materialise_provenance_summaries()
+
+    def _execute_materialise_provenance_summaries(self) -> None:
+        """
+        Runs, times and logs filling the provenance summary tables if
+        requested.
+        """
+        with FecTimer("Materialise provenance summaries",
+                      TimerWork.OTHER) as timer:
+            if timer.skip_if_cfg_false(
+                    "Reports", "materialise_provenance_summaries"):
+                return
+            with ProvenanceWriter() as db:
+                db.materialise_summaries()
 
     def _report_energy(self) -> None:
         """
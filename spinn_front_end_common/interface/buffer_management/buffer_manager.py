@@ -14,35 +14,49 @@
 # limitations under the License.
 
 from __future__ import annotations
+from collections import defaultdict
+from concurrent.futures import Future, ThreadPoolExecutor
 import ctypes
 import difflib
+from itertools import zip_longest
 import logging
+from types import TracebackType
 from typing import (
-    Dict, Iterable, List, Optional, Set, Tuple, cast, TYPE_CHECKING)
-from spinn_utilities.config_holder import get_config_bool
+    Callable, Dict, Iterable, Iterator, List, Literal, Optional, Sequence,
+    Set, Tuple, Type, TypeVar, Union, cast, TYPE_CHECKING)
+from typing_extensions import TypeAlias
+from spinn_utilities.config_holder import (
+    get_config_bool, get_config_int, get_config_str_or_none)
 from spinn_utilities.log import FormatAdapter
 from spinn_utilities.ordered_set import OrderedSet
 from spinn_utilities.progress_bar import ProgressBar
+from spinn_utilities.typing.coords import XY
 from spinnman.messages.eieio.command_messages import EventStopRequest
 from spinnman.messages.eieio import EIEIOType
 from spinnman.messages.eieio.data_messages import EIEIODataMessage
 from pacman.model.graphs.machine import MachineVertex
 from pacman.model.placements import Placement
 from spinn_front_end_common.data import FecDataView
+from spinn_front_end_common.utilities.board_workers import BoardWorkers
 from spinn_front_end_common.utilities.constants import BYTES_PER_WORD
 from spinn_front_end_common.utilities.exceptions import (
     SpinnFrontEndException)
 from spinn_front_end_common.utilities.helpful_functions import (
     locate_memory_region_for_placement, locate_extra_monitor_mc_receiver)
 from spinn_front_end_common.interface.buffer_management.storage_objects \
-    import (BuffersSentDeque, BufferDatabase)
+    import (BuffersSentDeque, BufferDatabase, RecordingCache)
+from spinn_front_end_common.interface.buffer_management.storage_objects.\
+    buffer_database import RegionData, encode_data
 from spinn_front_end_common.interface.buffer_management.buffer_models import (
     AbstractReceiveBuffersToHost, AbstractSendsBuffersFromHost,
     AbstractReceiveRegionsToHost)
 from spinn_front_end_common.utilities.exceptions import (
     BufferedRegionNotPresent)
+from spinn_front_end_common.utility_models.data_out_multiplexer import (
+    DataOutMultiplexer)
 from spinn_front_end_common.utility_models.streaming_context_manager import (
     StreamingContextManager)
+from .read_planner import Data, ReadPlanner
 from .recording_utilities import get_recording_header_size
 if TYPE_CHECKING:
     from spinn_front_end_common.interface.java_caller import JavaCaller
@@ -59,10 +73,19 @@ _N_BYTES_PER_KEY = EIEIOType.KEY_32_BIT.key_bytes
 
 _SDP_MAX_PACKAGE_SIZE = 272
 
+#: Data read, kept as whichever type it was read as
+_Bytes = TypeVar("_Bytes", bytes, bytearray)
+
 TRAFFIC_IDENTIFIER = "BufferTraffic"
 
 VERIFY = False
 
+#: recording and download data read from a single placement
+_PlacementData: TypeAlias = Tuple[List[RegionData], List[RegionData]]
+
+#: How much extracted data to hold before storing it in the database
+_STORE_THRESHOLD_BYTES = 64 * 1024 * 1024
+
 
 class _RecordingRegion(ctypes.LittleEndianStructure):
     """
@@ -80,6 +103,87 @@ class _RecordingRegion(ctypes.LittleEndianStructure):
     ]
 
 
+class _ExtractionStore(object):
+    """
+    Holds the data read during an extraction until there is enough of it
+    to be worth storing in the database in a single transaction.
+
+    If compression is configured the data is encoded on a worker thread
+    while the extraction continues.
+    """
+
+    __slots__ = ("_recordings", "_downloads", "_n_bytes", "_encoder")
+
+    def __init__(self) -> None:
+        self._recordings: List[Future[List[RegionData]]] = list()
+        self._downloads: List[Future[List[RegionData]]] = list()
+        self._n_bytes = 0
+        self._encoder: Optional[ThreadPoolExecutor] = None
+        if get_config_str_or_none("Buffers", "compression_codec"):
+            self._encoder = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="BufferEncoder")
+
+    def __enter__(self) -> _ExtractionStore:
+        return self
+
+    def __exit__(self, exc_type: Optional[Type[BaseException]],
+                 exc_val: Optional[BaseException],
+                 exc_tb: Optional[TracebackType]) -> Literal[False]:
+        try:
+            # Keep whatever was read even if the extraction failed
+            self.flush()
+        finally:
+            if self._encoder is not None:
+                self._encoder.shutdown()
+        return False
+
+    @staticmethod
+    def __encode(items: List[RegionData]) -> List[RegionData]:
+        return [(x, y, p, region, missing,
+                 encode_data(cast(Union[bytes, memoryview], data)))
+                for x, y, p, region, missing, data in items]
+
+    def __submit(self, items: List[RegionData]) -> Future[List[RegionData]]:
+        if self._encoder is None:
+            future: Future[List[RegionData]] = Future()
+            future.set_result(items)
+            return future
+        return self._encoder.submit(self.__encode, items)
+
+    def add(self, recordings: List[RegionData],
+            downloads: List[RegionData]) -> None:
+        """
+        Add the data read from a placement, storing everything held if
+        over the threshold.
+
+        :param recordings: The recording data read
+        :param downloads: The download data read
+        """
+        self._recordings.append(self.__submit(recordings))
+        self._downloads.append(self.__submit(downloads))
+        self._n_bytes += sum(len(item[5]) for item in recordings)
+        self._n_bytes += sum(len(item[5]) for item in downloads)
+        if self._n_bytes >= _STORE_THRESHOLD_BYTES:
+            self.flush()
+
+    def flush(self) -> None:
+        """
+        Store all the data held in a single transaction.
+        """
+        if not self._recordings and not self._downloads:
+            return
+        with BufferDatabase() as db:
+            db.store_recordings(
+                item for future in self._recordings
+                for item in future.result())
+            db.store_downloads(
+                item for future in self._downloads
+                for item in future.result())
+        self._recordings = list()
+        self._downloads = list()
+        self._n_bytes = 0
+
+
 class BufferManager(object):
     """
     Manager of send buffers.
@@ -99,7 +203,13 @@ class BufferManager(object):
 
         # The machine controller, in case it wants to make proxied connections
         # for us
-        "_machine_controller")
+        "_machine_controller",
+
+        # Data already read back from the database, if kept
+        "_recording_cache",
+
+        # The ID of the last extraction, or None if not yet looked up
+        "_last_extraction_id")
 
     def __init__(self) -> None:
         self.__enable_monitors: bool = get_config_bool(
@@ -130,6 +240,11 @@ class BufferManager(object):
         with BufferDatabase() as db:
             db.store_setup_data()
 
+        cache_bytes = get_config_int("Buffers", "recording_cache_bytes")
+        self._recording_cache: Optional[RecordingCache] = (
+            RecordingCache(cache_bytes) if cache_bytes else None)
+        self._last_extraction_id: Optional[int] = None
+
     def _request_data(
             self, placement_x: int, placement_y: int, address: int,
             length: int) -> bytes:
@@ -149,11 +264,7 @@ class BufferManager(object):
                 placement_x, placement_y, address, length)
 
         # Round to word boundaries
-        initial = address % BYTES_PER_WORD
-        address -= initial
-        length += initial
-        final = (BYTES_PER_WORD - (length % BYTES_PER_WORD)) % BYTES_PER_WORD
-        length += final
+        address, length, initial, final = self.__word_align(address, length)
 
         sender = FecDataView.get_monitor_by_xy(placement_x, placement_y)
         receiver = locate_extra_monitor_mc_receiver(placement_x, placement_y)
@@ -166,14 +277,43 @@ class BufferManager(object):
             self._verify_data(extra_mon_data, txrx_data)
 
         # If we rounded to word boundaries, strip the padding junk
+        return self.__strip_padding(extra_mon_data, initial, final)
+
+    @staticmethod
+    def __word_align(address: int, length: int) -> Tuple[int, int, int, int]:
+        """
+        Round a read to word boundaries, as needed by the extra monitors.
+
+        :param address: the memory address to start at
+        :param length: the number of bytes to read
+        :return: the rounded address and length, and the number of bytes
+            of padding added at the start and at the end
+        """
+        initial = address % BYTES_PER_WORD
+        address -= initial
+        length += initial
+        final = (BYTES_PER_WORD - (length % BYTES_PER_WORD)) % BYTES_PER_WORD
+        length += final
+        return address, length, initial, final
+
+    @staticmethod
+    def __strip_padding(data: _Bytes, initial: int, final: int) -> _Bytes:
+        """
+        Remove the padding added by rounding a read to word boundaries.
+
+        :param data: the data read
+        :param initial: the number of bytes of padding at the start
+        :param final: the number of bytes of padding at the end
+        :return: the data that was asked for
+        """
         if initial and final:
-            return extra_mon_data[initial:-final]
+            return data[initial:-final]
         elif initial:
-            return extra_mon_data[initial:]
+            return data[initial:]
         elif final:
-            return extra_mon_data[:-final]
+            return data[:-final]
         else:
-            return extra_mon_data
+            return data
 
     @staticmethod
     def _verify_data(extra_mon_data: bytes, txrx_data: bytes) -> None:
@@ -224,6 +364,9 @@ class BufferManager(object):
         """
         with BufferDatabase() as db:
             db.write_session_credentials_to_db()
+        if self._recording_cache is not None:
+            self._recording_cache.clear()
+        self._last_extraction_id = None
 
         # rewind buffered in
         for vertex in self._sender_vertices:
@@ -245,6 +388,9 @@ class BufferManager(object):
         :param p: placement processor ID
         :param recording_region_id: the recording region ID
         """
+        # Drop any views of the data before the data is removed
+        if self._recording_cache is not None:
+            self._recording_cache.remove_region(x, y, p, recording_region_id)
         with BufferDatabase() as db:
             db.clear_recording_region(x, y, p, recording_region_id)
 
@@ -355,7 +501,9 @@ class BufferManager(object):
         Retrieve the data from placed vertices.
         """
         with BufferDatabase() as db:
-            db.start_new_extraction()
+            self._last_extraction_id = db.start_new_extraction()
+        if self._recording_cache is not None:
+            self._recording_cache.clear()
         if FecDataView.is_last_step():
             recording_placements = list(
                 FecDataView.iterate_placements_by_vertex_type(
@@ -391,7 +539,63 @@ class BufferManager(object):
 
         with StreamingContextManager(receivers):
             # get data
-            self.__python_extract_no_monitors(recording_placements)
+            if get_config_bool("Buffers", "multiplexed_extraction"):
+                self.__python_extract_multiplexed(recording_placements)
+            else:
+                self.__python_extract_no_monitors(recording_placements)
+
+    def __python_extract_multiplexed(
+            self, recording_placements: List[Placement]) -> None:
+        """
+        Retrieve the data through the extra monitors of every board at
+        once, from this thread alone.
+
+        One chip of each board is read at a time; all the transfers of
+        those chips are then done together by a
+        :py:class:`DataOutMultiplexer`.
+
+        :param recording_placements: Where to get the data from.
+        """
+        progress = ProgressBar(
+            len(recording_placements),
+            "Extracting buffers from the last run")
+        by_board: Dict[XY, List[List[Placement]]] = defaultdict(list)
+        for placements in self.__by_chip(recording_placements):
+            chip = placements[0].chip
+            by_board[chip.nearest_ethernet_x, chip.nearest_ethernet_y].append(
+                placements)
+
+        with _ExtractionStore() as store:
+            for chips in zip_longest(*by_board.values()):
+                multiplexer = DataOutMultiplexer()
+                splits = list()
+                for placements in chips:
+                    if placements is None:
+                        continue
+                    x, y = placements[0].x, placements[0].y
+                    sender = FecDataView.get_monitor_by_xy(x, y)
+                    sender_placement = FecDataView.get_placement_of_vertex(
+                        sender)
+                    receiver = locate_extra_monitor_mc_receiver(x, y)
+                    plan, split = self.__plan_chip(placements)
+                    reads = list()
+                    for address, size in plan.transfers:
+                        address, size, initial, final = self.__word_align(
+                            address, size)
+                        reads.append((multiplexer.add(
+                            receiver, sender, sender_placement, address,
+                            size), initial, final))
+                    splits.append((split, reads, len(placements)))
+
+                results = multiplexer.read()
+                for split, reads, n_placements in splits:
+                    transfers = [
+                        self.__strip_padding(results[index], initial, final)
+                        for index, initial, final in reads]
+                    for placement_data in split(transfers):
+                        store.add(*placement_data)
+                    progress.update(n_placements)
+        progress.end()
 
     def __python_extract_no_monitors(
             self, recording_placements: List[Placement]) -> None:
@@ -403,11 +607,65 @@ class BufferManager(object):
             len(recording_placements),
             "Extracting buffers from the last run")
 
-        for placement in progress.over(recording_placements):
-            self._retreive_by_placement(placement)
+        n_threads = get_config_int("Buffers", "n_extraction_threads")
+        with _ExtractionStore() as store:
+            if n_threads > 1:
+                self.__extract_by_board(
+                    recording_placements, n_threads, store, progress)
+            else:
+                for placements in self.__by_chip(recording_placements):
+                    for placement_data in self._read_by_chip(placements):
+                        store.add(*placement_data)
+                    progress.update(len(placements))
+                progress.end()
 
-    def get_data_by_placement(self, placement: Placement,
-                              recording_region_id: int) -> Tuple[bytes, bool]:
+    @staticmethod
+    def __by_chip(placements: Iterable[Placement]) -> Iterable[
+            List[Placement]]:
+        """
+        :param placements: The placements to group
+        :return: The placements on each chip, in the order first seen
+        """
+        by_chip: Dict[XY, List[Placement]] = defaultdict(list)
+        for placement in placements:
+            by_chip[placement.x, placement.y].append(placement)
+        return by_chip.values()
+
+    def __extract_by_board(
+            self, recording_placements: List[Placement], n_threads: int,
+            store: _ExtractionStore, progress: ProgressBar) -> None:
+        """
+        Retrieve the data using a worker per board.
+
+        The data read is stored by this thread alone.
+
+        :param recording_placements: Where to get the data from.
+        :param n_threads: The maximum number of boards to read at once
+        :param store: Where to put the data read
+        :param progress: Updated as each placement is stored
+        """
+        by_board: Dict[XY, List[Placement]] = defaultdict(list)
+        for placement in recording_placements:
+            chip = placement.chip
+            by_board[chip.nearest_ethernet_x, chip.nearest_ethernet_y].append(
+                placement)
+
+        def read_board(placements: List[Placement]) -> Iterator[
+                List[_PlacementData]]:
+            for chip_placements in self.__by_chip(placements):
+                yield self._read_by_chip(chip_placements)
+
+        with BoardWorkers(list(by_board.values()), read_board, n_threads,
+                          "BufferExtractor") as workers:
+            for result in workers:
+                for placement_data in result:
+                    store.add(*placement_data)
+                progress.update(len(result))
+        progress.end()
+
+    def get_data_by_placement(
+            self, placement: Placement,
+            recording_region_id: int) -> Tuple[memoryview, bool]:
         """
         Deprecated use get_recording or get_download
 
@@ -431,8 +689,9 @@ class BufferManager(object):
             raise NotImplementedError(
                 f"Unable to get data for vertex {placement.vertex}")
 
-    def get_recording(self, placement: Placement,
-                      recording_region_id: int) -> Tuple[bytes, bool]:
+    def get_recording(
+            self, placement: Placement,
+            recording_region_id: int) -> Tuple[memoryview, bool]:
         """
         Get the data container for the data retrieved
         during the simulation from a specific region area of a core.
@@ -449,15 +708,54 @@ class BufferManager(object):
             If the placement's vertex is not a type that records data
         """
         try:
+            if self._recording_cache is None:
+                with BufferDatabase() as db:
+                    return db.get_recording(
+                        placement.x, placement.y, placement.p,
+                        recording_region_id)
+            key = (False, placement.x, placement.y, placement.p,
+                   recording_region_id, self.__get_last_extraction_id())
+            cached = self._recording_cache.get(key)
+            if cached is not None:
+                return cached
             with BufferDatabase() as db:
-                return db.get_recording(placement.x, placement.y, placement.p,
-                                        recording_region_id)
+                return self._recording_cache.add(key, *db.get_recording(
+                    placement.x, placement.y, placement.p,
+                    recording_region_id))
         except LookupError as lookup_error:
             return self._raise_error(
                 placement, recording_region_id, lookup_error)
 
-    def get_download(self, placement: Placement,
-                     recording_region_id: int) -> Tuple[bytes, bool]:
+    def iter_recording_chunks(
+            self, placement: Placement,
+            recording_region_id: int) -> Iterator[Tuple[memoryview, bool]]:
+        """
+        Iterate over the data retrieved during the simulation from a
+        specific region area of a core, one extraction at a time.
+
+        This allows the data to be processed without holding all of it
+        in memory at once.
+
+        :param placement: The placement to get the data from
+        :param recording_region_id: desired recording data region
+        :return: the data of each extraction, and a flag indicating if any
+            data was missing from that extraction
+        :raises BufferedRegionNotPresent:
+            If no data is available nor marked missing.
+        :raises NotImplementedError:
+            If the placement's vertex is not a type that records data
+        """
+        try:
+            with BufferDatabase() as db:
+                yield from db.iter_recording_chunks(
+                    placement.x, placement.y, placement.p,
+                    recording_region_id)
+        except LookupError as lookup_error:
+            self._raise_error(placement, recording_region_id, lookup_error)
+
+    def get_download(
+            self, placement: Placement,
+            recording_region_id: int) -> Tuple[memoryview, bool]:
         """
         Get the data container for the data retrieved
         during the simulation from a specific region area of a core.
@@ -474,16 +772,45 @@ class BufferManager(object):
             If the placement's vertex is not a type that records data
         """
         try:
+            if self._recording_cache is None:
+                with BufferDatabase() as db:
+                    return db.get_download_by_extraction_id(
+                        placement.x, placement.y, placement.p,
+                        recording_region_id, -1)
+            key = (True, placement.x, placement.y, placement.p,
+                   recording_region_id, self.__get_last_extraction_id())
+            cached = self._recording_cache.get(key)
+            if cached is not None:
+                return cached
             with BufferDatabase() as db:
-                return db.get_download_by_extraction_id(
-                    placement.x, placement.y, placement.p,
-                    recording_region_id, -1)
+                return self._recording_cache.add(
+                    key, *db.get_download_by_extraction_id(
+                        placement.x, placement.y, placement.p,
+                        recording_region_id, -1))
         except LookupError as lookup_error:
             return self._raise_error(
                 placement, recording_region_id, lookup_error)
 
+    def __get_last_extraction_id(self) -> int:
+        """
+        :returns: The ID of the last extraction, looked up only if not
+            known since it was started by :py:meth:`extract_data`
+        """
+        if self._last_extraction_id is None:
+            with BufferDatabase() as db:
+                self._last_extraction_id = db.get_last_extraction_id()
+        return self._last_extraction_id
+
+    @property
+    def recording_cache(self) -> Optional[RecordingCache]:
+        """
+        The data kept after being read from the database,
+        or `None` if data is not kept.
+        """
+        return self._recording_cache
+
     def _raise_error(self, placement: Placement, recording_region_id: int,
-                     lookup_error: LookupError) -> Tuple[bytes, bool]:
+                     lookup_error: LookupError) -> Tuple[memoryview, bool]:
         """
         Raises the correct exception-
         """
@@ -523,46 +850,132 @@ class BufferManager(object):
 
         :param placement: the placement to get the data from
         """
-        if isinstance(placement.vertex, AbstractReceiveBuffersToHost):
-            vertex = cast(AbstractReceiveBuffersToHost, placement.vertex)
-            addr = vertex.get_recording_region_base_address(placement)
-            sizes_and_addresses = self._get_region_information(
-                    addr, placement.x, placement.y)
-
-            # Read the data if not already received
-            for region in vertex.get_recorded_region_ids():
-                # Now read the data and store it
-                size, addr, missing = sizes_and_addresses[region]
-                data = self._request_data(
-                    placement.x, placement.y, addr, size)
-                with BufferDatabase() as db:
-                    db.store_recording(placement.x, placement.y, placement.p,
-                                       region, missing, data)
-        if isinstance(placement.vertex, AbstractReceiveRegionsToHost):
-            dl_vtx = cast(AbstractReceiveRegionsToHost, placement.vertex)
-            for region, addr, size in dl_vtx.get_download_regions(placement):
-                data = self._request_data(placement.x, placement.y, addr, size)
-                with BufferDatabase() as db:
-                    db.store_download(placement.x, placement.y, placement.p,
-                                      region, False, data)
+        self._store_by_placement(*self._read_by_placement(placement))
+
+    def _read_by_placement(self, placement: Placement) -> _PlacementData:
+        """
+        Read the recording and download data of a vertex from the machine.
+
+        :param placement: the placement to get the data from
+        :return: The recording data and the download data read
+        """
+        return self._read_by_chip([placement])[0]
+
+    def _read_by_chip(
+            self, placements: List[Placement]) -> List[_PlacementData]:
+        """
+        Read the recording and download data of vertices on one chip
+        from the machine.
 
+        The recording headers of all the vertices are read first, and
+        then the data of all the regions.  Each set of reads is merged
+        where the memory is adjacent, so that there are as few transfers
+        as possible.
+
+        :param placements: the placements to get the data from,
+            all on the same chip
+        :return: The recording data and the download data read for each
+            placement, in the same order as the placements
+        """
+        x, y = placements[0].x, placements[0].y
+        plan, split = self.__plan_chip(placements)
+        return split([
+            self._request_data(x, y, address, size)
+            for address, size in plan.transfers])
+
+    @staticmethod
+    def __plan_chip(placements: List[Placement]) -> Tuple[
+            ReadPlanner, Callable[[Sequence[Data]], List[_PlacementData]]]:
+        """
+        Read the recording headers of vertices on one chip, and plan the
+        reads of their recording and download regions.
+
+        :param placements: the placements to get the data from,
+            all on the same chip
+        :return: The plan of the region reads, and a function to turn
+            the data of the transfers of the plan into the recording data
+            and the download data of each placement
+        """
+        x, y = placements[0].x, placements[0].y
+        max_gap = get_config_int("Buffers", "read_coalesce_gap")
+
+        # Read the recording headers of all the cores
+        headers = ReadPlanner(max_gap)
+        header_reads: Dict[int, int] = dict()
+        for i, placement in enumerate(placements):
+            if isinstance(placement.vertex, AbstractReceiveBuffersToHost):
+                vertex = cast(AbstractReceiveBuffersToHost, placement.vertex)
+                region_ids = vertex.get_recorded_region_ids()
+                if region_ids:
+                    header_reads[i] = headers.add(
+                        vertex.get_recording_region_base_address(placement),
+                        get_recording_header_size(max(region_ids) + 1))
+        transceiver = FecDataView.get_transceiver()
+        header_data = headers.read(
+            lambda address, size: transceiver.read_memory(
+                x, y, address, size))
+
+        # Plan the reads of the regions of all the cores
+        plan = ReadPlanner(max_gap)
+        recording_reads: List[List[Tuple[int, bool, int]]] = list()
+        download_reads: List[List[Tuple[int, int]]] = list()
+        for i, placement in enumerate(placements):
+            recording_reads.append(list())
+            download_reads.append(list())
+            if i in header_reads:
+                vertex = cast(AbstractReceiveBuffersToHost, placement.vertex)
+                sizes_and_addresses = BufferManager._get_region_information(
+                    header_data[header_reads[i]])
+                for region in vertex.get_recorded_region_ids():
+                    size, addr, missing = sizes_and_addresses[region]
+                    recording_reads[-1].append(
+                        (region, missing, plan.add(addr, size)))
+            if isinstance(placement.vertex, AbstractReceiveRegionsToHost):
+                dl_vtx = cast(AbstractReceiveRegionsToHost, placement.vertex)
+                for region, addr, size in dl_vtx.get_download_regions(
+                        placement):
+                    download_reads[-1].append((region, plan.add(addr, size)))
+
+        def split(transfers: Sequence[Data]) -> List[_PlacementData]:
+            data = plan.split(transfers)
+            return [
+                ([(x, y, placement.p, region, missing, data[index])
+                  for region, missing, index in recordings],
+                 [(x, y, placement.p, region, False, data[index])
+                  for region, index in downloads])
+                for placement, recordings, downloads in zip(
+                    placements, recording_reads, download_reads)]
+        return plan, split
+
+    @staticmethod
+    def _store_by_placement(
+            recordings: List[RegionData],
+            downloads: List[RegionData]) -> None:
+        """
+        Store the data read from a vertex.
+
+        :param recordings: The recording data read
+        :param downloads: The download data read
+        """
+        with BufferDatabase() as db:
+            db.store_recordings(recordings)
+            db.store_downloads(downloads)
+
+    @staticmethod
     def _get_region_information(
-            self, address: int, x: int, y: int) -> List[Tuple[int, int, bool]]:
+            header: memoryview) -> List[Tuple[int, int, bool]]:
         """
         Get the recording information from all regions of a core.
 
-        :param address: The recording region base address
-        :param x: The X coordinate of the chip containing the data
-        :param y: The Y coordinate of the chip containing the data
+        :param header: The recording header of the core, which may be
+            shorter than the header written if not all regions are wanted
         :return: (size, address, missing flag) for each region
         """
-        transceiver = FecDataView.get_transceiver()
-        n_regions = transceiver.read_word(x, y, address)
-        n_bytes = get_recording_header_size(n_regions)
-        data = transceiver.read_memory(
-            x, y, address + BYTES_PER_WORD, n_bytes - BYTES_PER_WORD)
+        n_regions = min(
+            int.from_bytes(header[:BYTES_PER_WORD], "little"),
+            (len(header) - BYTES_PER_WORD) // ctypes.sizeof(_RecordingRegion))
         data_type = _RecordingRegion * n_regions
-        regions = data_type.from_buffer_copy(data)
+        regions = data_type.from_buffer_copy(header, BYTES_PER_WORD)
         sizes_and_addresses = [
             (r.size, r.data, bool(r.missing)) for r in regions]
         return sizes_and_addresses
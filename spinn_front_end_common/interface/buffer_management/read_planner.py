@@ -0,0 +1,105 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from bisect import bisect_right
+from typing import Callable, List, Sequence, Tuple, Union
+from typing_extensions import TypeAlias
+
+#: Data read from memory
+Data: TypeAlias = Union[bytes, bytearray, memoryview]
+#: Reads the given number of bytes from the given address
+Reader: TypeAlias = Callable[[int, int], Data]
+
+
+class ReadPlanner(object):
+    """
+    Collects the memory reads wanted from a single chip, so that adjacent
+    or overlapping reads can be done as a single transfer.
+
+    Each read added is given back as a view on the data of the transfer
+    that covered it.
+    """
+
+    __slots__ = (
+        # The (address, size) of each read added
+        "_reads",
+        # The largest gap between reads that are still merged
+        "_max_gap")
+
+    def __init__(self, max_gap: int = 0):
+        """
+        :param max_gap:
+            The largest number of unwanted bytes between two reads for them
+            to still be done as a single transfer
+        """
+        self._reads: List[Tuple[int, int]] = list()
+        self._max_gap = max_gap
+
+    def add(self, address: int, size: int) -> int:
+        """
+        Add a read to the plan.
+
+        :param address: The address to read from
+        :param size: The number of bytes to read
+        :return: The index of the read in the results of :py:meth:`read`
+        """
+        self._reads.append((address, size))
+        return len(self._reads) - 1
+
+    @property
+    def transfers(self) -> List[Tuple[int, int]]:
+        """
+        The (address, size) of each transfer needed to do all the reads,
+        in address order.
+        """
+        transfers: List[Tuple[int, int]] = list()
+        start = end = 0
+        for address, size in sorted(
+                read for read in self._reads if read[1] > 0):
+            if transfers and address <= end + self._max_gap:
+                end = max(end, address + size)
+                transfers[-1] = (start, end - start)
+            else:
+                start, end = address, address + size
+                transfers.append((start, size))
+        return transfers
+
+    def read(self, reader: Reader) -> List[memoryview]:
+        """
+        Do the transfers and split the data back into the reads added.
+
+        :param reader: Called to do each transfer
+        :return: The data of each read, in the order they were added
+        """
+        return self.split([
+            reader(start, size) for start, size in self.transfers])
+
+    def split(self, data: Sequence[Data]) -> List[memoryview]:
+        """
+        Split the data of transfers done elsewhere back into the reads
+        added.
+
+        :param data: The data of each of :py:attr:`transfers`, in order
+        :return: The data of each read, in the order they were added
+        """
+        starts = [start for start, _ in self.transfers]
+        views = list()
+        for address, size in self._reads:
+            if size == 0:
+                views.append(memoryview(b""))
+                continue
+            index = bisect_right(starts, address) - 1
+            offset = address - starts[index]
+            views.append(memoryview(data[index])[offset:offset + size])
+        return views
@@ -15,5 +15,7 @@
 from .buffered_sending_region import BufferedSendingRegion
 from .buffers_sent_deque import BuffersSentDeque
 from .buffer_database import BufferDatabase
+from .recording_cache import RecordingCache
 
-__all__ = ("BufferedSendingRegion", "BuffersSentDeque", "BufferDatabase")
+__all__ = ("BufferedSendingRegion", "BuffersSentDeque", "BufferDatabase",
+           "RecordingCache")
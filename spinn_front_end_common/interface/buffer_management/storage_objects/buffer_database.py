@@ -12,21 +12,115 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from sqlite3 import Binary, IntegrityError
+from enum import IntEnum
+import logging
+import lzma
+import mmap
+import os
+from sqlite3 import Binary, IntegrityError, Row
 import time
-from typing import Optional, Tuple
-from spinn_utilities.config_holder import get_config_bool
+from typing import Dict, Iterable, Iterator, Optional, Set, Tuple, Union
+import zlib
+from typing_extensions import TypeAlias
+from spinn_utilities.config_holder import (
+    get_config_bool, get_config_int, get_config_int_or_none,
+    get_config_str_or_none)
+from spinn_utilities.log import FormatAdapter
 from spinn_front_end_common.data import FecDataView
 from spinn_front_end_common.utilities.base_database import BaseDatabase
+from spinn_front_end_common.utilities.exceptions import (
+    ConfigurationException)
 
+logger = FormatAdapter(logging.getLogger(__name__))
 _SECONDS_TO_MICRO_SECONDS_CONVERSION = 1000
 PROVENANCE_CORE_KEY = "Power_Monitor_Core"
 
+#: codec, encoded content and decoded length of data ready to be stored
+EncodedData: TypeAlias = Tuple[int, Union[bytes, memoryview], int]
+#: x, y, p, region, missing flag and data to store for a single region
+RegionData: TypeAlias = Tuple[
+    int, int, int, int, bool, Union[bytes, memoryview, EncodedData]]
+_RecordingRow: TypeAlias = Tuple[
+    int, int, Binary, int, bool, int, Optional[int]]
+
 
 def _timestamp() -> int:
     return int(time.time() * _SECONDS_TO_MICRO_SECONDS_CONVERSION)
 
 
+class _Codec(IntEnum):
+    """
+    How the content of a recording or download is encoded in the database.
+    """
+    RAW = 0
+    ZLIB = 1
+    LZMA = 2
+
+
+def encode_data(data: Union[bytes, memoryview]) -> EncodedData:
+    """
+    Encode data to be stored as a recording or download using the
+    compression set in the configuration.
+
+    As this does not touch the database it may be called on any thread.
+
+    :param data: The data to encode
+    :return: The codec used, the encoded data and the length of the data
+    :raises ConfigurationException: If the compression codec is unknown
+    """
+    codec = get_config_str_or_none("Buffers", "compression_codec")
+    if codec is None or len(data) == 0 or _use_sidecar(len(data)):
+        return _Codec.RAW, data, len(data)
+    level = get_config_int("Buffers", "compression_level")
+    if codec.lower() == "zlib":
+        return _Codec.ZLIB, zlib.compress(data, level), len(data)
+    if codec.lower() == "lzma":
+        return _Codec.LZMA, lzma.compress(data, preset=level), len(data)
+    raise ConfigurationException(
+        f"Unexpected cfg setting compression_codec: {codec}")
+
+
+def _use_sidecar(length: int) -> bool:
+    """
+    :param length: The length of a recording
+    :returns: Whether the recording is big enough to go in a sidecar file
+    """
+    threshold = get_config_int_or_none("Buffers", "sidecar_threshold")
+    return threshold is not None and length >= threshold
+
+
+def sidecar_directory(database_file: str) -> str:
+    """
+    :param database_file: The path of a buffer database
+    :returns: The directory holding the sidecar files of the database
+    """
+    return os.path.splitext(database_file)[0] + "_recordings"
+
+
+def _decode_data(codec: int, content: Union[bytes, memoryview],
+                 length: int) -> memoryview:
+    """
+    Decode data as stored by :py:func:`encode_data`.
+
+    :param codec: How the data was encoded
+    :param content: The encoded data
+    :param length: The length of the decoded data
+    :return: The decoded data
+    """
+    if codec == _Codec.RAW:
+        return memoryview(content)
+    if codec == _Codec.ZLIB:
+        data = zlib.decompress(content, bufsize=max(length, 1))
+    elif codec == _Codec.LZMA:
+        data = lzma.decompress(content)
+    else:
+        raise ValueError(f"Unknown codec {codec}")
+    if len(data) != length:
+        raise ValueError(
+            f"Decoded {len(data)} bytes when expecting {length}")
+    return memoryview(data)
+
+
 class BufferDatabase(BaseDatabase):
     """
     Specific implementation of the Database for SQLite 3.
@@ -83,11 +177,40 @@ class BufferDatabase(BaseDatabase):
         self.cursor().execute(
             """
             UPDATE recording_data SET
-            content = CAST('' AS BLOB), content_len = 0, missing_data = 2
+            content = CAST('' AS BLOB), content_len = 0, missing_data = 2,
+            codec = 0, sidecar_offset = NULL
             WHERE recording_region_id = ?
             """, (region_id,))
+        # Later data goes in a new sidecar file, so any views of the old one
+        # stay valid, which they would not if it was truncated
+        self.cursor().execute(
+            """
+            UPDATE recording_region
+            SET sidecar_generation = sidecar_generation + 1
+            WHERE recording_region_id = ?
+            """, (region_id,))
+        self.__remove_old_sidecars(region_id)
         return True
 
+    def __remove_old_sidecars(self, region_id: int) -> None:
+        """
+        Remove the sidecar files of earlier generations of a region.
+
+        A file that is still mapped can not be removed on some operating
+        systems; it is left to be removed by a later clear, or with the
+        rest of the sidecar directory.
+
+        :param region_id: The recording region
+        """
+        for generation in range(self.__sidecar_generation(region_id)):
+            path = self.__sidecar_file(region_id, generation)
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            except PermissionError:
+                logger.debug("Sidecar file {} is in use; not removed", path)
+
     def _read_recording(self, region_id: int) -> memoryview:
         """
         Read a recording region
@@ -129,12 +252,13 @@ class BufferDatabase(BaseDatabase):
         """
         for row in self.cursor().execute(
                 """
-                SELECT content, missing_data
+                SELECT recording_region_id, content, content_len, codec,
+                    sidecar_offset, missing_data
                 FROM recording_data
                 WHERE recording_region_id = ?
                 LIMIT 1
                 """, (region_id,)):
-            return memoryview(row["content"]), row['missing_data'] != 0
+            return self._recording_content(row), row['missing_data'] != 0
 
         if get_config_bool("Machine", "virtual_board"):
             return memoryview(bytearray()), True
@@ -153,12 +277,13 @@ class BufferDatabase(BaseDatabase):
 
         for row in self.cursor().execute(
                 """
-                SELECT content, missing_data
+                SELECT recording_region_id, content, content_len, codec,
+                    sidecar_offset, missing_data
                 FROM recording_data
                 WHERE recording_region_id = ? AND extraction_id = ?
                 LIMIT 1
                 """, (region_id, extraction_id)):
-            return memoryview(row["content"]), row['missing_data'] != 0
+            return self._recording_content(row), row['missing_data'] != 0
 
         raise LookupError(
             f"no record for {region_id=} and {extraction_id=}")
@@ -175,12 +300,12 @@ class BufferDatabase(BaseDatabase):
 
         for row in self.cursor().execute(
                 """
-                SELECT content, missing_data
+                SELECT content, content_len, codec, missing_data
                 FROM download_data
                 WHERE download_region_id = ? AND extraction_id = ?
                 LIMIT 1
                 """, (region_id, extraction_id)):
-            return memoryview(row["content"]), row['missing_data'] != 0
+            return self._decode_row(row), row['missing_data'] != 0
 
         raise LookupError(
             f"no record for {region_id=} and {extraction_id=}")
@@ -191,23 +316,185 @@ class BufferDatabase(BaseDatabase):
         """
         Reads the contents of all blocks for this regions.
 
+        If all the blocks are in the sidecar file they are returned as a
+        single view of the mapped file rather than copied.
+
         :param region_id:
         :param total_content_length: total size of content for this region
         """
-        c_buffer = bytearray(total_content_length)
+        # The sidecar is only ever appended to so check it is contiguous
+        # without reading any of the content
         missing_data = False
+        start: Optional[int] = None
+        idx: Optional[int] = None
+        contiguous = True
+        for row in self.cursor().execute(
+                """
+                SELECT content_len, sidecar_offset, missing_data
+                FROM recording_data
+                WHERE recording_region_id = ? ORDER BY extraction_id ASC
+                """, (region_id, )):
+            missing_data = missing_data or row["missing_data"] != 0
+            if start is None and contiguous:
+                start = idx = row["sidecar_offset"]
+            if idx is None or row["sidecar_offset"] != idx:
+                contiguous = False
+            else:
+                idx += row["content_len"]
+        if contiguous and start is not None:
+            return self._read_sidecar(
+                region_id, start, total_content_length), missing_data
+
+        c_buffer = bytearray(total_content_length)
         idx = 0
         for row in self.cursor().execute(
                 """
-                SELECT content, missing_data FROM recording_data
+                SELECT recording_region_id, content, content_len, codec,
+                    sidecar_offset
+                FROM recording_data
                 WHERE recording_region_id = ? ORDER BY extraction_id ASC
                 """, (region_id, )):
-            item = row["content"]
+            item = self._recording_content(row)
             c_buffer[idx:idx + len(item)] = item
             idx += len(item)
-            missing_data = missing_data or row["missing_data"] != 0
         return memoryview(c_buffer), missing_data
 
+    def _recording_content(self, row: Row) -> memoryview:
+        """
+        Get the content of a recording row, wherever it is stored.
+
+        :param row: A recording_data row with recording_region_id, content,
+            content_len, codec and sidecar_offset columns
+        """
+        if row["sidecar_offset"] is not None:
+            return self._read_sidecar(
+                row["recording_region_id"], row["sidecar_offset"],
+                row["content_len"])
+        return self._decode_row(row)
+
+    @staticmethod
+    def _decode_row(row: Row) -> memoryview:
+        """
+        Decode the content of a recording or download row.
+
+        :param row: A row with content, content_len and codec columns
+        """
+        return _decode_data(row["codec"], row["content"], row["content_len"])
+
+    def _sidecar_path(self, region_id: int) -> str:
+        """
+        :param region_id: The recording region
+        :returns: The path of the current sidecar file for the region
+        """
+        return self.__sidecar_file(
+            region_id, self.__sidecar_generation(region_id))
+
+    def __sidecar_generation(self, region_id: int) -> int:
+        """
+        :param region_id: The recording region
+        :returns: How many times the region has been cleared
+        """
+        for row in self.cursor().execute(
+                """
+                SELECT sidecar_generation FROM recording_region
+                WHERE recording_region_id = ?
+                LIMIT 1
+                """, (region_id,)):
+            return int(row["sidecar_generation"])
+        raise LookupError(f"No recording region {region_id}")
+
+    def __sidecar_file(self, region_id: int, generation: int) -> str:
+        """
+        :param region_id: The recording region
+        :param generation: How many times the region had been cleared
+        :returns: The path of the sidecar file for that generation
+        """
+        return os.path.join(
+            sidecar_directory(self._database_file),
+            f"region_{region_id}_{generation}.dat")
+
+    def _append_to_sidecar(
+            self, region_id: int, data: Union[bytes, memoryview]) -> int:
+        """
+        Add data to the end of the sidecar file of a region.
+
+        :param region_id: The recording region
+        :param data: The data to add
+        :returns: The offset in the file where the data starts
+        """
+        path = self._sidecar_path(region_id)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "ab") as f:
+            offset = f.tell()
+            f.write(data)
+        return offset
+
+    def _read_sidecar(
+            self, region_id: int, offset: int, length: int) -> memoryview:
+        """
+        Map part of the sidecar file of a region into memory.
+
+        :param region_id: The recording region
+        :param offset: Where in the file the data starts
+        :param length: The length of the data
+        :returns: A read only view of the data in the mapped file
+        """
+        if length == 0:
+            return memoryview(b"")
+        # Only the pages holding the data are mapped; the mapping must start
+        # on an allocation boundary
+        start = offset - offset % mmap.ALLOCATIONGRANULARITY
+        with open(self._sidecar_path(region_id), "rb") as f:
+            mapped = mmap.mmap(
+                f.fileno(), offset + length - start, offset=start,
+                access=mmap.ACCESS_READ)
+        return memoryview(mapped)[offset - start:]
+
+    def _get_sidecar_region_ids(self) -> Set[int]:
+        """
+        :returns: The IDs of the recording regions with a sidecar file
+        """
+        return {
+            row["recording_region_id"]
+            for row in self.cursor().execute(
+                """
+                SELECT DISTINCT recording_region_id FROM recording_data
+                WHERE sidecar_offset IS NOT NULL
+                """)}
+
+    def _recording_row(
+            self, region_id: int, extraction_id: int, missing: bool,
+            data: Union[bytes, memoryview, EncodedData],
+            sidecar_region_ids: Set[int]) -> _RecordingRow:
+        """
+        Prepare the values of a recording_data row, moving the data to the
+        sidecar file of the region if needed.
+
+        Once a region has any data in its sidecar file all further data is
+        added to it uncompressed, keeping the file contiguous.
+
+        :param region_id: The recording region
+        :param extraction_id: The extraction
+        :param missing: Whether any data is missing
+        :param data: The data, possibly already encoded
+        :param sidecar_region_ids:
+            The regions with a sidecar file; updated if one is started
+        """
+        codec, content, length = (
+            data if isinstance(data, tuple) else encode_data(data))
+        if region_id in sidecar_region_ids and codec != _Codec.RAW:
+            # Only small data is compressed so this is cheap
+            content = bytes(_decode_data(codec, content, length))
+            codec = _Codec.RAW
+        offset = None
+        if codec == _Codec.RAW and length > 0 and (
+                region_id in sidecar_region_ids or _use_sidecar(length)):
+            offset = self._append_to_sidecar(region_id, content)
+            content = b""
+            sidecar_region_ids.add(region_id)
+        return (region_id, extraction_id, Binary(content), length, missing,
+                codec, offset)
+
     def _find_existing_recording_region_id(
             self, x: int, y: int, p: int, region: int) -> Optional[int]:
         for row in self.cursor().execute(
@@ -351,19 +638,19 @@ class BufferDatabase(BaseDatabase):
         :param data: data to be stored
 
         .. note::
-                    Must be shorter than 1GB
+                    Must be shorter than 1GB unless it goes in a sidecar file
         """
-        datablob = Binary(data)
         region_id = self._get_recording_region_id(x, y, p, region)
         extraction_id = self.get_last_extraction_id()
         self.cursor().execute(
             """
             INSERT INTO recording_data(
                 recording_region_id, extraction_id, content, content_len,
-                missing_data)
-            VALUES (?, ?, CAST(? AS BLOB), ?, ?)
-            """,
-            (region_id, extraction_id, datablob, len(data), missing))
+                missing_data, codec, sidecar_offset)
+            VALUES (?, ?, CAST(? AS BLOB), ?, ?, ?, ?)
+            """, self._recording_row(
+                region_id, extraction_id, missing, data,
+                self._get_sidecar_region_ids()))
         assert self.rowcount == 1
 
     def store_download(
@@ -383,19 +670,112 @@ class BufferDatabase(BaseDatabase):
             .. note::
                     Must be shorter than 1GB
         """
-        datablob = Binary(data)
+        codec, content, length = encode_data(data)
         download_region_id = self._get_download_region_id(x, y, p, region)
         extraction_id = self.get_last_extraction_id()
         self.cursor().execute(
             """
             INSERT INTO download_data(
                 download_region_id, extraction_id, content, content_len,
-                missing_data)
-            VALUES (?, ?, CAST(? AS BLOB), ?, ?)
-            """, (download_region_id, extraction_id, datablob, len(data),
-                  missing))
+                missing_data, codec)
+            VALUES (?, ?, CAST(? AS BLOB), ?, ?, ?)
+            """, (download_region_id, extraction_id, Binary(content), length,
+                  missing, codec))
         assert self.rowcount == 1
 
+    def _get_region_ids(
+            self, view: str, id_column: str) -> Dict[
+                Tuple[int, int, int, int], int]:
+        """
+        Get the IDs of all the known regions of one type.
+
+        :param view: The view mapping cores and regions to IDs
+        :param id_column: The name of the ID column in the view
+        :return: Map of (x, y, p, region) to the ID of the region
+        """
+        return {
+            (row["x"], row["y"], row["processor"],
+             row["local_region_index"]): row[id_column]
+            for row in self.cursor().execute(
+                f"""
+                SELECT x, y, processor, local_region_index, {id_column}
+                FROM {view}
+                """)}
+
+    def store_recordings(self, recordings: Iterable[RegionData]) -> None:
+        """
+        Store the data of many recording regions, all as part of the
+        current extraction.
+
+        Equivalent to calling :py:meth:`store_recording` for each item,
+        but with the region lookups done in bulk.
+
+        :param recordings:
+            (x, y, p, region, missing, data) for each region to store.
+            The data may already have been encoded by
+            :py:func:`encode_data`.
+
+        .. note::
+                    Each data must be shorter than 1GB
+        """
+        region_ids = self._get_region_ids(
+            "recording_region_view", "recording_region_id")
+        sidecar_region_ids = self._get_sidecar_region_ids()
+        extraction_id = self.get_last_extraction_id()
+        rows = list()
+        for x, y, p, region, missing, data in recordings:
+            region_id = region_ids.get((x, y, p, region))
+            if region_id is None:
+                region_id = self._get_recording_region_id(x, y, p, region)
+                region_ids[x, y, p, region] = region_id
+            rows.append(self._recording_row(
+                region_id, extraction_id, missing, data, sidecar_region_ids))
+        self.cursor().executemany(
+            """
+            INSERT INTO recording_data(
+                recording_region_id, extraction_id, content, content_len,
+                missing_data, codec, sidecar_offset)
+            VALUES (?, ?, CAST(? AS BLOB), ?, ?, ?, ?)
+            """, rows)
+
+    def store_downloads(self, downloads: Iterable[RegionData]) -> None:
+        """
+        Store the data of many download regions, all as part of the
+        current extraction.
+
+        Equivalent to calling :py:meth:`store_download` for each item,
+        but with the region lookups done in bulk.
+
+        :param downloads:
+            (x, y, p, region, missing, data) for each region to store.
+            The data may already have been encoded by
+            :py:func:`encode_data`.
+
+        .. note::
+                    Each data must be shorter than 1GB
+        """
+        region_ids = self._get_region_ids(
+            "download_region_view", "download_region_id")
+        extraction_id = self.get_last_extraction_id()
+        rows = list()
+        for x, y, p, region, missing, data in downloads:
+            region_id = region_ids.get((x, y, p, region))
+            if region_id is None:
+                region_id = self._get_download_region_id(x, y, p, region)
+                region_ids[x, y, p, region] = region_id
+            codec, content, length = (
+                data if isinstance(data, tuple) else encode_data(data))
+            rows.append((
+                region_id, extraction_id, Binary(content), length, missing,
+                codec))
+        self.cursor().executemany(
+            """
+            INSERT INTO download_data(
+                download_region_id, extraction_id, content, content_len,
+                missing_data, codec)
+            VALUES (?, ?, CAST(? AS BLOB), ?, ?, ?)
+            """, rows)
+
     def get_recording(self, x: int, y: int, p: int, region: int) -> Tuple[
             memoryview, bool]:
         """
@@ -423,6 +803,47 @@ class BufferDatabase(BaseDatabase):
             x, y, p, region)
         return self._read_recording_with_missing(region_id)
 
+    def iter_recording_chunks(
+            self, x: int, y: int, p: int, region: int) -> Iterator[
+                Tuple[memoryview, bool]]:
+        """
+        Iterate over the data stored for a given region of a given core,
+        one extraction at a time.
+
+        Unlike :py:meth:`get_recording` the data of the extractions is
+        never combined, so only one extraction is held in memory at once.
+
+        :param x: x coordinate of the chip
+        :param y: y coordinate of the chip
+        :param p: Core within the specified chip
+        :param region: Region containing the data
+        :return:
+            The data of each extraction in extraction order, and a flag
+            indicating if any data was missing from that extraction.
+        :raises LookupErrror: If there is no such region.
+            Raised on the first iteration.
+        """
+        region_id = self._get_existing_recording_region_id(x, y, p, region)
+        chunks = [
+            (row["recording_data_id"], row["codec"], row["content_len"],
+             row["sidecar_offset"], row["missing_data"] != 0)
+            for row in self.cursor().execute(
+                """
+                SELECT recording_data_id, codec, content_len, sidecar_offset,
+                    missing_data
+                FROM recording_data
+                WHERE recording_region_id = ? ORDER BY extraction_id ASC
+                """, (region_id, ))]
+        for recording_data_id, codec, length, offset, missing in chunks:
+            if offset is not None:
+                yield self._read_sidecar(region_id, offset, length), missing
+                continue
+            content = self.read_blob(
+                "recording_data", "content", recording_data_id)
+            if codec != _Codec.RAW:
+                content = _decode_data(codec, bytes(content), length)
+            yield content, missing
+
     def get_recording_by_extraction_id(
             self, x: int, y: int, p: int, region: int,
             extraction_id: int) -> Tuple[memoryview, bool]:
@@ -0,0 +1,141 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from collections import OrderedDict
+from typing import Optional, Tuple, Union
+from typing_extensions import TypeAlias
+
+#: is download, x, y, p, region and last extraction ID
+CacheKey: TypeAlias = Tuple[bool, int, int, int, int, Optional[int]]
+
+
+class RecordingCache(object):
+    """
+    A least recently used cache of the data read back from a
+    :py:class:`BufferDatabase`, limited by the total size of the data held.
+
+    The data held is made read only as it is shared by all the callers.
+    """
+
+    __slots__ = (
+        # key -> (data, missing) in least recently used order
+        "_entries",
+        # The maximum number of bytes to hold
+        "_max_bytes",
+        # The number of bytes currently held
+        "_n_bytes",
+        # Count of the lookups that found data
+        "_hits",
+        # Count of the lookups that did not find data
+        "_misses")
+
+    def __init__(self, max_bytes: int):
+        """
+        :param max_bytes: The maximum number of bytes of data to hold
+        """
+        self._entries: OrderedDict[
+            CacheKey, Tuple[memoryview, bool]] = OrderedDict()
+        self._max_bytes = max_bytes
+        self._n_bytes = 0
+        self._hits = 0
+        self._misses = 0
+
+    def get(self, key: CacheKey) -> Optional[Tuple[memoryview, bool]]:
+        """
+        Look up data, marking it as the most recently used.
+
+        :param key: The key the data was added with
+        :return: The data and missing flag, or `None` if not held
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            self._misses += 1
+            return None
+        self._hits += 1
+        self._entries.move_to_end(key)
+        return entry
+
+    def add(self, key: CacheKey, data: Union[bytes, memoryview],
+            missing: bool) -> Tuple[memoryview, bool]:
+        """
+        Add data, removing the least recently used data to make space.
+
+        Data bigger than the whole cache is not held.
+
+        :param key: The key to hold the data under
+        :param data: The data
+        :param missing: Whether any data was missing
+        :return: The data as held, and the missing flag
+        """
+        view = memoryview(data).toreadonly()
+        if view.nbytes > self._max_bytes:
+            return view, missing
+        self.remove(key)
+        while self._n_bytes + view.nbytes > self._max_bytes:
+            _, (old, _) = self._entries.popitem(last=False)
+            self._n_bytes -= old.nbytes
+        self._entries[key] = (view, missing)
+        self._n_bytes += view.nbytes
+        return view, missing
+
+    def remove(self, key: CacheKey) -> None:
+        """
+        Remove the data held under a key, if any.
+
+        :param key: The key the data was added with
+        """
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._n_bytes -= entry[0].nbytes
+
+    def remove_region(self, x: int, y: int, p: int, region: int) -> None:
+        """
+        Remove all the data held for a region, whatever the extraction.
+
+        :param x: x coordinate of the chip
+        :param y: y coordinate of the chip
+        :param p: Core within the specified chip
+        :param region: The region
+        """
+        for key in [key for key in self._entries
+                    if key[1:5] == (x, y, p, region)]:
+            self.remove(key)
+
+    def clear(self) -> None:
+        """
+        Remove all the data held.
+        """
+        self._entries.clear()
+        self._n_bytes = 0
+
+    @property
+    def n_bytes(self) -> int:
+        """
+        The number of bytes of data currently held.
+        """
+        return self._n_bytes
+
+    @property
+    def hits(self) -> int:
+        """
+        The number of lookups that found data.
+        """
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        """
+        The number of lookups that did not find data.
+        """
+        return self._misses
@@ -16,9 +16,10 @@ from .data_specification_base import DataSpecificationBase
 from .data_specification_generator import DataSpecificationGenerator
 from .data_specification_reloader import DataSpecificationReloader
 from .data_type import DataType
+from .ds_core_buffer import DsCoreBuffer
 from .ds_sqllite_database import DsSqlliteDatabase
 
 __all__ = (
     "DataSpecificationBase",
     "DataSpecificationGenerator", "DataSpecificationReloader",
-    "DataType", "DsSqlliteDatabase")
+    "DataType", "DsCoreBuffer", "DsSqlliteDatabase")
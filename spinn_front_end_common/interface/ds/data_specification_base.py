@@ -12,7 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from typing import Any, Optional, Sequence, TextIO, Union
+from typing import Any, List, Optional, Sequence, TextIO, Union
 
 import numpy
 
@@ -20,9 +20,14 @@ from spinn_utilities.abstract_base import AbstractBase, abstractmethod
 from spinn_front_end_common.utilities.exceptions import DataSpecException
 
 from .data_type import DataType
+from .ds_core_buffer import DsCoreBuffer
 from .ds_sqllite_database import DsSqlliteDatabase
 
 BYTES_PER_WORD = 4
+#: The most bytes allocated for a region before anything is written to it.
+#: Regions are often reserved much bigger than the data written to them,
+#: so bigger regions grow as needed.
+_MAX_PREALLOCATED_BYTES = 64 * 1024
 
 
 class DataSpecificationBase(object, metaclass=AbstractBase):
@@ -35,15 +40,19 @@ class DataSpecificationBase(object, metaclass=AbstractBase):
         "_y",
         "_p",
         "_content",
+        "_n_bytes",
         "_content_debug",
         "_ds_db",
         "_report_writer",
         "_region_num",
         "_size")
 
-    def __init__(self, x: int, y: int, p: int, ds_db: DsSqlliteDatabase,
+    def __init__(self, x: int, y: int, p: int,
+                 ds_db: Union[DsSqlliteDatabase, DsCoreBuffer],
                  report_writer: Optional[TextIO] = None):
         """
+        :param ds_db:
+            Where the specification is written to, or read from on reload.
         :param report_writer:
             Determines if a text version of the specification is to be
             written and, if so, where. No report is written if this is `None`.
@@ -54,7 +63,8 @@ class DataSpecificationBase(object, metaclass=AbstractBase):
         self._ds_db = ds_db
         self._report_writer = report_writer
         self._content: Optional[bytearray] = None
-        self._content_debug: Optional[str] = None
+        self._n_bytes = 0
+        self._content_debug: Optional[List[str]] = None
         self._region_num: Optional[int] = None
         self._size: Optional[int] = None
 
@@ -132,6 +142,27 @@ class DataSpecificationBase(object, metaclass=AbstractBase):
         self._region_num = region
         if self._size <= 0:
             raise DataSpecException(f"No size set for region {region}")
+        self._content = bytearray(min(self._size, _MAX_PREALLOCATED_BYTES))
+
+    def _allocate(self, n_bytes: int) -> int:
+        """
+        Make room for more data in the content of the current region.
+
+        The content grows by doubling, but not beyond the size of the
+        region unless more than that is written.
+
+        :param n_bytes: The number of bytes about to be written
+        :return: The offset in the content to write them to
+        """
+        assert self._content is not None
+        start = self._n_bytes
+        end = start + n_bytes
+        capacity = len(self._content)
+        if end > capacity:
+            new_capacity = max(end, min(capacity * 2, self._size or 0))
+            self._content.extend(bytes(new_capacity - capacity))
+        self._n_bytes = end
+        return start
 
     def write_value(self, data: Union[int, float],
                     data_type: DataType = DataType.UINT32) -> None:
@@ -157,7 +188,6 @@ class DataSpecificationBase(object, metaclass=AbstractBase):
         :raise NoRegionSelectedException: If no region has been selected
         """
         assert self._content is not None
-        assert self._content_debug is not None
         data_type.check_value(data)
 
         as_bytes = data_type.as_bytes(data)
@@ -168,15 +198,17 @@ class DataSpecificationBase(object, metaclass=AbstractBase):
             raise ValueError(
                 f"{data}:{data_type.name} as bytes was {as_bytes!r} "
                 f"when only {data_type.size} bytes expected")
-        if len(self._content) % 4 != 0:  # check we are at a word boundary
+        if self._n_bytes % 4 != 0:  # check we are at a word boundary
             if len(as_bytes) % data_type.size != 0:
                 raise NotImplementedError(
-                    f"After {len(self._content)} bytes have been written "
+                    f"After {self._n_bytes} bytes have been written "
                     f" unable to add data of type {data_type}"
                     f" without padding")
 
-        self._content += as_bytes
-        self._content_debug += f"{data}:{data_type.name} "
+        start = self._allocate(len(as_bytes))
+        self._content[start:self._n_bytes] = as_bytes
+        if self._content_debug is not None:
+            self._content_debug.append(f"{data}:{data_type.name} ")
 
     def write_array(self, array_values: Union[
             Sequence[int], Sequence[float], numpy.ndarray],
@@ -189,28 +221,32 @@ class DataSpecificationBase(object, metaclass=AbstractBase):
         :param data_type: Type of data contained in the array
         """
         assert self._content is not None
-        assert self._content_debug is not None
-        data: numpy.ndarray = numpy.array(
+        # Only copies if not already an array of the right type
+        data: numpy.ndarray = numpy.asarray(
             array_values, dtype=data_type.numpy_typename)
 
-        encoded = data.tobytes()
-
-        self._report("WRITE_ARRAY ", len(array_values), " elements in ",
-                     len(encoded), " bytes")
-        if len(array_values) < 100:
-            self._report(list(array_values), " as ", repr(encoded))
+        if self._report_writer is not None:
+            self._report("WRITE_ARRAY ", len(array_values), " elements in ",
+                         data.nbytes, " bytes")
+            if len(array_values) < 100:
+                self._report(list(array_values), " as ", data.tobytes())
 
-        if len(self._content) % 4 != 0:  # check we are at a word boundary
+        if self._n_bytes % 4 != 0:  # check we are at a word boundary
             raise NotImplementedError(
-                f"After {len(self._content)} bytes have been written "
+                f"After {self._n_bytes} bytes have been written "
                 f"which is not a multiple of 4"
                 f" write_array is not supported")
-        if len(encoded) % 4 != 0:  # check we are at a word boundary
+        if data.nbytes % 4 != 0:  # check we are at a word boundary
             raise NotImplementedError(
-                f"Unexpected data (as bytes) length of {len(encoded)}")
+                f"Unexpected data (as bytes) length of {data.nbytes}")
 
-        self._content += encoded
-        self._content_debug += f"{array_values}:Array "
+        start = self._allocate(data.nbytes)
+        # Write straight into the content through a view of it
+        numpy.frombuffer(
+            self._content, dtype=data.dtype, count=data.size,
+            offset=start)[:] = data.reshape(-1)
+        if self._content_debug is not None:
+            self._content_debug.append(f"{array_values}:Array ")
 
     def _check_write_block(self) -> None:
         assert self._content is not None
@@ -229,10 +265,22 @@ class DataSpecificationBase(object, metaclass=AbstractBase):
                 "Unable to write {length} bytes as not a multiple of 4")
 
     def _end_write_block(self) -> None:
-        if self._content is not None and len(self._content) > 0:
+        if self._content is not None and self._n_bytes > 0:
+            # Drop the space allocated but not written
+            del self._content[self._n_bytes:]
             self._end_block()
         self._commence_block()
 
+    @property
+    def _debug_text(self) -> Optional[str]:
+        """
+        The text version of what has been written to the current region,
+        or `None` if not reporting.
+        """
+        if self._content_debug is None:
+            return None
+        return "".join(self._content_debug)
+
     @abstractmethod
     def _end_block(self) -> None:
         """
@@ -242,7 +290,9 @@ class DataSpecificationBase(object, metaclass=AbstractBase):
 
     def _commence_block(self) -> None:
         self._content = bytearray()
-        self._content_debug = ""
+        self._n_bytes = 0
+        if self._report_writer is not None:
+            self._content_debug = list()
 
     def end_specification(self) -> None:
         """
@@ -20,6 +20,7 @@ from spinn_front_end_common.abstract_models import (
     AbstractGeneratesDataSpecification,
     AbstractRewritesDataSpecification, AbstractHasAssociatedBinary)
 from .data_specification_base import DataSpecificationBase
+from .ds_core_buffer import DsCoreBuffer
 from .ds_sqllite_database import DsSqlliteDatabase
 
 
@@ -35,13 +36,17 @@ class DataSpecificationGenerator(DataSpecificationBase):
             vertex: Union[
                 AbstractGeneratesDataSpecification,
                 AbstractRewritesDataSpecification],
-            ds_db: DsSqlliteDatabase, report_writer: Optional[TextIO] = None):
+            ds_db: Union[DsSqlliteDatabase, DsCoreBuffer],
+            report_writer: Optional[TextIO] = None):
         """
         :param x:
         :param y:
         :param p:
         :param vertex:
             The vertex being written.
+        :param ds_db:
+            The database to write to,
+            or a buffer to hold what would be written to it.
         :param report_writer:
             Determines if a text version of the specification is to be
             written and, if so, where. No report is written if this is `None`.
@@ -91,4 +96,4 @@ class DataSpecificationGenerator(DataSpecificationBase):
 
         self._ds_db.set_region_content(
             self._x, self._y, self._p, self._region_num,
-            self._content, self._content_debug)
+            self._content, self._debug_text)
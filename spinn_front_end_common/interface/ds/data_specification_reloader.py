@@ -17,6 +17,7 @@ from spinn_utilities.overrides import overrides
 from spinn_front_end_common.data import FecDataView
 from spinn_front_end_common.utilities.exceptions import DataSpecException
 from .data_specification_generator import DataSpecificationBase
+from .ds_sqllite_database import DsSqlliteDatabase
 
 
 class DataSpecificationReloader(DataSpecificationBase):
@@ -49,6 +50,8 @@ class DataSpecificationReloader(DataSpecificationBase):
         if self._region_num is None:
             raise DataSpecException("region number is unknown?!")
 
+        # Reloading always reads the pointers from the original database
+        assert isinstance(self._ds_db, DsSqlliteDatabase)
         pointer = self._ds_db.get_region_pointer(
             self._x, self._y, self._p, self._region_num)
         if pointer is None:
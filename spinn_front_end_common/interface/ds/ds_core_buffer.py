@@ -0,0 +1,200 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from typing import List, Optional, Tuple, Union
+from spinn_front_end_common.abstract_models import AbstractHasAssociatedBinary
+from spinn_front_end_common.utilities.exceptions import DsDatabaseException
+from .ds_sqllite_database import DsSqlliteDatabase
+
+
+class DsCoreBuffer(object):
+    """
+    Holds in memory what a
+    :py:class:`~.DataSpecificationGenerator` would write to a
+    :py:class:`~.DsSqlliteDatabase` for a single core.
+
+    This allows the data specification of a core to be generated away from
+    the database, for example in another thread, and written to the
+    database later by :py:meth:`write_to`.
+
+    The methods take the same parameters as those of the database.
+    """
+
+    __slots__ = (
+        # The x, y, p of the core
+        "_x", "_y", "_p",
+        # The vertex passed to set_core
+        "_vertex",
+        # The (region_num, size, reference, label) of each region reserved
+        "_regions",
+        # The (region_num, reference, label) of each region referenced
+        "_references",
+        # The (region_num, content, content_debug) of each region written
+        "_contents")
+
+    def __init__(self, x: int, y: int, p: int):
+        """
+        :param x: X coordinate of the core
+        :param y: Y coordinate of the core
+        :param p: Processor ID of the core
+        """
+        self._x = x
+        self._y = y
+        self._p = p
+        self._vertex: Optional[AbstractHasAssociatedBinary] = None
+        self._regions: List[
+            Tuple[int, int, Optional[int], Optional[str]]] = list()
+        self._references: List[Tuple[int, int, Optional[str]]] = list()
+        self._contents: List[
+            Tuple[int, Union[bytes, bytearray], Optional[str]]] = list()
+
+    def __check_core(self, x: int, y: int, p: int) -> None:
+        if (x, y, p) != (self._x, self._y, self._p):
+            raise DsDatabaseException(
+                f"Buffer for core {self._x}:{self._y}:{self._p} "
+                f"can not hold data for {x}:{y}:{p}")
+
+    def set_core(self, x: int, y: int, p: int,
+                 vertex: AbstractHasAssociatedBinary) -> None:
+        """
+        Records the vertex of the core.
+
+        :param x: X coordinate of the core
+        :param y: Y coordinate of the core
+        :param p: Processor ID of the core
+        :param vertex: Vertex to check if it is a system vertex.
+        """
+        self.__check_core(x, y, p)
+        self._vertex = vertex
+
+    def set_memory_region(
+            self, x: int, y: int, p: int, region_num: int, size: int,
+            reference: Optional[int], label: Optional[str]) -> None:
+        """
+        Records the reservation of a memory region.
+
+        :param x: X coordinate of the core
+        :param y: Y coordinate of the core
+        :param p: Processor ID of the core
+        :param region_num: The number of the region to reserve
+        :param size: The size to reserve for the region, in bytes
+        :param reference: A globally unique reference for this region
+        :param label: An optional label for the region
+        """
+        self.__check_core(x, y, p)
+        self._regions.append((region_num, size, reference, label))
+
+    def get_region_size(self, x: int, y: int, p: int, region_num: int) -> int:
+        """
+        Gets the size for a region reserved in this buffer.
+
+        :param x: X coordinate of the core
+        :param y: Y coordinate of the core
+        :param p: Processor ID of the core
+        :param region_num: The region number
+        :return: The size of the region, in bytes
+        """
+        self.__check_core(x, y, p)
+        for region, size, _, _ in self._regions:
+            if region == region_num:
+                return size
+        raise DsDatabaseException(f"Region {region_num} not set")
+
+    def set_reference(self, x: int, y: int, p: int, region_num: int,
+                      reference: int, ref_label: Optional[str]) -> None:
+        """
+        Records an outgoing region reference.
+
+        :param x: X coordinate of the core
+        :param y: Y coordinate of the core
+        :param p: Processor ID of the core
+        :param region_num: The region number
+        :param reference: The number of the reference on this core
+        :param ref_label: label for the referencing region
+        """
+        self.__check_core(x, y, p)
+        self._references.append((region_num, reference, ref_label))
+
+    def set_region_content(
+            self, x: int, y: int, p: int, region_num: int,
+            content: Union[bytes, bytearray],
+            content_debug: Optional[str]) -> None:
+        """
+        Records the content for a region.
+
+        .. note::
+            The content is not checked against the regions reserved until
+            it is written to the database.
+            It is not copied so must not be changed after this call.
+
+        :param x: X coordinate of the core
+        :param y: Y coordinate of the core
+        :param p: Processor ID of the core
+        :param region_num: The region number
+        :param content: content to write
+        :param content_debug: debug text
+        """
+        self.__check_core(x, y, p)
+        self._contents.append((region_num, content, content_debug))
+
+    @property
+    def has_references(self) -> bool:
+        """
+        Whether any region recorded is referenceable or a reference.
+        """
+        return bool(self._references) or any(
+            reference is not None for _, _, reference, _ in self._regions)
+
+    def read_from(self, ds_db: DsSqlliteDatabase) -> None:
+        """
+        Records the regions and references already in a database for the
+        core, so they can be written to another database.
+
+        The vertex is not read so :py:meth:`set_core` must still be called.
+
+        :param ds_db: The database to read from
+        """
+        x, y, p = self._x, self._y, self._p
+        for (region_num, size, reference, label, content,
+                content_debug) in ds_db.get_regions(x, y, p):
+            self.set_memory_region(
+                x, y, p, region_num, size, reference, label)
+            if content is not None:
+                self.set_region_content(
+                    x, y, p, region_num, content, content_debug)
+        for region_num, reference, ref_label in ds_db.get_references(
+                x, y, p):
+            self.set_reference(x, y, p, region_num, reference, ref_label)
+
+    def write_to(self, ds_db: DsSqlliteDatabase) -> None:
+        """
+        Writes everything recorded to the database, in the same order as
+        it was recorded.
+
+        This raises the same exceptions as the database would have raised
+        had the data been written to it directly.
+
+        :param ds_db: The database to write to
+        """
+        x, y, p = self._x, self._y, self._p
+        if self._vertex is not None:
+            ds_db.set_core(x, y, p, self._vertex)
+        for region_num, size, reference, label in self._regions:
+            ds_db.set_memory_region(
+                x, y, p, region_num, size, reference, label)
+        for region_num, reference, ref_label in self._references:
+            ds_db.set_reference(x, y, p, region_num, reference, ref_label)
+        for region_num, content, content_debug in self._contents:
+            ds_db.set_region_content(
+                x, y, p, region_num, content, content_debug)
@@ -12,13 +12,15 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import hashlib
 import logging
 import os
 import sqlite3
-from typing import Dict, Iterable, List, Optional, Tuple, cast
+from typing import Dict, Iterable, List, Optional, Tuple, Union, cast
 
 import numpy
 
+from spinn_utilities.config_holder import get_config_bool
 from spinn_utilities.log import FormatAdapter
 from spinn_utilities.typing.coords import XYP
 
@@ -46,7 +48,7 @@ class DsSqlliteDatabase(SQLiteDB):
     """
     A database for holding data specification details.
     """
-    __slots__ = ["_init_file"]
+    __slots__ = ["_init_file", "_java_content"]
 
     def __init__(self, database_file:  Optional[str] = None):
         """
@@ -59,6 +61,8 @@ class DsSqlliteDatabase(SQLiteDB):
             database_file = FecDataView.get_ds_database_path()
 
         self._init_file = not os.path.exists(database_file)
+        # Java reads the content from each region, so it is not shared
+        self._java_content = get_config_bool("Java", "use_java")
 
         super().__init__(
             database_file, ddl_file=_DDL_FILE if self._init_file else None)
@@ -287,7 +291,8 @@ class DsSqlliteDatabase(SQLiteDB):
             yield (row["x"], row["y"], row["p"], row["region_num"])
 
     def set_region_content(
-            self, x: int, y: int, p: int, region_num: int, content: bytes,
+            self, x: int, y: int, p: int, region_num: int,
+            content: Union[bytes, bytearray],
             content_debug: Optional[str]) -> None:
         """
         Sets the content for this region
@@ -298,17 +303,18 @@ class DsSqlliteDatabase(SQLiteDB):
         :param region_num: The region number
         :param content: content to write
         :param content_debug: debug text
-        :raises DsDatabaseException: If the region already has content
+        :raises DsDatabaseException:
+            If the region already has content that is not empty
         """
-        # check for previous content
+        # check for previous content; empty content may be replaced
         for row in self.cursor().execute(
                 """
-                SELECT content
-                FROM region
+                SELECT length(content.content) AS content_len
+                FROM region JOIN content USING (content_id)
                 WHERE x = ? AND y = ? and p = ? and region_num = ?
                 LIMIT 1
                 """, (x, y, p, region_num)):
-            if row["content"]:
+            if row["content_len"]:
                 raise DsDatabaseException(
                     f"Illegal attempt to overwrite content for "
                     f"{x=} {y=} {p=} {region_num=}")
@@ -316,13 +322,43 @@ class DsSqlliteDatabase(SQLiteDB):
         self.cursor().execute(
             """
             UPDATE region
-            SET content = ?, content_debug = ?
+            SET content_id = ?, content = ?, content_debug = ?
             WHERE x = ? AND y = ? and p = ? and region_num = ?
-            """, (content, content_debug, x, y, p, region_num))
+            """, (self.__get_content_id(content),
+                  content if self._java_content else None, content_debug,
+                  x, y, p, region_num))
         if self.rowcount == 0:
             raise DsDatabaseException(
                 f"No region {x=} {y=} {p=} {region_num=}")
 
+    def __get_content_id(self, content: Union[bytes, bytearray]) -> int:
+        """
+        Finds the content already in the database that is the same,
+        or adds it.
+
+        :param content: The content to find or add
+        :return: The ID of the content in the database
+        """
+        content_hash = hashlib.sha256(content).digest()
+        for row in self.cursor().execute(
+                """
+                SELECT content_id
+                FROM content
+                WHERE content_hash = ?
+                LIMIT 1
+                """, (content_hash,)):
+            return int(row["content_id"])
+
+        # The checksum is only worked out once for each distinct content
+        words = numpy.frombuffer(content, dtype="<u4")
+        checksum = int(numpy.sum(words, dtype="uint64")) & 0xFFFFFFFF
+        self.cursor().execute(
+            """
+            INSERT INTO content(content_hash, content, checksum)
+            VALUES(?, ?, ?)
+            """, (content_hash, content, checksum))
+        return self.lastrowid
+
     def get_region_pointer(
             self, x: int, y: int, p: int, region_num: int) -> Optional[int]:
         """
@@ -371,6 +407,32 @@ class DsSqlliteDatabase(SQLiteDB):
             regions[row["region_num"]] = row["size"]
         return regions
 
+    def get_region_sizes_by_core(
+            self, is_system: bool) -> Dict[XYP, Dict[int, int]]:
+        """
+        Gets a dict of the regions and sizes reserved for each core
+        according to is_system
+
+        Cores with no regions reserved are not included.
+
+        :param is_system: if True returns system cores
+            otherwise application cores
+        :return: dict of (x, y, p) to dict of region_num to size
+        """
+        regions: Dict[XYP, Dict[int, int]] = dict()
+        for row in self.cursor().execute(
+                """
+                SELECT x, y, p, region_num, size
+                FROM region NATURAL JOIN core
+                WHERE is_system = ?
+                ORDER BY x, y, p, region_num
+                """, (is_system,)):
+            xyp = (row["x"], row["y"], row["p"])
+            if xyp not in regions:
+                regions[xyp] = dict()
+            regions[xyp][row["region_num"]] = row["size"]
+        return regions
+
     def get_total_regions_size(self, x: int, y: int, p: int) -> int:
         """
         Gets the total size of the regions of this core
@@ -395,6 +457,108 @@ class DsSqlliteDatabase(SQLiteDB):
             return row["total"]
         raise DsDatabaseException("Query failed unexpectedly")
 
+    def set_fingerprint(
+            self, x: int, y: int, p: int, fingerprint: bytes) -> None:
+        """
+        Sets what identifies the data the regions of the core were
+        generated from.
+
+        :param x: X coordinate of the core
+        :param y: Y coordinate of the core
+        :param p: Processor ID of the core
+        :param fingerprint: The fingerprint supplied by the vertex
+        :raises DsDatabaseException: if the core is not known
+        """
+        self.cursor().execute(
+            """
+            UPDATE core
+            SET fingerprint = ?
+            WHERE x = ? AND y = ? AND p = ?
+            """, (fingerprint, x, y, p))
+        if self.rowcount == 0:
+            raise DsDatabaseException(
+                f"No core {x=} {y=} {p=}")
+
+    def get_fingerprint(self, x: int, y: int, p: int) -> Optional[bytes]:
+        """
+        Gets what identifies the data the regions of the core were
+        generated from.
+
+        :param x: X coordinate of the core
+        :param y: Y coordinate of the core
+        :param p: Processor ID of the core
+        :return: The fingerprint, or None if the core is not known or has
+            no fingerprint
+        """
+        for row in self.cursor().execute(
+                """
+                SELECT fingerprint
+                FROM core
+                WHERE x = ? AND y = ? AND p = ?
+                LIMIT 1
+                """, (x, y, p)):
+            fingerprint = row["fingerprint"]
+            return None if fingerprint is None else bytes(fingerprint)
+        return None
+
+    def get_regions(self, x: int, y: int, p: int) -> Iterable[Tuple[
+            int, int, Optional[int], Optional[str], Optional[bytes],
+            Optional[str]]]:
+        """
+        Yields everything set for each region of the core, except the
+        pointer.
+
+        .. note::
+            Do not use the database for anything else while iterating.
+
+        :param x: X coordinate of the core
+        :param y: Y coordinate of the core
+        :param p: Processor ID of the core
+        :return: Yields the region number, size, reference, label, content
+            and debug text of each region
+        """
+        for row in self.cursor().execute(
+                """
+                SELECT region_num, size, reference_num, region_label,
+                    content, content_debug
+                FROM region_content_view
+                WHERE x = ? AND y = ? AND p = ?
+                ORDER BY region_num
+                """, (x, y, p)):
+            yield (row["region_num"], row["size"], row["reference_num"],
+                   self.__text(row["region_label"]), row["content"],
+                   self.__text(row["content_debug"]))
+
+    def get_references(self, x: int, y: int, p: int) -> Iterable[
+            Tuple[int, int, Optional[str]]]:
+        """
+        Yields the outgoing references of the core.
+
+        .. note::
+            Do not use the database for anything else while iterating.
+
+        :param x: X coordinate of the core
+        :param y: Y coordinate of the core
+        :param p: Processor ID of the core
+        :return: Yields the region number, reference and label of each
+            reference
+        """
+        for row in self.cursor().execute(
+                """
+                SELECT region_num, reference_num, ref_label
+                FROM reference
+                WHERE x = ? AND y = ? AND p = ?
+                ORDER BY region_num
+                """, (x, y, p)):
+            yield (row["region_num"], row["reference_num"],
+                   self.__text(row["ref_label"]))
+
+    @staticmethod
+    def __text(value: Optional[memoryview]) -> Optional[str]:
+        if value is None:
+            return None
+        return str(value, "utf8")
+
     def set_start_address(
             self, x: int, y: int, p: int, start_address: int) -> None:
         """
@@ -416,6 +580,26 @@ class DsSqlliteDatabase(SQLiteDB):
             raise DsDatabaseException(
                 f"No core {x=} {y=} {p=}")
 
+    def set_start_addresses(
+            self, start_addresses: List[Tuple[int, int, int, int]]) -> None:
+        """
+        Sets the base address for several cores at once
+
+        :param start_addresses:
+            The x, y, p and base address for the whole core of each core
+        :raises DsDatabaseException: if any of the cores is not known
+        """
+        self.cursor().executemany(
+            """
+            UPDATE core
+            SET start_address = ?
+            WHERE x = ? AND y = ? AND p = ?
+            """, ((start_address, x, y, p)
+                  for x, y, p, start_address in start_addresses))
+        if self.rowcount != len(start_addresses):
+            raise DsDatabaseException(
+                f"Only {self.rowcount} of {len(start_addresses)} cores found")
+
     def get_start_address(self, x: int, y: int, p: int) -> int:
         """
         Gets the start_address for this core
@@ -456,6 +640,26 @@ class DsSqlliteDatabase(SQLiteDB):
             raise DsDatabaseException(
                 f"No region {x=} {y=} {p=} {region_num=}")
 
+    def set_region_pointers(
+            self, pointers: List[Tuple[int, int, int, int, int]]) -> None:
+        """
+        Sets the pointers to the start of several regions at once
+
+        :param pointers: The x, y, p, region_num and start address of each
+            region
+        :raises DsDatabaseException: if any of the regions is not known
+        """
+        self.cursor().executemany(
+            """
+            UPDATE region
+            SET pointer = ?
+            WHERE x = ? AND y = ? and p = ? and region_num = ?
+            """, ((pointer, x, y, p, region_num)
+                  for x, y, p, region_num, pointer in pointers))
+        if self.rowcount != len(pointers):
+            raise DsDatabaseException(
+                f"Only {self.rowcount} of {len(pointers)} regions found")
+
     def get_region_pointers_and_content(
             self, x: int, y: int, p: int) -> Iterable[Tuple[
                 int, int, Optional[bytes]]]:
@@ -472,18 +676,40 @@ class DsSqlliteDatabase(SQLiteDB):
         :param p: Processor ID of the core
         :return: number, pointer and (content or None)
         """
+        for region_num, pointer, content, _ in \
+                self.get_region_pointers_contents_and_checksums(x, y, p):
+            yield region_num, pointer, content
+
+    def get_region_pointers_contents_and_checksums(
+            self, x: int, y: int, p: int) -> Iterable[Tuple[
+                int, int, Optional[bytes], Optional[int]]]:
+        """
+        Yields the number, pointers, content and checksum for each
+        reserved region
+
+        This includes regions with no content set where content and
+        checksum will be None
+
+        Will yield nothing if there are no regions reserved or if the core is
+        not known
+
+        :param x: X coordinate of the core
+        :param y: Y coordinate of the core
+        :param p: Processor ID of the core
+        :return: number, pointer, (content or None) and (checksum or None)
+        """
         for row in self.cursor().execute(
                 """
-                SELECT region_num, content, pointer
+                SELECT region_num, content, checksum, pointer
                 FROM pointer_content_view
                 WHERE x = ? AND y = ? AND p = ?
                 ORDER BY region_num
                  """, (x, y, p)):
             if row["content"]:
-                content = bytearray(row["content"])
+                yield (row["region_num"], row["pointer"], row["content"],
+                       row["checksum"])
             else:
-                content = None
-            yield row["region_num"], row["pointer"], content
+                yield row["region_num"], row["pointer"], None, None
 
     def get_regions_content(
             self, x: int, y: int, p: int) -> Iterable[Tuple[int, int, bytes]]:
@@ -503,11 +729,11 @@ class DsSqlliteDatabase(SQLiteDB):
         for row in self.cursor().execute(
                 """
                 SELECT region_num, content, pointer
-                FROM region
+                FROM region_content_view
                 WHERE x = ? AND y = ? AND p = ? AND content IS NOT NULL
                 ORDER BY region_num
                  """, (x, y, p)):
-            yield row["region_num"], row["pointer"], bytearray(row["content"])
+            yield row["region_num"], row["pointer"], row["content"]
 
     def get_max_content_size(self, is_system: bool) -> int:
         """
@@ -519,7 +745,7 @@ class DsSqlliteDatabase(SQLiteDB):
         for row in self.cursor().execute(
                 """
                 SELECT MAX(LENGTH(content)) AS size
-                FROM region NATURAL JOIN CORE
+                FROM region_content_view NATURAL JOIN CORE
                 WHERE is_system = ?
                 LIMIT 1
                  """, (is_system,)):
@@ -543,9 +769,9 @@ class DsSqlliteDatabase(SQLiteDB):
         for row in self.cursor().execute(
                 """
                 SELECT LENGTH(content) AS size, COUNT(*) AS num
-                FROM region NATURAL JOIN core
+                FROM region_content_view NATURAL JOIN core
                 WHERE is_system = ? AND content IS NOT NULL
-                GROUP BY size
+                GROUP BY LENGTH(content)
                 ORDER BY size DESC
                 """, (is_system,)):
             sizes.append((row["size"], row["num"]))
@@ -53,6 +53,8 @@ CREATE TABLE IF NOT EXISTS core(
     is_system INTEGER NOT NULL,
     start_address INTEGER,
     memory_written INTEGER,
+    -- Identifies what the regions of the core were generated from
+    fingerprint BLOB,
     PRIMARY KEY (x, y, p),
     FOREIGN KEY (x, y) REFERENCES chip(x, y)
 );
@@ -62,6 +64,16 @@ CREATE VIEW IF NOT EXISTS core_view AS
            ethernet_x, ethernet_y, ip_address
     FROM core NATURAL JOIN chip_view;
 
+-- - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+-- A table holding each distinct region content only once,
+-- as many cores often have identical regions.
+CREATE TABLE IF NOT EXISTS content(
+    content_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    content_hash BLOB UNIQUE NOT NULL,
+    content BLOB NOT NULL,
+    -- The sum of the content as 32-bit words, modulo 2^32
+    checksum INTEGER NOT NULL);
+
 -- - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
 -- A table describing the regions.
 CREATE TABLE IF NOT EXISTS region(
@@ -70,13 +82,21 @@ CREATE TABLE IF NOT EXISTS region(
     y INTEGER NOT NULL,
     p INTEGER NOT NULL,
     reference_num INTEGER,
+    -- Only set when using Java, which reads the content of each region here
     content BLOB,
+    content_id INTEGER,
     content_debug TEXT,
     size INT NOT NULL,
     pointer INTEGER,
     region_label TEXT,
     PRIMARY KEY (x, y, p, region_num),
-    FOREIGN KEY (x, y, p) REFERENCES core(x, y, p));
+    FOREIGN KEY (x, y, p) REFERENCES core(x, y, p),
+    FOREIGN KEY (content_id) REFERENCES content(content_id));
+
+CREATE VIEW IF NOT EXISTS region_content_view AS
+SELECT x, y, p, region_num, reference_num, content_id, content_debug, size,
+       pointer, region_label, content.content AS content, checksum
+FROM region LEFT JOIN content USING (content_id);
 
 -- -- Every reference is unique per core
 CREATE UNIQUE INDEX IF NOT EXISTS reference_in_sanity ON region(
@@ -84,7 +104,7 @@ CREATE UNIQUE INDEX IF NOT EXISTS reference_in_sanity ON region(
 
 CREATE VIEW IF NOT EXISTS content_size_view AS
 SELECT x,y,p, sum(COALESCE(length(content), 0)) as contents_size
-FROM region
+FROM region_content_view
 GROUP BY x, y, p;
 
 CREATE VIEW IF NOT EXISTS region_size_view AS
@@ -134,14 +154,15 @@ ON reference.reference_num = region.reference_num
     AND reference.y = region.y;
 
 CREATE VIEW IF NOT EXISTS pointer_content_view AS
-SELECT x, y, p, region_num, pointer, content FROM
-    (SELECT reference.x, reference.y, reference.p, reference.region_num, pointer, NULL as content
+SELECT x, y, p, region_num, pointer, content, checksum FROM
+    (SELECT reference.x, reference.y, reference.p, reference.region_num, pointer,
+        NULL as content, NULL as checksum
     FROM reference LEFT JOIN region
     ON reference.reference_num = region.reference_num
         AND reference.x = region.x
         AND reference.y = region.y)
 UNION
-SELECT x, y, p, region_num, pointer, content FROM region;
+SELECT x, y, p, region_num, pointer, content, checksum FROM region_content_view;
 
  -- Information about more general overall things
 CREATE TABLE IF NOT EXISTS info (
@@ -12,26 +12,40 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from collections import defaultdict
+from collections import defaultdict, deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import nullcontext
 import logging
-from typing import Dict, List, Tuple
+import os
+from typing import (
+    Deque, Dict, List, Optional, Sequence, Tuple, Union, cast)
+from typing_extensions import TypeAlias
 
-from spinn_utilities.config_holder import get_report_path
+from spinn_utilities.config_holder import get_config_int, get_report_path
 from spinn_utilities.progress_bar import ProgressBar
 from spinn_utilities.log import FormatAdapter
 from pacman.model.resources import MultiRegionSDRAM, ConstantSDRAM
 from pacman.model.placements import Placement
 from spinn_front_end_common.abstract_models import (
-    AbstractRewritesDataSpecification, AbstractGeneratesDataSpecification)
+    AbstractRewritesDataSpecification, AbstractGeneratesDataSpecification,
+    AbstractGeneratesThreadSafeDataSpecification,
+    AbstractHasAssociatedBinary, AbstractHasDataSpecificationFingerprint)
 from spinn_front_end_common.data import FecDataView
 from spinn_front_end_common.utilities.exceptions import (
     ConfigurationException, DataSpecException)
 from spinn_front_end_common.interface.ds import (
-    DataSpecificationGenerator, DsSqlliteDatabase)
+    DataSpecificationGenerator, DsCoreBuffer, DsSqlliteDatabase)
 from spinn_front_end_common.utilities.utility_calls import get_report_writer
 
 logger = FormatAdapter(logging.getLogger(__name__))
 
+#: The number of cores each thread may generate before they are written
+_BUFFERED_PER_THREAD = 16
+
+#: A placement, its vertex and the fingerprint of the vertex if it has one
+_ToGenerate: TypeAlias = Tuple[
+    Placement, AbstractGeneratesDataSpecification, Optional[bytes]]
+
 
 def graph_data_specification_writer() -> str:
     """
@@ -51,13 +65,16 @@ class _GraphDataSpecificationWriter(object):
         # Dict of SDRAM usage by chip coordinates
         "_sdram_usage",
         # Dict of list of vertices by chip coordinates
-        "_vertices_by_chip")
+        "_vertices_by_chip",
+        # The number of cores whose data specification was reused
+        "_n_reused")
 
     def __init__(self) -> None:
         self._sdram_usage: Dict[Tuple[int, int], int] = defaultdict(lambda: 0)
         self._vertices_by_chip: \
             Dict[Tuple[int, int], List[AbstractGeneratesDataSpecification]] =\
             defaultdict(list)
+        self._n_reused = 0
 
     def run(self) -> str:
         """
@@ -68,26 +85,52 @@ class _GraphDataSpecificationWriter(object):
         # iterate though vertices and call generate_data_spec for each
         # vertex
         path = get_report_path("path_dataspec_database")
-        with DsSqlliteDatabase(path) as ds_db:
+        previous_path = FecDataView.get_previous_ds_database_path()
+        if (previous_path is None or previous_path == path or
+                not os.path.exists(previous_path)):
+            previous_path = None
+        with DsSqlliteDatabase(path) as ds_db, (
+                DsSqlliteDatabase(previous_path) if previous_path
+                else nullcontext()) as previous:
             ds_db.write_session_credentials_to_db()
             ds_db.set_info()
 
-            progress = ProgressBar(FecDataView.get_n_placements(),
-                                   "Generating data specifications")
-            vertices_to_reset: List[AbstractRewritesDataSpecification] = list()
-
-            for placement in progress.over(FecDataView.iterate_placemements()):
-                # Try to generate the data spec for the placement
-                vertex = placement.vertex
-                if not isinstance(
-                        vertex, AbstractGeneratesDataSpecification):
-                    continue
-
-                self.__generate_data_spec_for_vertices(
-                    placement, vertex, ds_db)
+            to_generate: List[_ToGenerate] = list()
+            for placement in FecDataView.iterate_placemements():
+                if isinstance(
+                        placement.vertex, AbstractGeneratesDataSpecification):
+                    to_generate.append((
+                        placement, placement.vertex,
+                        self.__get_fingerprint(placement)))
+            progress = ProgressBar(
+                len(to_generate), "Generating data specifications")
+            n_threads = get_config_int(
+                "Mapping", "n_data_specification_threads")
+            if n_threads > 1 and any(
+                    isinstance(vertex,
+                               AbstractGeneratesThreadSafeDataSpecification)
+                    for _, vertex, _ in to_generate):
+                self.__generate_in_parallel(
+                    to_generate, ds_db, previous, n_threads, progress)
+            else:
+                for placement, vertex, fingerprint in progress.over(
+                        to_generate):
+                    cached = self.__read_cached(
+                        placement, vertex, fingerprint, previous)
+                    if cached is None:
+                        self.__generate_data_spec_for_vertices(
+                            placement, vertex, ds_db)
+                    else:
+                        cached.write_to(ds_db)
+                    self.__check_core(placement, vertex, fingerprint, ds_db)
+            if self._n_reused:
+                logger.info(
+                    "Reused the data specifications of {} unchanged cores",
+                    self._n_reused)
 
-                if isinstance(vertex, AbstractRewritesDataSpecification):
-                    vertices_to_reset.append(vertex)
+            vertices_to_reset = [
+                vertex for _, vertex, _ in to_generate
+                if isinstance(vertex, AbstractRewritesDataSpecification)]
 
             # Ensure that the vertices know their regions have been reloaded
             for rewriter in vertices_to_reset:
@@ -97,16 +140,125 @@ class _GraphDataSpecificationWriter(object):
 
         return path
 
-    def __generate_data_spec_for_vertices(
+    @staticmethod
+    def __get_fingerprint(placement: Placement) -> Optional[bytes]:
+        """
+        :param placement: placement of machine graph to cores
+        :return: The fingerprint of the vertex, if it has one
+        """
+        vertex = placement.vertex
+        if isinstance(vertex, AbstractHasDataSpecificationFingerprint):
+            return vertex.get_data_specification_fingerprint(placement)
+        return None
+
+    def __read_cached(
             self, placement: Placement,
             vertex: AbstractGeneratesDataSpecification,
-            ds_db: DsSqlliteDatabase) -> None:
+            fingerprint: Optional[bytes],
+            previous: Optional[DsSqlliteDatabase]) -> Optional[DsCoreBuffer]:
         """
+        Reads the data specification of a core from the previous database
+        if it was generated there from the same fingerprint.
+
         :param placement: placement of machine graph to cores
-        :param vertex: the specific vertex to write DSG for.
-        :param ds_db:
+        :param vertex: the specific vertex to read the DSG for.
+        :param fingerprint: The current fingerprint of the vertex, if any
+        :param previous: The database written before the reset, if any
+        :return: The data specification read, or None if it must be
+            generated
+        """
+        if fingerprint is None or previous is None:
+            return None
+        x, y, p = placement.x, placement.y, placement.p
+        if previous.get_fingerprint(x, y, p) != fingerprint:
+            return None
+        buffer = DsCoreBuffer(x, y, p)
+        buffer.set_core(x, y, p, cast(AbstractHasAssociatedBinary, vertex))
+        buffer.read_from(previous)
+        # References are numbered again from zero after a reset, so the old
+        # numbers could clash with new ones
+        if buffer.has_references:
+            return None
+        self._n_reused += 1
+        return buffer
+
+    def __generate_in_parallel(
+            self, to_generate: Sequence[_ToGenerate],
+            ds_db: DsSqlliteDatabase, previous: Optional[DsSqlliteDatabase],
+            n_threads: int, progress: ProgressBar) -> None:
+        """
+        Generates the data specifications of the cores of thread safe
+        vertices in several threads, each into a buffer, while writing the
+        buffers to the database and checking them in placement order in this
+        thread.  Other vertices are generated in this thread in order.
+
+        :param to_generate: The placements and vertices to generate for
+        :param ds_db: The database to write to
+        :param previous: The database written before the reset, if any
+        :param n_threads: The number of threads to generate in
+        :param progress: Updated as each core is written
         :raises ConfigurationException: if things don't fit
         """
+        pending: Deque[Tuple[_ToGenerate, Future[DsCoreBuffer]]] = deque()
+
+        def write_oldest() -> None:
+            (placement, vertex, fingerprint), future = pending.popleft()
+            future.result().write_to(ds_db)
+            self.__check_core(placement, vertex, fingerprint, ds_db)
+            progress.update()
+
+        with ThreadPoolExecutor(
+                max_workers=n_threads,
+                thread_name_prefix="DataSpecGenerator") as pool:
+            try:
+                for item in to_generate:
+                    # Limit how much is held in memory waiting to be written
+                    if len(pending) >= n_threads * _BUFFERED_PER_THREAD:
+                        write_oldest()
+                    placement, vertex, fingerprint = item
+                    buffer = self.__read_cached(
+                        placement, vertex, fingerprint, previous)
+                    if buffer is None and not isinstance(
+                            vertex,
+                            AbstractGeneratesThreadSafeDataSpecification):
+                        buffer = self.__generate_into_buffer(
+                            placement, vertex)
+                    if buffer is None:
+                        future = pool.submit(
+                            self.__generate_into_buffer, placement, vertex)
+                    else:
+                        future = Future()
+                        future.set_result(buffer)
+                    pending.append((item, future))
+                while pending:
+                    write_oldest()
+            finally:
+                for _, future in pending:
+                    future.cancel()
+        progress.end()
+
+    @classmethod
+    def __generate_into_buffer(
+            cls, placement: Placement,
+            vertex: AbstractGeneratesDataSpecification) -> DsCoreBuffer:
+        """
+        :param placement: placement of machine graph to cores
+        :param vertex: the specific vertex to write DSG for.
+        :return: The buffer holding what would be written to the database
+        """
+        buffer = DsCoreBuffer(placement.x, placement.y, placement.p)
+        cls.__generate_data_spec_for_vertices(placement, vertex, buffer)
+        return buffer
+
+    @staticmethod
+    def __generate_data_spec_for_vertices(
+            placement: Placement, vertex: AbstractGeneratesDataSpecification,
+            ds_db: Union[DsSqlliteDatabase, DsCoreBuffer]) -> None:
+        """
+        :param placement: placement of machine graph to cores
+        :param vertex: the specific vertex to write DSG for.
+        :param ds_db: The database, or a buffer for the core, to write to
+        """
         x = placement.x
         y = placement.y
         p = placement.p
@@ -118,6 +270,27 @@ class _GraphDataSpecificationWriter(object):
         # generate the DSG file
         vertex.generate_data_specification(spec, placement)
 
+    def __check_core(
+            self, placement: Placement,
+            vertex: AbstractGeneratesDataSpecification,
+            fingerprint: Optional[bytes], ds_db: DsSqlliteDatabase) -> None:
+        """
+        Records the fingerprint of a core written to the database, and
+        checks the memory written for it against the estimates of the
+        vertex and against what is available on the chip.
+
+        :param placement: placement of machine graph to cores
+        :param vertex: the specific vertex the DSG was written for.
+        :param fingerprint: The fingerprint of the vertex, if any
+        :param ds_db:
+        :raises ConfigurationException: if things don't fit
+        """
+        x = placement.x
+        y = placement.y
+        p = placement.p
+        if fingerprint is not None:
+            ds_db.set_fingerprint(x, y, p, fingerprint)
+
         # Check the memory usage
         total_size = ds_db.get_total_regions_size(x, y, p)
         total_est_size = 0
@@ -12,19 +12,22 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from collections import defaultdict
 import logging
-from typing import Any, Callable
+from typing import Any, Callable, Dict, Iterator, List, Tuple
 
 import numpy
 from typing_extensions import TypeAlias
 
-from spinn_utilities.config_holder import get_config_bool
+from spinn_utilities.config_holder import get_config_bool, get_config_int
 from spinn_utilities.progress_bar import ProgressBar
 from spinn_utilities.log import FormatAdapter
+from spinn_utilities.typing.coords import XY
 
 from spinnman.model.enums import UserRegister
 
 from spinn_front_end_common.data import FecDataView
+from spinn_front_end_common.utilities.board_workers import BoardWorkers
 from spinn_front_end_common.utilities.constants import (
     APPDATA_MAGIC_NUM, APP_PTR_TABLE_BYTE_SIZE, BYTES_PER_WORD,
     CORE_DATA_SDRAM_BASE_TAG, DSE_VERSION, MAX_MEM_REGIONS, TABLE_TYPE)
@@ -35,6 +38,8 @@ from spinn_front_end_common.interface.ds import DsSqlliteDatabase
 
 logger = FormatAdapter(logging.getLogger(__name__))
 _Writer: TypeAlias = Callable[[int, int, int, bytes], Any]
+#: x, y, p, ethernet_x, ethernet_y of a core
+_CoreInfo: TypeAlias = Tuple[int, int, int, int, int]
 
 MONITOR_CUTOFF = 12800  # 50 packets of 256 bytes
 
@@ -157,6 +162,8 @@ class _LoadDataSpecification(object):
         if uses_advanced_monitors:
             self.__set_router_timeouts()
 
+        n_threads = get_config_int("Machine", "n_loading_threads")
+        boards: List[List[_CoreInfo]] = []
         with DsSqlliteDatabase() as ds_database:
             transceiver = FecDataView.get_transceiver()
             direct_writer: _Writer = transceiver.write_memory
@@ -167,47 +174,126 @@ class _LoadDataSpecification(object):
                 type_str = "system"
             else:
                 type_str = "application"
+            self.__python_malloc_cores(
+                ds_database, is_system, core_infos, type_str)
+
             progress = ProgressBar(
-                len(core_infos) * 2,
-                f"Loading data for {type_str} vertices")
-
-            for x, y, p, _, _ in progress.over(
-                    core_infos, finish_at_end=False):
-                self.__python_malloc_core(ds_database, x, y, p)
-
-            for x, y, p, eth_x, eth_y in progress.over(core_infos):
-                if uses_advanced_monitors:
-                    gatherer = FecDataView.get_gatherer_by_xy(eth_x, eth_y)
-                    monitor_writer = gatherer.send_data_into_spinnaker
-                written = self.__python_load_core(
-                    ds_database, x, y, p, direct_writer, monitor_writer)
-                to_write = ds_database.get_memory_to_write(x, y, p)
-                if written != to_write:
-                    raise DataSpecException(
-                        f"For {x=}{y=}{p=} {written=} != {to_write=}")
+                len(core_infos), f"Loading data for {type_str} vertices")
+            if n_threads > 1:
+                by_board: Dict[XY, List[_CoreInfo]] = defaultdict(list)
+                for core_info in core_infos:
+                    by_board[core_info[3], core_info[4]].append(core_info)
+                boards = list(by_board.values())
+            else:
+                for x, y, p, eth_x, eth_y in progress.over(core_infos):
+                    if uses_advanced_monitors:
+                        gatherer = FecDataView.get_gatherer_by_xy(
+                            eth_x, eth_y)
+                        monitor_writer = gatherer.send_data_into_spinnaker
+                    self.__python_load_and_check_core(
+                        ds_database, x, y, p, direct_writer, monitor_writer)
+
+        # The pointers must be committed before other connections read them
+        if n_threads > 1:
+            self.__load_by_board(
+                boards, n_threads, uses_advanced_monitors, progress)
 
         if uses_advanced_monitors:
             self.__reset_router_timeouts()
 
-    def __python_malloc_core(self, ds_database: DsSqlliteDatabase,
-                             x: int, y: int, p: int) -> None:
-        region_sizes = ds_database.get_region_sizes(x, y, p)
-        total_size = sum(region_sizes.values())
-        malloc_size = total_size + APP_PTR_TABLE_BYTE_SIZE
-        start_address = self.__malloc_region_storage(x, y, p, malloc_size)
-        ds_database.set_start_address(x, y, p, start_address)
-
-        next_pointer = start_address + APP_PTR_TABLE_BYTE_SIZE
-        for region_num, size in region_sizes.items():
-            ds_database.set_region_pointer(x, y, p, region_num, next_pointer)
-            next_pointer += size
-
-        # safety code
-        total_size = ds_database.get_total_regions_size(x, y, p)
-        expected_pointer = start_address + APP_PTR_TABLE_BYTE_SIZE + total_size
-        if (next_pointer != expected_pointer):
+    def __python_malloc_cores(
+            self, ds_database: DsSqlliteDatabase, is_system: bool,
+            core_infos: List[_CoreInfo], type_str: str) -> None:
+        """
+        Allocates the storage for all DSG regions on the cores and tells
+        the cores and the database where that storage is.
+
+        The allocations and the user 0 writes are each sent to the machine
+        as a single pipelined batch.
+
+        :param ds_database: The database to read the sizes from and
+            store the pointers in
+        :param is_system: Whether the cores are system cores
+        :param core_infos: The x, y, p, ethernet_x, ethernet_y of each core
+        :param type_str: The type of the cores for the progress bar
+        """
+        if not core_infos:
+            return
+        txrx = FecDataView.get_transceiver()
+        app_id = FecDataView.get_app_id()
+        region_sizes = ds_database.get_region_sizes_by_core(is_system)
+        cores = [(x, y, p, region_sizes.get((x, y, p), {}))
+                 for x, y, p, _, _ in core_infos]
+
+        # allocate memory where the app data is going to be written; this
+        # raises an exception in case there is not enough SDRAM to allocate
+        start_addresses = txrx.malloc_sdram_multi([
+            (x, y, sum(sizes.values()) + APP_PTR_TABLE_BYTE_SIZE, app_id,
+             CORE_DATA_SDRAM_BASE_TAG + p)
+            for x, y, p, sizes in cores])
+
+        starts: List[Tuple[int, int, int, int]] = list()
+        pointers: List[Tuple[int, int, int, int, int]] = list()
+        for (x, y, p, sizes), start_address in zip(cores, start_addresses):
+            starts.append((x, y, p, start_address))
+            next_pointer = start_address + APP_PTR_TABLE_BYTE_SIZE
+            for region_num, size in sizes.items():
+                pointers.append((x, y, p, region_num, next_pointer))
+                next_pointer += size
+        ds_database.set_start_addresses(starts)
+        ds_database.set_region_pointers(pointers)
+
+        # set user 0 register appropriately to the application data
+        txrx.write_user_many(
+            [(x, y, p, UserRegister.USER_0, start_address)
+             for x, y, p, start_address in starts],
+            f"Setting the data addresses of {type_str} vertices")
+
+    def __load_by_board(
+            self, boards: List[List[_CoreInfo]], n_threads: int,
+            uses_advanced_monitors: bool, progress: ProgressBar) -> None:
+        """
+        Loads the data of the cores using a worker per board.
+
+        Each worker reads the database through its own connection.
+
+        :param boards: The x, y, p, ethernet_x, ethernet_y of each core,
+            grouped by board
+        :param n_threads: The maximum number of boards to load at once
+        :param uses_advanced_monitors:
+            Whether to use the gatherer of the board for large writes
+        :param progress: Updated as each core is loaded
+        """
+        direct_writer: _Writer = FecDataView.get_transceiver().write_memory
+
+        def load_board(cores: List[_CoreInfo]) -> Iterator[_CoreInfo]:
+            monitor_writer = direct_writer
+            if uses_advanced_monitors:
+                _, _, _, eth_x, eth_y = cores[0]
+                gatherer = FecDataView.get_gatherer_by_xy(eth_x, eth_y)
+                monitor_writer = gatherer.send_data_into_spinnaker
+            with DsSqlliteDatabase() as ds_database:
+                for core in cores:
+                    x, y, p, _, _ = core
+                    self.__python_load_and_check_core(
+                        ds_database, x, y, p, direct_writer, monitor_writer)
+                    yield core
+
+        with BoardWorkers(
+                boards, load_board, n_threads, "DataSpecLoader") as workers:
+            for _ in workers:
+                progress.update()
+        progress.end()
+
+    def __python_load_and_check_core(
+            self, ds_database: DsSqlliteDatabase, x: int, y: int, p: int,
+            direct_writer: _Writer, monitor_writer: _Writer) -> None:
+        written = self.__python_load_core(
+            ds_database, x, y, p, direct_writer, monitor_writer)
+        to_write = ds_database.get_memory_to_write(x, y, p)
+        if written != to_write:
             raise DataSpecException(
-                f"For {x=} {y=} {p=} {next_pointer=} != {expected_pointer=}")
+                f"For {x=}{y=}{p=} {written=} != {to_write=}")
 
     def __python_load_core(
             self, ds_database: DsSqlliteDatabase, x: int, y: int, p: int,
@@ -216,14 +302,15 @@ class _LoadDataSpecification(object):
         pointer_table = numpy.zeros(
             MAX_MEM_REGIONS, dtype=TABLE_TYPE)
 
-        for region_num, pointer, content in \
-                ds_database.get_region_pointers_and_content(x, y, p):
+        for region_num, pointer, content, checksum in \
+                ds_database.get_region_pointers_contents_and_checksums(
+                    x, y, p):
             if pointer is None:
                 raise DataSpecException(
                     f"{x=} {y=} {p=} {region_num=} has a unsatisfied pointer")
             pointer_table[region_num]["pointer"] = pointer
 
-            if content is None:
+            if content is None or checksum is None:
                 continue
 
             n_bytes = len(content)
@@ -235,9 +322,7 @@ class _LoadDataSpecification(object):
             if n_bytes % BYTES_PER_WORD != 0:
                 n_bytes += BYTES_PER_WORD - n_bytes % BYTES_PER_WORD
             pointer_table[region_num]["n_words"] = n_bytes / BYTES_PER_WORD
-            n_data = numpy.array(content, dtype="uint8")
-            pointer_table[region_num]["checksum"] = \
-                int(numpy.sum(n_data.view("uint32"))) & 0xFFFFFFFF
+            pointer_table[region_num]["checksum"] = checksum
 
         base_address = ds_database.get_start_address(x, y, p)
         header = numpy.array([APPDATA_MAGIC_NUM, DSE_VERSION], dtype="<u4")
@@ -252,30 +337,3 @@ class _LoadDataSpecification(object):
             monitor_writer(x, y, base_address, to_write)
         written += len(to_write)
         return written
-
-    def __malloc_region_storage(
-            self, x: int, y: int, p: int, size: int) -> int:
-        """
-        Allocates the storage for all DSG regions on the core and tells
-        the core and our caller where that storage is.
-
-        :param x:
-        :param y:
-        :param p:
-        :param size:
-            The total size of all storage for regions on that core, including
-            for the header metadata.
-        :return: address of region header table (not yet filled)
-        """
-        txrx = FecDataView.get_transceiver()
-
-        # allocate memory where the app data is going to be written; this
-        # raises an exception in case there is not enough SDRAM to allocate
-        start_address = txrx.malloc_sdram(
-            x, y, size, FecDataView.get_app_id(),
-            tag=CORE_DATA_SDRAM_BASE_TAG + p)
-
-        # set user 0 register appropriately to the application data
-        txrx.write_user(x, y, p, UserRegister.USER_0, start_address)
-
-        return start_address
@@ -12,42 +12,102 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from collections import defaultdict
+from contextlib import nullcontext
+from itertools import groupby
 import logging
+import os
 import traceback
-from typing import Iterable, List
+from typing import (
+    Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple)
+
+from typing_extensions import TypeAlias
+
+from spinn_utilities.config_holder import get_config_int
 from spinn_utilities.log import FormatAdapter
 from spinn_utilities.progress_bar import ProgressBar
+from spinn_utilities.typing.coords import XY, XYP
+
+from spinnman.constants import UDP_MESSAGE_MAX_SIZE
+
 from pacman.model.placements import Placement
+
+from spinn_front_end_common.data import FecDataView
+from spinn_front_end_common.interface.ds import DsSqlliteDatabase
 from spinn_front_end_common.interface.provenance import (
-    AbstractProvidesProvenanceDataFromMachine)
+    AbstractProvidesProvenanceDataFromMachine,
+    ProvenanceWriter, ProvidesProvenanceDataFromMachineImpl)
+from spinn_front_end_common.utilities.board_workers import BoardWorkers
+from spinn_front_end_common.utilities.exceptions import DsDatabaseException
+
+# The gatherer reads the provenance regions of the vertices on their behalf
+# pylint: disable=protected-access
 
 logger = FormatAdapter(logging.getLogger(__name__))
 
+#: The index of a placement and either the data read or the error
+_Read: TypeAlias = Tuple[int, Optional[Sequence[int]], Optional[str]]
+#: The start and end address of the memory allocated to a core
+_Allocation: TypeAlias = Tuple[int, int]
+#: The index of a placement, the placement, the address of its provenance
+#: region if known and the memory allocated to its core if known
+_ToRead: TypeAlias = Tuple[
+    int, Placement, Optional[int], Optional[_Allocation]]
+
+#: The SCP read responses SpiNNMan has in flight at once; another read
+#: costs at least the round trip in which these would have arrived
+_READS_IN_FLIGHT = 8
+
+#: The most unused bytes read between two provenance regions rather than
+#: reading them separately
+_MAX_READ_GAP = _READS_IN_FLIGHT * UDP_MESSAGE_MAX_SIZE
+
 
 def placements_provenance_gatherer(
         n_placements: int, placements: Iterable[Placement]) -> None:
     """
     Gets provenance information from the specified placements.
 
+    The provenance regions whose addresses are known from the Data Spec
+    database are read a chip at a time, with regions close to each other
+    in the memory allocated to the cores read together.
+
     :param n_placements: Number of placements to gather
     :param placements:
         The placements of the vertices to gather data form.
         May not be all placements so don't use View
     """
-    errors: List[str] = list()
+    # The errors found, with the index of the placement they were found on
+    errors: List[Tuple[int, str]] = list()
 
     progress = ProgressBar(n_placements, "Getting provenance data")
 
-    # retrieve provenance data from any cores that provide data
-    for placement in progress.over(placements):
-        _add_placement_provenance(placement, errors)
+    placements = list(placements)
+    by_chip = _plan_reads(placements)
+    n_threads = get_config_int("Reports", "n_provenance_threads")
+    if n_threads > 1:
+        _gather_by_board(placements, by_chip, n_threads, errors, progress)
+    else:
+        chip_of = {index: xy for xy, to_read in by_chip.items()
+                   for index, _, _, _ in to_read}
+
+        def read_chip(index: int) -> List[_Read]:
+            x, y = chip_of[index]
+            return _read_chip(x, y, by_chip.pop((x, y)))
+
+        _parse_in_order(
+            list(enumerate(placements)), read_chip, errors, progress)
+    progress.end()
     if errors:
         logger.warning("Errors found during provenance gathering:")
-        for error in errors:
+        # Sorting is stable so errors of one placement stay in order
+        for _, error in sorted(errors, key=lambda e: e[0]):
             logger.warning("{}", error)
 
 
-def _add_placement_provenance(placement: Placement, errors: List[str]) -> None:
+def _add_placement_provenance(
+        index: int, placement: Placement,
+        errors: List[Tuple[int, str]]) -> None:
     # retrieve provenance data from any cores that provide data
     if isinstance(
             placement.vertex, AbstractProvidesProvenanceDataFromMachine):
@@ -55,4 +115,241 @@ def _add_placement_provenance(placement: Placement, errors: List[str]) -> None:
         try:
             placement.vertex.get_provenance_data_from_machine(placement)
         except Exception:  # pylint: disable=broad-except
-            errors.append(traceback.format_exc())
+            errors.append((index, traceback.format_exc()))
+
+
+def _is_read_separately(placement: Placement) -> bool:
+    """
+    Whether the provenance of the placement can be read from the machine
+    separately from it being parsed.
+
+    This is only known for vertices that use the standard reading of
+    :py:class:`ProvidesProvenanceDataFromMachineImpl`.
+
+    :param placement:
+    """
+    return (isinstance(
+                placement.vertex, ProvidesProvenanceDataFromMachineImpl) and
+            type(placement.vertex).get_provenance_data_from_machine is
+            ProvidesProvenanceDataFromMachineImpl
+            .get_provenance_data_from_machine)
+
+
+def _parses_into_writer(placement: Placement) -> bool:
+    """
+    Whether the provenance of the placement is read separately and can be
+    parsed into a writer shared with other placements.
+
+    :param placement:
+    """
+    return (_is_read_separately(placement) and
+            isinstance(placement.vertex,
+                       ProvidesProvenanceDataFromMachineImpl) and
+            placement.vertex._parses_into_writer())
+
+
+def _plan_reads(placements: List[Placement]) -> Dict[XY, List[_ToRead]]:
+    """
+    Groups the placements whose provenance can be read separately by chip.
+
+    :param placements: All the placements being gathered
+    :return: The placements to read on each chip
+    """
+    by_chip: Dict[XY, List[_ToRead]] = defaultdict(list)
+    if (FecDataView.has_ds_database_path() and
+            os.path.exists(FecDataView.get_ds_database_path())):
+        with DsSqlliteDatabase() as ds_database:
+            allocations: Dict[XYP, _Allocation] = {
+                xyp: (start, start + size)
+                for xyp, start, size, _ in ds_database.get_info_for_cores()
+                if start is not None}
+            for index, placement in enumerate(placements):
+                if _is_read_separately(placement):
+                    by_chip[placement.x, placement.y].append(
+                        (index, placement,
+                         _get_region_address(ds_database, placement),
+                         allocations.get(
+                             (placement.x, placement.y, placement.p))))
+    else:
+        for index, placement in enumerate(placements):
+            if _is_read_separately(placement):
+                by_chip[placement.x, placement.y].append(
+                    (index, placement, None, None))
+    return by_chip
+
+
+def _get_region_address(
+        ds_database: DsSqlliteDatabase, placement: Placement) -> Optional[int]:
+    """
+    Gets the address of the provenance region of the placement as loaded,
+    if the standard reading of the region is used.
+
+    :param ds_database: The database the data specifications were loaded
+        from
+    :param placement:
+    :return: The address or None if it is not known
+    """
+    vertex = placement.vertex
+    assert isinstance(vertex, ProvidesProvenanceDataFromMachineImpl)
+    if (type(vertex)._read_provenance_data is not
+            ProvidesProvenanceDataFromMachineImpl._read_provenance_data):
+        return None
+    try:
+        return ds_database.get_region_pointer(
+            placement.x, placement.y, placement.p,
+            vertex._provenance_region_id)
+    except DsDatabaseException:
+        return None
+
+
+def _read_chip(x: int, y: int, to_read: List[_ToRead]) -> List[_Read]:
+    """
+    Reads the provenance of the placements on a chip.
+
+    The regions with a known address are read in as few reads as possible
+    without reading more than :py:const:`_MAX_READ_GAP` unused bytes
+    between regions, or any bytes not allocated to the cores read.
+    Any others are read by their vertex.
+
+    :param x: X coordinate of the chip
+    :param y: Y coordinate of the chip
+    :param to_read: The placements to read on the chip
+    :return: The data read or the error for each placement
+    """
+    results: List[_Read] = list()
+    regions: List[Tuple[
+        int, int, int, ProvidesProvenanceDataFromMachineImpl,
+        Optional[_Allocation]]] = list()
+    for index, placement, address, allocation in to_read:
+        vertex = placement.vertex
+        assert isinstance(vertex, ProvidesProvenanceDataFromMachineImpl)
+        if address is None:
+            try:
+                results.append(
+                    (index, vertex._read_provenance_data(placement), None))
+            except Exception:  # pylint: disable=broad-except
+                results.append((index, None, traceback.format_exc()))
+        else:
+            size = vertex.get_provenance_data_size(
+                vertex._n_additional_data_items)
+            regions.append((address, size, index, vertex, allocation))
+    regions.sort(key=lambda region: region[0])
+
+    start = 0
+    while start < len(regions):
+        first_address, size, _, _, allocation = regions[start]
+        end_address = first_address + size
+        # The end of the memory allocated to the cores read so far
+        allocated_to = allocation[1] if allocation else None
+        end = start + 1
+        while end < len(regions):
+            address, size, _, _, allocation = regions[end]
+            if (allocated_to is None or allocation is None or
+                    allocation[0] > allocated_to or
+                    address - end_address > _MAX_READ_GAP):
+                break
+            end_address = max(end_address, address + size)
+            allocated_to = max(allocated_to, allocation[1])
+            end += 1
+        try:
+            data = FecDataView.read_memory(
+                x, y, first_address, end_address - first_address)
+            for address, _, index, region_vertex, _ in regions[start:end]:
+                results.append((index, region_vertex._unpack_provenance_data(
+                    data, address - first_address), None))
+        except Exception:  # pylint: disable=broad-except
+            error = traceback.format_exc()
+            for _, _, index, _, _ in regions[start:end]:
+                results.append((index, None, error))
+        start = end
+    return results
+
+
+def _parse_in_order(
+        placements: List[Tuple[int, Placement]],
+        read_more: Callable[[int], List[_Read]],
+        errors: List[Tuple[int, str]], progress: ProgressBar) -> None:
+    """
+    Parses the provenance of the placements in order, so the provenance is
+    stored in the same order whichever order the data is read in.
+
+    Placements whose reading can not be separated from the parsing are
+    read and parsed in turn.
+    Each run of placements that can be parsed into a shared writer is
+    written by one writer; the others open their own, so no writer is
+    held open while they do.
+
+    :param placements: The placements to parse, each with its index
+    :param read_more:
+        Called with the index of a placement not yet read to get more data
+    :param errors: Where to add the errors found
+    :param progress: Updated as each placement is done
+    """
+    read: Dict[int, _Read] = dict()
+    for shared, run in groupby(
+            placements, key=lambda item: _parses_into_writer(item[1])):
+        with (ProvenanceWriter() if shared else nullcontext()) as db:
+            for index, placement in run:
+                progress.update()
+                if not _is_read_separately(placement):
+                    _add_placement_provenance(index, placement, errors)
+                    continue
+                while index not in read:
+                    for result in read_more(index):
+                        read[result[0]] = result
+                _, data, error = read.pop(index)
+                if error is not None:
+                    errors.append((index, error))
+                    continue
+                vertex = placement.vertex
+                assert isinstance(
+                    vertex, ProvidesProvenanceDataFromMachineImpl)
+                assert data is not None
+                try:
+                    vertex.parse_provenance_data(placement, data, db)
+                except Exception:  # pylint: disable=broad-except
+                    errors.append((index, traceback.format_exc()))
+
+
+def _gather_by_board(
+        placements: List[Placement], by_chip: Dict[XY, List[_ToRead]],
+        n_threads: int, errors: List[Tuple[int, str]],
+        progress: ProgressBar) -> None:
+    """
+    Gets the provenance reading the chips of each board in a worker.
+
+    The data read is parsed and stored by this thread alone.
+    The vertices that read their own provenance do so only once the
+    workers have finished, so that only one thread talks to a board at a
+    time.
+
+    :param placements: All the placements being gathered
+    :param by_chip: The placements to read on each chip
+    :param n_threads: The maximum number of boards to read at once
+    :param errors: Where to add the errors found
+    :param progress: Updated as each placement is done
+    """
+    by_board: Dict[XY, List[XY]] = defaultdict(list)
+    for x, y in by_chip:
+        chip = FecDataView.get_chip_at(x, y)
+        by_board[chip.nearest_ethernet_x, chip.nearest_ethernet_y].append(
+            (x, y))
+
+    def read_board(chips: List[XY]) -> Iterator[List[_Read]]:
+        for x, y in chips:
+            yield _read_chip(x, y, by_chip[x, y])
+
+    separate = list()
+    own = list()
+    for index, placement in enumerate(placements):
+        if _is_read_separately(placement):
+            separate.append((index, placement))
+        else:
+            own.append((index, placement))
+
+    with BoardWorkers(list(by_board.values()), read_board, n_threads,
+                      "ProvenanceReader") as workers:
+        results = iter(workers)
+        _parse_in_order(
+            separate, lambda _index: next(results), errors, progress)
+    _parse_in_order(own, lambda _index: [], errors, progress)
@@ -12,8 +12,11 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from collections import defaultdict
 import logging
-from typing import Dict, Optional, Set
+from typing import Dict, Iterator, List, Optional, Set, Tuple, Union
+from typing_extensions import TypeAlias
+from spinn_utilities.config_holder import get_config_int
 from spinn_utilities.progress_bar import ProgressBar
 from spinn_utilities.log import FormatAdapter
 from spinn_utilities.typing.coords import XY
@@ -23,10 +26,14 @@ from spinnman.model import RouterDiagnostics
 from pacman.model.routing_tables import AbstractMulticastRoutingTable
 from spinn_front_end_common.data import FecDataView
 from spinn_front_end_common.interface.provenance import ProvenanceWriter
+from spinn_front_end_common.utilities.board_workers import BoardWorkers
 from spinn_front_end_common.utilities.utility_objs import ReInjectionStatus
 
 logger = FormatAdapter(logging.getLogger(__name__))
 
+#: The diagnostics read from a router or the error raised reading them
+_Diagnostics: TypeAlias = Union[RouterDiagnostics, Exception]
+
 
 def router_provenance_gatherer(provenance_prefix: str = "") -> None:
     """
@@ -41,47 +48,122 @@ class _RouterProvenanceGatherer(object):
     """
     Gathers diagnostics from the routers.
     """
-    __slots__ = ()
+    __slots__ = ("__read", "__more")
+
+    def __init__(self) -> None:
+        # The diagnostics read so far by the board workers
+        self.__read: Dict[XY, _Diagnostics] = dict()
+        # The diagnostics still to come from the board workers, if used
+        self.__more: Optional[Iterator[Tuple[XY, _Diagnostics]]] = None
 
     def add_router_provenance_data(self, provenance_prefix: str) -> None:
         """
         Writes the provenance data of the router diagnostics
 
+        If configured to use more than one thread, the diagnostics of the
+        routers on each board are read in parallel, but are still written
+        by this thread in the same order.
+
         :param provenance_prefix: The prefix to add to the provenance names
         """
         count = len(FecDataView.get_uncompressed().routing_tables) \
             + FecDataView.get_machine().n_chips + 1
         progress = ProgressBar(count, "Getting Router Provenance")
 
-        seen_chips: Set[XY] = set()
-
-        # get all extra monitor core data if it exists
+        # get all extra monitor core data if it exists; this is done before
+        # any workers start so only one thread talks to a board at a time
         reinjection_data: Optional[Dict[Chip, ReInjectionStatus]] = None
         if FecDataView.has_monitors():
             monitor = FecDataView.get_monitor_by_xy(0, 0)
             reinjection_data = monitor.get_reinjection_status_for_vertices()
         progress.update()
 
-        for router_table in progress.over(
-                FecDataView.get_uncompressed().routing_tables, False):
-            seen_chips.add(self._add_router_table_diagnostic(
-                router_table, reinjection_data, provenance_prefix))
+        n_threads = get_config_int("Reports", "n_router_provenance_threads")
+        if n_threads <= 1:
+            self.__add_router_provenance_data(
+                provenance_prefix, reinjection_data, progress)
+            return
+
+        by_board: Dict[XY, List[Chip]] = defaultdict(list)
+        for chip in FecDataView.get_machine().chips:
+            by_board[chip.nearest_ethernet_x, chip.nearest_ethernet_y].append(
+                chip)
+        with BoardWorkers(list(by_board.values()), self.__read_board,
+                          n_threads, "RouterProvenanceReader") as workers:
+            self.__more = iter(workers)
+            try:
+                self.__add_router_provenance_data(
+                    provenance_prefix, reinjection_data, progress)
+            finally:
+                self.__more = None
+                self.__read.clear()
+
+    @staticmethod
+    def __read_board(chips: List[Chip]) -> Iterator[Tuple[XY, _Diagnostics]]:
+        """
+        Reads the diagnostics of the routers of the chips of a board.
+
+        :param chips: The chips on the board
+        :return: The diagnostics or the error for each chip read
+        """
+        transceiver = FecDataView.get_transceiver()
+        for chip in chips:
+            diagnostics: _Diagnostics
+            try:
+                diagnostics = transceiver.get_router_diagnostics(
+                    chip.x, chip.y)
+            except Exception as ex:  # pylint: disable=broad-except
+                diagnostics = ex
+            yield (chip.x, chip.y), diagnostics
+
+    def __add_router_provenance_data(
+            self, provenance_prefix: str,
+            reinjection_data: Optional[Dict[Chip, ReInjectionStatus]],
+            progress: ProgressBar) -> None:
+        seen_chips: Set[XY] = set()
 
-        # Get what info we can for chips where there are problems or no table
-        for chip in progress.over(sorted(
-                FecDataView.get_machine().chips, key=lambda c: (c.x, c.y))):
-            if (chip.x, chip.y) not in seen_chips:
-                self._add_unseen_router_chip_diagnostic(
-                    chip, reinjection_data, provenance_prefix)
+        # One writer so that the rows of all the routers are batched
+        with ProvenanceWriter() as db:
+            for router_table in progress.over(
+                    FecDataView.get_uncompressed().routing_tables, False):
+                seen_chips.add(self._add_router_table_diagnostic(
+                    router_table, reinjection_data, provenance_prefix, db))
+
+            # Get what info we can for chips where there are problems or no
+            # table
+            for chip in progress.over(sorted(
+                    FecDataView.get_machine().chips,
+                    key=lambda c: (c.x, c.y))):
+                if (chip.x, chip.y) not in seen_chips:
+                    self._add_unseen_router_chip_diagnostic(
+                        chip, reinjection_data, provenance_prefix, db)
 
     def __get_router_diagnostics(self, chip: Chip) -> RouterDiagnostics:
-        return FecDataView.get_transceiver().get_router_diagnostics(
-            chip.x, chip.y)
+        """
+        :param chip: The chip of the router
+        :return: The diagnostics of the router
+        :raise SpinnmanException:
+            If the diagnostics could not be read, or were never read
+        """
+        if self.__more is None:
+            return FecDataView.get_transceiver().get_router_diagnostics(
+                chip.x, chip.y)
+        while (chip.x, chip.y) not in self.__read:
+            item = next(self.__more, None)
+            if item is None:
+                raise SpinnmanException(
+                    f"The router on {chip.x}, {chip.y} was not read")
+            xy, read = item
+            self.__read[xy] = read
+        diagnostics = self.__read[chip.x, chip.y]
+        if isinstance(diagnostics, Exception):
+            raise diagnostics
+        return diagnostics
 
     def _add_router_table_diagnostic(
             self, table: AbstractMulticastRoutingTable,
             reinjection_data: Optional[Dict[Chip, ReInjectionStatus]],
-            prefix: str) -> XY:
+            prefix: str, db: ProvenanceWriter) -> XY:
         chip = table.chip
         try:
             diagnostics = self.__get_router_diagnostics(chip)
@@ -92,13 +174,13 @@ class _RouterProvenanceGatherer(object):
             return (-1, -1)  # Not a chip location
         status = self.__get_status(reinjection_data, chip)
         self.__router_diagnostics(
-            chip, diagnostics, status, True, table, prefix)
+            chip, diagnostics, status, True, table, prefix, db)
         return chip.x, chip.y
 
     def _add_unseen_router_chip_diagnostic(
             self, chip: Chip,
             reinjection_data: Optional[Dict[Chip, ReInjectionStatus]],
-            prefix: str) -> None:
+            prefix: str, db: ProvenanceWriter) -> None:
         try:
             diagnostics = self.__get_router_diagnostics(chip)
         except SpinnmanException:
@@ -109,7 +191,7 @@ class _RouterProvenanceGatherer(object):
                 diagnostics.n_external_multicast_packets):
             status = self.__get_status(reinjection_data, chip)
             self.__router_diagnostics(
-                chip, diagnostics, status, False, None, prefix)
+                chip, diagnostics, status, False, None, prefix, db)
 
     @staticmethod
     def __get_status(
@@ -121,7 +203,7 @@ class _RouterProvenanceGatherer(object):
             self, chip: Chip, diagnostics: RouterDiagnostics,
             status: Optional[ReInjectionStatus], expected: bool,
             table: Optional[AbstractMulticastRoutingTable],
-            prefix: str) -> None:
+            prefix: str, db: ProvenanceWriter) -> None:
         """
         Describes the router diagnostics for one router.
 
@@ -131,6 +213,8 @@ class _RouterProvenanceGatherer(object):
             the data gained from the extra monitor re-injection subsystem
         :param expected:
         :param table: the router table generated by the PACMAN tools
+        :param prefix: The prefix to add to the provenance names
+        :param db: Where to write the provenance
         """
         # simplify the if by making components of it outside.
         has_dropped = (diagnostics.n_dropped_multicast_packets > 0)
@@ -142,168 +226,167 @@ class _RouterProvenanceGatherer(object):
             diagnostics.n_dropped_multicast_packets)
         x, y = chip.x, chip.y
 
-        with ProvenanceWriter() as db:
-            db.insert_router(
-                x, y, f"{prefix}Local_Multicast_Packets",
-                diagnostics.n_local_multicast_packets, expected)
-
-            db.insert_router(
-                x, y, f"{prefix}External_Multicast_Packets",
-                diagnostics.n_external_multicast_packets, expected)
-
-            db.insert_router(
-                x, y, f"{prefix}Dropped_Multicast_Packets",
-                diagnostics.n_dropped_multicast_packets, expected)
-            if has_dropped and (not has_reinjection or missing_stuff):
-                db.insert_report(
-                    f"The router on {x}, {y} has dropped "
-                    f"{diagnostics.n_dropped_multicast_packets} "
-                    f"multicast route packets. "
-                    f"Try increasing the machine_time_step and/or the time "
-                    f"scale factor or reducing the number of atoms per core.")
-
+        db.insert_router(
+            x, y, f"{prefix}Local_Multicast_Packets",
+            diagnostics.n_local_multicast_packets, expected)
+
+        db.insert_router(
+            x, y, f"{prefix}External_Multicast_Packets",
+            diagnostics.n_external_multicast_packets, expected)
+
+        db.insert_router(
+            x, y, f"{prefix}Dropped_Multicast_Packets",
+            diagnostics.n_dropped_multicast_packets, expected)
+        if has_dropped and (not has_reinjection or missing_stuff):
+            db.insert_report(
+                f"The router on {x}, {y} has dropped "
+                f"{diagnostics.n_dropped_multicast_packets} "
+                f"multicast route packets. "
+                f"Try increasing the machine_time_step and/or the time "
+                f"scale factor or reducing the number of atoms per core.")
+
+        db.insert_router(
+            x, y,
+            f"{prefix}Dropped_Multicast_Packets_via_local_transmission",
+            diagnostics.user_3, expected)
+        if diagnostics.user_3 > 0:
+            db.insert_report(
+                f"The router on {x}, {y} has dropped {diagnostics.user_3} "
+                "multicast packets that were transmitted by local cores. "
+                "This occurs where the router has no entry associated "
+                "with the multicast key. "
+                "Try investigating the keys allocated to the vertices "
+                "and the router table entries for this chip.")
+
+        db.insert_router(
+            x, y, f"{prefix}default_routed_external_multicast_packets",
+            diagnostics.user_2, expected)
+        if diagnostics.user_2 > 0 and not (
+                table and table.number_of_defaultable_entries):
+            db.insert_report(
+                f"The router on {x}, {y} has default routed "
+                f"{diagnostics.user_2} multicast packets, but the router "
+                f"table did not expect any default routed packets. "
+                f"This occurs where the router has no entry associated "
+                f"with the multicast key. "
+                f"Try investigating the keys allocated to the vertices "
+                f"and the router table entries for this chip.")
+
+        if table:
             db.insert_router(
-                x, y,
-                f"{prefix}Dropped_Multicast_Packets_via_local_transmission",
-                diagnostics.user_3, expected)
-            if diagnostics.user_3 > 0:
-                db.insert_report(
-                    f"The router on {x}, {y} has dropped {diagnostics.user_3} "
-                    "multicast packets that were transmitted by local cores. "
-                    "This occurs where the router has no entry associated "
-                    "with the multicast key. "
-                    "Try investigating the keys allocated to the vertices "
-                    "and the router table entries for this chip.")
-
-            db.insert_router(
-                x, y, f"{prefix}default_routed_external_multicast_packets",
-                diagnostics.user_2, expected)
-            if diagnostics.user_2 > 0 and not (
-                    table and table.number_of_defaultable_entries):
-                db.insert_report(
-                    f"The router on {x}, {y} has default routed "
-                    f"{diagnostics.user_2} multicast packets, but the router "
-                    f"table did not expect any default routed packets. "
-                    f"This occurs where the router has no entry associated "
-                    f"with the multicast key. "
-                    f"Try investigating the keys allocated to the vertices "
-                    f"and the router table entries for this chip.")
-
-            if table:
-                db.insert_router(
-                    x, y, f"{prefix}Entries", table.number_of_entries,
-                    expected)
-                routes = set()
-                for ent in table.multicast_routing_entries:
-                    routes.add(ent.spinnaker_route)
-                db.insert_router(x, y, "Unique_Routes", len(routes), expected)
-
-            db.insert_router(
-                x, y, f"{prefix}Local_P2P_Packets",
-                diagnostics.n_local_peer_to_peer_packets, expected)
-
-            db.insert_router(
-                x, y, f"{prefix}External_P2P_Packets",
-                diagnostics.n_external_peer_to_peer_packets, expected)
-
-            db.insert_router(
-                x, y, f"{prefix}Dropped_P2P_Packets",
-                diagnostics.n_dropped_peer_to_peer_packets, expected)
-
-            db.insert_router(
-                x, y, f"{prefix}Local_NN_Packets",
-                diagnostics.n_local_nearest_neighbour_packets, expected)
-
-            db.insert_router(
-                x, y, f"{prefix}External_NN_Packets",
-                diagnostics.n_external_nearest_neighbour_packets, expected)
-
-            db.insert_router(
-                x, y, f"{prefix}Dropped_NN_Packets",
-                diagnostics.n_dropped_nearest_neighbour_packets, expected)
-
-            db.insert_router(
-                x, y, f"{prefix}Local_FR_Packets",
-                diagnostics.n_local_fixed_route_packets, expected)
-
-            db.insert_router(
-                x, y, f"{prefix}External_FR_Packets",
-                diagnostics.n_external_fixed_route_packets, expected)
-
-            db.insert_router(
-                x, y, f"{prefix}Dropped_FR_Packets",
-                diagnostics.n_dropped_fixed_route_packets, expected)
-            if diagnostics.n_dropped_fixed_route_packets > 0:
-                db.insert_report(
-                    f"The router on chip {x}:{y} dropped "
-                    f"{diagnostics.n_dropped_fixed_route_packets} fixed "
-                    f"route packets. "
-                    f"This is indicative of an error within the data "
-                    f"extraction process as this is the only expected user of "
-                    "fixed route packets.")
-
-            db.insert_router(
-                x, y, f"{prefix}Error status", diagnostics.error_status,
+                x, y, f"{prefix}Entries", table.number_of_entries,
                 expected)
-            if diagnostics.error_status > 0:
-                db.insert_report(
-                    f"The router on {x}, {y} has a non-zero error status. "
-                    f"This could indicate a hardware fault. "
-                    f"The errors set are {diagnostics.errors_set}, and the "
-                    f"error count is {diagnostics.error_count}")
-
-            if status is None:
-                return  # rest depends on status
-
-            db.insert_router(
-                x, y, f"{prefix}Received_For_Reinjection",
-                status.n_dropped_packets, expected)
-
-            db.insert_router(
-                x, y, f"{prefix}Missed_For_Reinjection",
-                status.n_missed_dropped_packets, expected)
-            if status.n_missed_dropped_packets > 0:
-                db.insert_report(
-                    f"The extra monitor on {x}, {y} has missed "
-                    f"{status.n_missed_dropped_packets} packets.")
-
-            db.insert_router(
-                x, y, f"{prefix}Reinjection_Overflows",
-                status.n_dropped_packet_overflows, expected,)
-            if status.n_dropped_packet_overflows > 0:
-                db.insert_report(
-                    f"The extra monitor on {x}, {y} has dropped "
-                    f"{status.n_dropped_packet_overflows} packets.")
-
-            db.insert_router(
-                x, y, f"{prefix}Reinjected", status.n_reinjected_packets,
-                expected)
-
-            db.insert_router(
-                x, y, f"{prefix}Dumped_from_a_Link", status.n_link_dumps,
-                expected)
-            if status.n_link_dumps > 0:
-                db.insert_report(
-                    f"The extra monitor on {x}, {y} has detected that "
-                    f"{status.n_link_dumps} packets were dumped from "
-                    f"outgoing links {status.links_dropped_from} of this "
-                    f"chip's router. This often occurs "
-                    f"when external devices are used in the script but not "
-                    f"connected to the communication fabric correctly. "
-                    f"These packets may have been reinjected multiple times "
-                    f"and so this number may be an overestimate.")
-
-            db.insert_router(
-                x, y, f"{prefix}Dumped_from_a_processor",
-                status.n_processor_dumps, expected)
-            if status.n_processor_dumps > 0:
-                db.insert_report(
-                    f"The extra monitor on {x}, {y} has detected that "
-                    f"{status.n_processor_dumps} packets were dumped from "
-                    f"cores {status.processors_dropped_from} failing to take "
-                    "the packet. This often occurs when "
-                    "the executable has crashed or has not been given a "
-                    "multicast packet callback. It can also result from the "
-                    "core taking too long to process each packet. These "
-                    "packets were reinjected and so this number is likely an "
-                    "overestimate.")
+            routes = set()
+            for ent in table.multicast_routing_entries:
+                routes.add(ent.spinnaker_route)
+            db.insert_router(x, y, "Unique_Routes", len(routes), expected)
+
+        db.insert_router(
+            x, y, f"{prefix}Local_P2P_Packets",
+            diagnostics.n_local_peer_to_peer_packets, expected)
+
+        db.insert_router(
+            x, y, f"{prefix}External_P2P_Packets",
+            diagnostics.n_external_peer_to_peer_packets, expected)
+
+        db.insert_router(
+            x, y, f"{prefix}Dropped_P2P_Packets",
+            diagnostics.n_dropped_peer_to_peer_packets, expected)
+
+        db.insert_router(
+            x, y, f"{prefix}Local_NN_Packets",
+            diagnostics.n_local_nearest_neighbour_packets, expected)
+
+        db.insert_router(
+            x, y, f"{prefix}External_NN_Packets",
+            diagnostics.n_external_nearest_neighbour_packets, expected)
+
+        db.insert_router(
+            x, y, f"{prefix}Dropped_NN_Packets",
+            diagnostics.n_dropped_nearest_neighbour_packets, expected)
+
+        db.insert_router(
+            x, y, f"{prefix}Local_FR_Packets",
+            diagnostics.n_local_fixed_route_packets, expected)
+
+        db.insert_router(
+            x, y, f"{prefix}External_FR_Packets",
+            diagnostics.n_external_fixed_route_packets, expected)
+
+        db.insert_router(
+            x, y, f"{prefix}Dropped_FR_Packets",
+            diagnostics.n_dropped_fixed_route_packets, expected)
+        if diagnostics.n_dropped_fixed_route_packets > 0:
+            db.insert_report(
+                f"The router on chip {x}:{y} dropped "
+                f"{diagnostics.n_dropped_fixed_route_packets} fixed "
+                f"route packets. "
+                f"This is indicative of an error within the data "
+                f"extraction process as this is the only expected user of "
+                "fixed route packets.")
+
+        db.insert_router(
+            x, y, f"{prefix}Error status", diagnostics.error_status,
+            expected)
+        if diagnostics.error_status > 0:
+            db.insert_report(
+                f"The router on {x}, {y} has a non-zero error status. "
+                f"This could indicate a hardware fault. "
+                f"The errors set are {diagnostics.errors_set}, and the "
+                f"error count is {diagnostics.error_count}")
+
+        if status is None:
+            return  # rest depends on status
+
+        db.insert_router(
+            x, y, f"{prefix}Received_For_Reinjection",
+            status.n_dropped_packets, expected)
+
+        db.insert_router(
+            x, y, f"{prefix}Missed_For_Reinjection",
+            status.n_missed_dropped_packets, expected)
+        if status.n_missed_dropped_packets > 0:
+            db.insert_report(
+                f"The extra monitor on {x}, {y} has missed "
+                f"{status.n_missed_dropped_packets} packets.")
+
+        db.insert_router(
+            x, y, f"{prefix}Reinjection_Overflows",
+            status.n_dropped_packet_overflows, expected,)
+        if status.n_dropped_packet_overflows > 0:
+            db.insert_report(
+                f"The extra monitor on {x}, {y} has dropped "
+                f"{status.n_dropped_packet_overflows} packets.")
+
+        db.insert_router(
+            x, y, f"{prefix}Reinjected", status.n_reinjected_packets,
+            expected)
+
+        db.insert_router(
+            x, y, f"{prefix}Dumped_from_a_Link", status.n_link_dumps,
+            expected)
+        if status.n_link_dumps > 0:
+            db.insert_report(
+                f"The extra monitor on {x}, {y} has detected that "
+                f"{status.n_link_dumps} packets were dumped from "
+                f"outgoing links {status.links_dropped_from} of this "
+                f"chip's router. This often occurs "
+                f"when external devices are used in the script but not "
+                f"connected to the communication fabric correctly. "
+                f"These packets may have been reinjected multiple times "
+                f"and so this number may be an overestimate.")
+
+        db.insert_router(
+            x, y, f"{prefix}Dumped_from_a_processor",
+            status.n_processor_dumps, expected)
+        if status.n_processor_dumps > 0:
+            db.insert_report(
+                f"The extra monitor on {x}, {y} has detected that "
+                f"{status.n_processor_dumps} packets were dumped from "
+                f"cores {status.processors_dropped_from} failing to take "
+                "the packet. This often occurs when "
+                "the executable has crashed or has not been given a "
+                "multicast packet callback. It can also result from the "
+                "core taking too long to process each packet. These "
+                "packets were reinjected and so this number is likely an "
+                "overestimate.")
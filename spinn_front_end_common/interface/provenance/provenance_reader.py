@@ -18,6 +18,8 @@ from typing_extensions import TypeAlias
 from spinn_utilities.typing.coords import XYP
 from spinn_front_end_common.utilities.base_database import (
     BaseDatabase, _SqliteTypes)
+from spinn_front_end_common.interface.provenance.provenance_writer import (
+    SUMMARY_TABLES)
 
 #: Basic types supported natively by SQLite
 _MonitorItem: TypeAlias = Tuple[int, int, _SqliteTypes]
@@ -147,12 +149,7 @@ class ProvenanceReader(BaseDatabase):
         :param description:
         :return: list of tuples (x, y, value)
         """
-        query = """
-            SELECT x, y, the_value
-            FROM router_provenance
-            WHERE description = ?
-            """
-        data = self.run_query(query, [description])
+        data = self.__get_by_chip("router", description)
         try:
             return cast(List[_RouterItem], data)
         except IndexError:
@@ -165,17 +162,78 @@ class ProvenanceReader(BaseDatabase):
         :param description:
         :return: list of tuples x, y, value)
         """
-        query = """
-            SELECT x, y, the_value
-            FROM monitor_provenance
-            WHERE description = ?
-            """
-        data = self.run_query(query, [description])
+        data = self.__get_by_chip("monitor", description)
         try:
             return cast(List[_MonitorItem], data)
         except IndexError:
             return []
 
+    def __get_by_chip(self, kind: str, description: str) -> List[
+            Sequence[_SqliteTypes]]:
+        """
+        Gets the values for a specific item of the routers or monitors.
+
+        If the statistics have been materialised, the value of each chip
+        with only one is read from there; only chips with more than one
+        value are read from the provenance itself.
+
+        :param kind: ``router`` or ``monitor``
+        :param description:
+        :return: list of tuples (x, y, value)
+        """
+        stats = f"{kind}_stats"
+        if self.__summary_source(stats) == stats:
+            query = f"""
+                SELECT x, y, total
+                FROM {stats}
+                WHERE description = ? AND count = 1
+                UNION ALL
+                SELECT x, y, the_value
+                FROM {kind}_provenance JOIN {stats} USING (x, y, description)
+                WHERE description = ? AND count > 1
+                """
+            return self.run_query(query, [description, description])
+        query = f"""
+            SELECT x, y, the_value
+            FROM {kind}_provenance
+            WHERE description = ?
+            """
+        return self.run_query(query, [description])
+
+    def get_summary(self, name: str) -> List[Sequence[_SqliteTypes]]:
+        """
+        Gets the rows of one of the statistics or summary views.
+
+        If the summaries have been materialised, by
+        :py:meth:`ProvenanceWriter.materialise_summaries`, the rows are read
+        from the table filled then rather than computed again.
+        Writing more values of the same kind empties the tables again.
+
+        :param name: The name of the view without the ``_view``,
+            for example ``router_summary``
+        :return: All the rows of the summary
+        :raises KeyError: If there is no summary with that name
+        """
+        if name not in SUMMARY_TABLES:
+            raise KeyError(f"No provenance summary {name}")
+        return self.run_query(f"SELECT * FROM {self.__summary_source(name)}")
+
+    def __summary_source(self, name: str) -> str:
+        """
+        Gets where to read one of the summaries from.
+
+        :param name: One of the
+            :py:const:`~.provenance_writer.SUMMARY_TABLES`
+        :return: The table if it has been filled, otherwise its view
+        """
+        # Older databases will not have the table
+        if self.run_query(
+                "SELECT name FROM sqlite_master "
+                "WHERE type = 'table' AND name = ?", [name]):
+            if self.run_query(f"SELECT 1 FROM {name} LIMIT 1"):
+                return name
+        return f"{name}_view"
+
     def messages(self) -> List[str]:
         """
         List all the provenance messages.
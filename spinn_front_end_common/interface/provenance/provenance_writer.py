@@ -13,16 +13,51 @@
 # limitations under the License.
 
 import logging
-from typing import Dict, Optional, Tuple
+from types import TracebackType
+from typing import Dict, List, Literal, Optional, Sequence, Tuple, Type
 from spinn_utilities.config_holder import (
     get_config_int_or_none, get_config_bool)
 from spinn_utilities.log import FormatAdapter
+from spinn_utilities.typing.coords import XYP
 from spinn_front_end_common.data import FecDataView
 from spinn_front_end_common.utilities.base_database import (
     BaseDatabase, _SqliteTypes)
 
 logger = FormatAdapter(logging.getLogger(__name__))
 
+_INSERT_GATHERER = """
+    INSERT INTO gatherer_provenance(
+        x, y, address, bytes, run, description, the_value)
+    VALUES(?, ?, ?, ?, ?, ?, ?)
+    """
+_INSERT_MONITOR = """
+    INSERT INTO monitor_provenance(
+        x, y, description, the_value)
+    VALUES(?, ?, ?, ?)
+    """
+_INSERT_ROUTER = """
+    INSERT INTO router_provenance(
+        x, y, description, the_value, expected)
+    VALUES(?, ?, ?, ?, ?)
+    """
+_INSERT_CORE = """
+    INSERT INTO core_provenance(
+        core_id, description, the_value)
+    VALUES(?, ?, ?)
+    """
+
+#: The tables filled by :py:meth:`ProvenanceWriter.materialise_summaries`,
+#: each from the view with the same name plus ``_view``
+SUMMARY_TABLES = (
+    "core_stats", "core_summary", "router_stats", "router_summary",
+    "monitor_stats", "monitor_summary")
+
+#: The summary tables made out of date by each kind of insert
+_SUMMARIES_OF = {
+    _INSERT_CORE: ("core_stats", "core_summary"),
+    _INSERT_ROUTER: ("router_stats", "router_summary"),
+    _INSERT_MONITOR: ("monitor_stats", "monitor_summary")}
+
 
 class ProvenanceWriter(BaseDatabase):
     """
@@ -35,9 +70,25 @@ class ProvenanceWriter(BaseDatabase):
     .. note::
         This totally relies on the way SQLite's type affinities function.
         You can't port to a different database engine without a lot of work.
+
+    .. note::
+        The core, router, monitor and gatherer values are buffered and
+        only written when enough are waiting, when :py:meth:`flush` is
+        called or when the ``with`` block exits without an error.
     """
 
-    __slots__ = ()
+    __slots__ = (
+        # Whether provenance is to be written; read once
+        "_write_provenance",
+        # The core_id of each core already looked up
+        "_core_ids",
+        # The rows waiting to be inserted by the SQL that inserts them
+        "_pending",
+        # The total number of rows waiting
+        "_n_pending")
+
+    #: The number of rows buffered before they are written
+    _FLUSH_SIZE = 10000
 
     def __init__(self, database_file: Optional[str] = None):
         """
@@ -48,6 +99,66 @@ class ProvenanceWriter(BaseDatabase):
             database will be used (suitable only for testing).
         """
         super().__init__(database_file)
+        self._write_provenance = get_config_bool(
+            "Reports", "write_provenance")
+        self._core_ids: Dict[XYP, int] = dict()
+        self._pending: Dict[str, List[Sequence[_SqliteTypes]]] = dict()
+        self._n_pending = 0
+
+    def __exit__(self, exc_type: Optional[Type[BaseException]],
+                 exc_val: Optional[BaseException],
+                 exc_tb: Optional[TracebackType]) -> Literal[False]:
+        if exc_type is None:
+            self.flush()
+        else:
+            self._pending.clear()
+            self._n_pending = 0
+        return super().__exit__(exc_type, exc_val, exc_tb)
+
+    def flush(self) -> None:
+        """
+        Writes all the buffered values to the database.
+
+        Any materialised summaries of the values written are emptied,
+        so that they are computed from the views again until next
+        materialised.
+        """
+        for sql, rows in self._pending.items():
+            self.cursor().executemany(sql, rows)
+            for table in _SUMMARIES_OF.get(sql, ()):
+                self.cursor().execute(f"DELETE FROM {table}")
+        self._pending.clear()
+        self._n_pending = 0
+
+    def __add(self, sql: str, row: Sequence[_SqliteTypes]) -> None:
+        """
+        Buffers a row to be inserted, flushing if enough are waiting.
+
+        :param sql: The SQL that inserts the row
+        :param row: The values to insert
+        """
+        if sql in self._pending:
+            self._pending[sql].append(row)
+        else:
+            self._pending[sql] = [row]
+        self._n_pending += 1
+        if self._n_pending >= self._FLUSH_SIZE:
+            self.flush()
+
+    def materialise_summaries(self) -> None:
+        """
+        Fills each of the :py:const:`SUMMARY_TABLES` from its view,
+        replacing anything put in them before.
+
+        Any buffered values are written first so they are included.
+        """
+        if not self._write_provenance:
+            return
+        self.flush()
+        for table in SUMMARY_TABLES:
+            self.cursor().execute(f"DELETE FROM {table}")
+            self.cursor().execute(
+                f"INSERT INTO {table} SELECT * FROM {table}_view")
 
     def insert_power(self, description: str, the_value: _SqliteTypes) -> None:
         """
@@ -56,7 +167,7 @@ class ProvenanceWriter(BaseDatabase):
         :param description: Type of value
         :param the_value: data
         """
-        if not get_config_bool("Reports", "write_provenance"):
+        if not self._write_provenance:
             return
         run = FecDataView.get_run_number()
         self.cursor().execute(
@@ -80,14 +191,10 @@ class ProvenanceWriter(BaseDatabase):
         :param description: type of value
         :param the_value: data
         """
-        if not get_config_bool("Reports", "write_provenance"):
+        if not self._write_provenance:
             return
-        self.cursor().execute(
-            """
-            INSERT INTO gatherer_provenance(
-                x, y, address, bytes, run, description, the_value)
-            VALUES(?, ?, ?, ?, ?, ?, ?)
-            """, [x, y, address, bytes_read, run, description, the_value])
+        self.__add(_INSERT_GATHERER, (
+            x, y, address, bytes_read, run, description, the_value))
 
     def insert_monitor(self, x: int, y: int, description: str,
                        the_value: _SqliteTypes) -> None:
@@ -101,7 +208,7 @@ class ProvenanceWriter(BaseDatabase):
         :param description: type of value
         :param the_value: data
         """
-        if get_config_bool("Reports", "write_provenance"):
+        if self._write_provenance:
             self.insert_monitor_value(x, y, description, the_value)
 
     def insert_monitor_value(self, x: int, y: int, description: str,
@@ -116,12 +223,7 @@ class ProvenanceWriter(BaseDatabase):
         :param description: type of value
         :param the_value: data
         """
-        self.cursor().execute(
-            """
-            INSERT INTO monitor_provenance(
-                x, y, description, the_value)
-            VALUES(?, ?, ?, ?)
-            """, [x, y, description, the_value])
+        self.__add(_INSERT_MONITOR, (x, y, description, the_value))
 
     def insert_router(
             self, x: int, y: int, description: str,
@@ -136,14 +238,9 @@ class ProvenanceWriter(BaseDatabase):
         :param the_value: data
         :param expected: Flag to say this data was expected
         """
-        if not get_config_bool("Reports", "write_provenance"):
+        if not self._write_provenance:
             return
-        self.cursor().execute(
-            """
-            INSERT INTO router_provenance(
-                x, y, description, the_value, expected)
-            VALUES(?, ?, ?, ?, ?)
-            """, [x, y, description, the_value, expected])
+        self.__add(_INSERT_ROUTER, (x, y, description, the_value, expected))
 
     def insert_core(
             self, x: int, y: int, p: int, description: str,
@@ -157,15 +254,13 @@ class ProvenanceWriter(BaseDatabase):
         :param description: type of value
         :param the_value: data
         """
-        if not get_config_bool("Reports", "write_provenance"):
+        if not self._write_provenance:
             return
-        core_id = self._get_core_id(x, y, p)
-        self.cursor().execute(
-            """
-            INSERT INTO core_provenance(
-                core_id, description, the_value)
-            VALUES(?, ?, ?)
-            """, [core_id, description, the_value])
+        core_id = self._core_ids.get((x, y, p))
+        if core_id is None:
+            core_id = self._get_core_id(x, y, p)
+            self._core_ids[x, y, p] = core_id
+        self.__add(_INSERT_CORE, (core_id, description, the_value))
 
     def insert_report(self, message: str) -> None:
         """
@@ -176,7 +271,7 @@ class ProvenanceWriter(BaseDatabase):
 
         :param message:
         """
-        if not get_config_bool("Reports", "write_provenance"):
+        if not self._write_provenance:
             logger.warning(message)
             return
         self.cursor().execute(
@@ -206,7 +301,7 @@ class ProvenanceWriter(BaseDatabase):
         :param description: type of value
         :param the_value: data
         """
-        if not get_config_bool("Reports", "write_provenance"):
+        if not self._write_provenance:
             return
         self.cursor().execute(
             """
@@ -226,7 +321,7 @@ class ProvenanceWriter(BaseDatabase):
 
         :param connections: {(x, y): hostname, ...} or None
         """
-        if not get_config_bool("Reports", "write_provenance"):
+        if not self._write_provenance:
             return
         if not connections:
             return
@@ -12,7 +12,10 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from typing import Sequence, Tuple
+from contextlib import nullcontext
+from functools import lru_cache
+import inspect
+from typing import Optional, Sequence, Tuple, Type, Union
 
 from spinn_utilities.abstract_base import abstractmethod
 from spinn_utilities.overrides import overrides
@@ -34,6 +37,19 @@ from .provenance_writer import ProvenanceWriter
 # mypy: disable-error-code=empty-body
 
 
+@lru_cache(maxsize=None)
+def _parses_into_writer(
+        vertex_type: Type["ProvidesProvenanceDataFromMachineImpl"]) -> bool:
+    """
+    :param vertex_type: The type of the vertex
+    :return: Whether both parse methods of the type take a writer
+    """
+    return all(
+        "db" in inspect.signature(method).parameters
+        for method in (vertex_type.parse_system_provenance_items,
+                       vertex_type.parse_extra_provenance_items))
+
+
 class ProvidesProvenanceDataFromMachineImpl(
         AbstractProvidesProvenanceDataFromMachine,
         allow_derivation=True):  # type: ignore [call-arg]
@@ -112,9 +128,21 @@ class ProvidesProvenanceDataFromMachineImpl(
         data = transceiver.read_memory(
             placement.x, placement.y, provenance_address,
             self.get_provenance_data_size(self._n_additional_data_items))
+        return self._unpack_provenance_data(data)
+
+    def _unpack_provenance_data(
+            self, data: Union[bytes, bytearray],
+            offset: int = 0) -> Sequence[int]:
+        """
+        Gets the words of provenance data from the bytes read.
+
+        :param data: The bytes read from the machine
+        :param offset: Where in the bytes the provenance region starts
+        :return: The words of raw provenance data
+        """
         return n_word_struct(
             self.N_SYSTEM_PROVENANCE_WORDS +
-            self._n_additional_data_items).unpack_from(data)
+            self._n_additional_data_items).unpack_from(data, offset)
 
     @staticmethod
     def _get_provenance_placement_description(
@@ -131,7 +159,8 @@ class ProvidesProvenanceDataFromMachineImpl(
 
     def parse_system_provenance_items(
             self, label: str, x: int, y: int, p: int,
-            provenance_data: Sequence[int]) -> None:
+            provenance_data: Sequence[int],
+            db: Optional[ProvenanceWriter] = None) -> None:
         """
         Given some words of provenance data, convert the portion of them that
         describes the system provenance into proper provenance items.
@@ -146,12 +175,15 @@ class ProvidesProvenanceDataFromMachineImpl(
         :param y: y coordinate of the core where this core
         :param p: virtual id of the core
         :param provenance_data:
+        :param db: Where to write the provenance; if omitted a writer is
+            opened just for this vertex
         """
         (tx_overflow, cb_overload, dma_overload, user_overload, tic_overruns,
          tic_overrun_max) = provenance_data[:self.N_SYSTEM_PROVENANCE_WORDS]
 
         # save provenance data items
-        with ProvenanceWriter() as db:
+        with (nullcontext(db) if db is not None
+              else ProvenanceWriter()) as db:
             db.insert_core(
                 x, y, p, self._TIMES_TRANSMISSION_SPIKES_OVERRAN, tx_overflow)
             if tx_overflow != 0:
@@ -234,7 +266,8 @@ class ProvidesProvenanceDataFromMachineImpl(
 
     def parse_extra_provenance_items(
             self, label: str, x: int, y: int, p: int,
-            provenance_data: Sequence[int]) -> None:
+            provenance_data: Sequence[int],
+            db: Optional[ProvenanceWriter] = None) -> None:
         """
         Convert the remaining provenance words (those not in the standard set)
         into provenance items.
@@ -250,9 +283,11 @@ class ProvidesProvenanceDataFromMachineImpl(
         :param p: virtual id of the core
         :param provenance_data:
             The list of words of raw provenance data.
+        :param db: Where to write the provenance; if omitted a writer is
+            opened just for this vertex
         """
         if self._n_additional_data_items:
-            _ = (label, x, y, p, provenance_data)
+            _ = (label, x, y, p, provenance_data, db)
             raise NotImplementedError(
                 f"{self} provides {self._n_additional_data_items} but doesn't "
                 "parse them")
@@ -268,9 +303,50 @@ class ProvidesProvenanceDataFromMachineImpl(
         :param placement:
             Which vertex are we retrieving from, and where was it
         """
-        provenance_data = self._read_provenance_data(placement)
+        self.parse_provenance_data(
+            placement, self._read_provenance_data(placement))
+
+    @classmethod
+    def _parses_into_writer(cls) -> bool:
+        """
+        Whether the provenance can be parsed into a writer that is passed
+        in.  Overrides of the parse methods that do not take a writer open
+        their own, so must not be called while another writer has the
+        database.
+
+        :return: Whether a writer can be passed to
+            :py:meth:`parse_provenance_data`
+        """
+        return _parses_into_writer(cls)
+
+    def parse_provenance_data(
+            self, placement: Placement,
+            provenance_data: Sequence[int],
+            db: Optional[ProvenanceWriter] = None) -> None:
+        """
+        Convert the words of provenance data read from the machine into
+        provenance items.
+
+        This does not talk to the machine, so the data may have been read
+        by another thread.
+
+        :param placement:
+            Which vertex the data was read from, and where was it
+        :param provenance_data: The words of raw provenance data
+        :param db: Where to write the provenance, so that the provenance of
+            many vertices can be written together; only used if
+            :py:meth:`_parses_into_writer`
+        """
         label, x, y, p = self._get_provenance_placement_description(placement)
-        self.parse_system_provenance_items(
-            label, x, y, p, provenance_data)
-        self.parse_extra_provenance_items(
-            label, x, y, p, self._get_extra_provenance_words(provenance_data))
+        extra_data = self._get_extra_provenance_words(provenance_data)
+        if not self._parses_into_writer():
+            self.parse_system_provenance_items(
+                label, x, y, p, provenance_data)
+            self.parse_extra_provenance_items(label, x, y, p, extra_data)
+            return
+        with (nullcontext(db) if db is not None
+              else ProvenanceWriter()) as db:
+            self.parse_system_provenance_items(
+                label, x, y, p, provenance_data, db)
+            self.parse_extra_provenance_items(
+                label, x, y, p, extra_data, db)
@@ -0,0 +1,122 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from concurrent.futures import ThreadPoolExecutor
+from queue import Queue
+from threading import Event
+from types import TracebackType
+from typing import (
+    Callable, Generic, Iterable, Iterator, List, Literal, Optional, Tuple,
+    Type, TypeVar, Union)
+
+#: The work to be done on one board
+_Board = TypeVar("_Board")
+#: What the work on a board produces, a piece at a time
+_Result = TypeVar("_Result")
+
+
+class BoardWorkers(Generic[_Board, _Result]):
+    """
+    Does the work of each board in a worker thread, passing the results
+    back to the thread iterating over this.
+
+    Each worker does the work of one board a piece at a time, so anything
+    on a board that can only handle one request at a time, such as its
+    gatherer, is only used by one thread.
+
+    Use as a context manager; leaving the context cancels the boards not
+    yet started, stops the workers after the piece of work they are doing
+    and waits for them to finish.
+
+    .. code-block:: python
+
+        with BoardWorkers(boards, work, n_threads, "Reader") as workers:
+            for result in workers:
+                ...
+    """
+
+    __slots__ = (
+        "__boards", "__work", "__n_threads", "__thread_name_prefix",
+        "__results", "__abort", "__pool", "__n_running")
+
+    def __init__(
+            self, boards: List[_Board],
+            work: Callable[[_Board], Iterable[_Result]], n_threads: int,
+            thread_name_prefix: str):
+        """
+        :param boards: The work to do, one item for each board
+        :param work:
+            Does the work of a board, yielding each result as it is ready.
+            Called in a worker thread.
+        :param n_threads: The maximum number of boards to work on at once
+        :param thread_name_prefix: The prefix of the names of the workers
+        """
+        self.__boards = boards
+        self.__work = work
+        self.__n_threads = n_threads
+        self.__thread_name_prefix = thread_name_prefix
+        # Each worker adds each result, wrapped so it can not be confused
+        # with anything else, then either None when done or the error
+        self.__results: Queue[
+            Union[Tuple[_Result], BaseException, None]] = Queue()
+        self.__abort = Event()
+        self.__pool: Optional[ThreadPoolExecutor] = None
+        self.__n_running = 0
+
+    def __enter__(self) -> "BoardWorkers[_Board, _Result]":
+        if self.__boards:
+            self.__pool = ThreadPoolExecutor(
+                max_workers=max(1, min(self.__n_threads, len(self.__boards))),
+                thread_name_prefix=self.__thread_name_prefix)
+            for board in self.__boards:
+                self.__pool.submit(self.__run, board)
+            self.__n_running = len(self.__boards)
+        return self
+
+    def __exit__(self, exc_type: Optional[Type[BaseException]],
+                 exc_val: Optional[BaseException],
+                 exc_tb: Optional[TracebackType]) -> Literal[False]:
+        self.__abort.set()
+        if self.__pool is not None:
+            self.__pool.shutdown(wait=True, cancel_futures=True)
+            self.__pool = None
+        return False
+
+    def __run(self, board: _Board) -> None:
+        try:
+            # Checked before each piece of work, including the first
+            if not self.__abort.is_set():
+                for result in self.__work(board):
+                    self.__results.put((result, ))
+                    if self.__abort.is_set():
+                        break
+            self.__results.put(None)
+        except BaseException as ex:  # pylint: disable=broad-except
+            self.__results.put(ex)
+
+    def __iter__(self) -> Iterator[_Result]:
+        """
+        The results of all the boards, in the order they are ready.
+
+        :raises Exception: Whatever was raised by the work of a board
+        """
+        while self.__n_running:
+            result = self.__results.get()
+            if result is None:
+                self.__n_running -= 1
+            elif isinstance(result, BaseException):
+                self.__n_running = 0
+                raise result
+            else:
+                yield result[0]
@@ -51,7 +51,9 @@ CREATE TABLE IF NOT EXISTS recording_region(
 	recording_region_id INTEGER PRIMARY KEY AUTOINCREMENT,
 	core_id INTEGER NOT NULL
 		REFERENCES core(core_id) ON DELETE RESTRICT,
-	local_region_index INTEGER NOT NULL);
+	local_region_index INTEGER NOT NULL,
+	-- Bumped when the region is cleared so a new sidecar file is used
+	sidecar_generation INTEGER NOT NULL DEFAULT 0);
 -- Every recording region has a unique vertex and index
 CREATE UNIQUE INDEX IF NOT EXISTS recording_region_sanity ON recording_region(
 	core_id ASC, local_region_index ASC);
@@ -67,20 +69,25 @@ CREATE TABLE IF NOT EXISTS recording_data(
     extraction_id INTEGER NOT NULL
 		REFERENCES extraction(extraction_id) ON DELETE RESTRICT,
 	content BLOB NOT NULL,
+	-- length of the data once decoded
 	content_len INTEGER NOT NULL,
-    missing_data INTEGER NOT NULL);
+    missing_data INTEGER NOT NULL,
+	-- how the content is encoded; 0 raw, 1 zlib, 2 lzma
+	codec INTEGER NOT NULL DEFAULT 0,
+	-- where in the region's sidecar file the data is; NULL if in content
+	sidecar_offset INTEGER);
 -- Every recording region is extracted once per BefferExtractor run
 CREATE UNIQUE INDEX IF NOT EXISTS recording_data_sanity ON recording_data(
 	recording_region_id ASC, extraction_id ASC);
 
 CREATE VIEW IF NOT EXISTS recording_data_view AS
 	SELECT core_id, recording_region_id, extraction_id, x, y, processor, local_region_index,
-		content, content_len
+		content, content_len, codec
 FROM recording_region_view NATURAL JOIN recording_data;
 
 CREATE VIEW IF NOT EXISTS recording_data_plus_view AS
 	SELECT core_id, region_id, extraction_id, x, y, processor, local_region_index,
-		content, content_len, run_timestep, run_time_ms, n_run, n_loop, extraction_time
+		content, content_len, codec, run_timestep, run_time_ms, n_run, n_loop, extraction_time
 FROM recording_data_view NATURAL JOIN extraction_view;
 
 -- - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
@@ -105,20 +112,23 @@ CREATE TABLE IF NOT EXISTS download_data(
     extraction_id INTEGER NOT NULL
 		REFERENCES extraction(extraction_id) ON DELETE RESTRICT,
 	content BLOB NOT NULL,
+	-- length of the data once decoded
 	content_len INTEGER NOT NULL,
-    missing_data INTEGER NOT NULL);
+    missing_data INTEGER NOT NULL,
+	-- how the content is encoded; 0 raw, 1 zlib, 2 lzma
+	codec INTEGER NOT NULL DEFAULT 0);
 -- Every recording region is extracted once per BefferExtractor run
 CREATE UNIQUE INDEX IF NOT EXISTS download_data_sanity ON download_data(
 	download_region_id ASC, extraction_id ASC);
 
 CREATE VIEW IF NOT EXISTS download_data_view AS
 	SELECT core_id, download_region_id, extraction_id, x, y, processor, local_region_index,
-		content, content_len
+		content, content_len, codec
 FROM download_region_view NATURAL JOIN download_data;
 
 CREATE VIEW IF NOT EXISTS download_data_plus_view AS
 	SELECT core_id, download_region_id, extraction_id, x, y, processor, local_region_index,
-		content, content_len, run_timestep, run_time_ms, n_run, n_loop, extraction_time
+		content, content_len, codec, run_timestep, run_time_ms, n_run, n_loop, extraction_time
 FROM download_data_view NATURAL JOIN extraction_view;
 
 -- Information about how to access the connection proxying
@@ -183,6 +193,23 @@ CREATE VIEW IF NOT EXISTS monitor_summary_view AS
     FROM monitor_provenance
     GROUP BY description;
 
+-- Find the monitor values by description quickly
+CREATE INDEX IF NOT EXISTS monitor_provenance_description
+    ON monitor_provenance(description, x, y);
+
+-- Copies of monitor_stats_view and monitor_summary_view filled at the end
+-- of provenance gathering if requested
+CREATE TABLE IF NOT EXISTS monitor_stats(
+    x INTEGER NOT NULL,
+    y INTEGER NOT NULL,
+    description STRING NOT NULL,
+    min INTEGER, max INTEGER, avg FLOAT, total INTEGER, count INTEGER);
+CREATE INDEX IF NOT EXISTS monitor_stats_description
+    ON monitor_stats(description, x, y);
+CREATE TABLE IF NOT EXISTS monitor_summary(
+    description STRING NOT NULL,
+    min INTEGER, max INTEGER, avg FLOAT, total INTEGER, count INTEGER);
+
 -- - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
 -- A table holding the values for routers
 CREATE TABLE IF NOT EXISTS router_provenance(
@@ -219,6 +246,25 @@ CREATE VIEW IF NOT EXISTS router_summary_view AS
     FROM router_provenance
     GROUP BY description;
 
+-- Find the router values by description quickly
+CREATE INDEX IF NOT EXISTS router_provenance_description
+    ON router_provenance(description, x, y);
+
+-- Copies of router_stats_view and router_summary_view filled at the end
+-- of provenance gathering if requested
+CREATE TABLE IF NOT EXISTS router_stats(
+    x INTEGER NOT NULL,
+    y INTEGER NOT NULL,
+    description STRING NOT NULL,
+    min INTEGER, max INTEGER, avg FLOAT, total INTEGER, count INTEGER,
+    expected FLOAT);
+CREATE INDEX IF NOT EXISTS router_stats_description
+    ON router_stats(description, x, y);
+CREATE TABLE IF NOT EXISTS router_summary(
+    description STRING NOT NULL,
+    min INTEGER, max INTEGER, avg FLOAT, total INTEGER, count INTEGER,
+    expected FLOAT);
+
 -- - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
 -- A table holding the values for each core
 CREATE TABLE IF NOT EXISTS core_provenance(
@@ -258,6 +304,34 @@ CREATE VIEW IF NOT EXISTS core_summary_view AS
     FROM core_provenance_view
     GROUP BY description;
 
+-- Find the core values by description quickly; the core table has the x, y
+-- and p of each core_id
+CREATE INDEX IF NOT EXISTS core_provenance_description
+    ON core_provenance(description, core_id);
+
+-- Copies of core_stats_view and core_summary_view filled at the end
+-- of provenance gathering if requested
+CREATE TABLE IF NOT EXISTS core_stats(
+    core_name STRING,
+    x INTEGER NOT NULL,
+    y INTEGER NOT NULL,
+    p INTEGER NOT NULL,
+    description STRING NOT NULL,
+    min INTEGER, max INTEGER, avg FLOAT, total INTEGER, count INTEGER);
+CREATE INDEX IF NOT EXISTS core_stats_description
+    ON core_stats(description, x, y, p);
+CREATE TABLE IF NOT EXISTS core_summary(
+    description STRING NOT NULL,
+    min INTEGER, max INTEGER, avg FLOAT, total INTEGER, count INTEGER);
+
+-- The materialised core statistics include the core names, so renaming a
+-- core makes them out of date
+CREATE TRIGGER IF NOT EXISTS core_stats_renamed
+    AFTER UPDATE OF core_name ON core
+    BEGIN
+        DELETE FROM core_stats;
+    END;
+
 -- - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
 -- A table holding the import reports
 CREATE TABLE IF NOT EXISTS reports(
@@ -229,6 +229,33 @@ class SQLiteDB(object):
         else:
             raise TypeError("can only set pragmas to bool, int or str")
 
+    def read_blob(self, table: str, column: str, rowid: int) -> memoryview:
+        """
+        Reads a single BLOB, using incremental BLOB I/O where the Python
+        version supports it.
+
+        :param table: The table holding the BLOB
+        :param column: The column holding the BLOB
+        :param rowid: The rowid of the row holding the BLOB
+        :returns: The contents of the BLOB
+        :raises DatabaseException: If the database has been closed
+        :raises LookupError: If there is no such row
+        """
+        if self.__db is None:
+            raise DatabaseException("database has been closed")
+        if hasattr(self.__db, "blobopen"):
+            try:
+                with self.__db.blobopen(
+                        table, column, rowid, readonly=True) as blob:
+                    return memoryview(blob.read())
+            except sqlite3.OperationalError as ex:
+                raise LookupError(
+                    f"no {column} in {table} for {rowid=}") from ex
+        for row in self.cursor().execute(
+                f"SELECT {column} FROM {table} WHERE rowid = ?", (rowid,)):
+            return memoryview(row[0])
+        raise LookupError(f"no {column} in {table} for {rowid=}")
+
     def cursor(self) -> sqlite3.Cursor:
         """
         :returns: The cursor created by the with statement
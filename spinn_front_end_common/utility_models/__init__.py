@@ -15,8 +15,9 @@
 from .chip_power_monitor_machine_vertex import ChipPowerMonitorMachineVertex
 from .command_sender import CommandSender
 from .command_sender_machine_vertex import CommandSenderMachineVertex
+from .data_out_multiplexer import DataOutMultiplexer
 from .data_speed_up_packet_gatherer_machine_vertex import (
-    DataSpeedUpPacketGatherMachineVertex)
+    DataOutStream, DataSpeedUpPacketGatherMachineVertex)
 from .eieio_parameters import EIEIOParameters
 from .extra_monitor_support_machine_vertex import (
     ExtraMonitorSupportMachineVertex)
@@ -29,8 +30,8 @@ from .reverse_ip_tag_multicast_source_machine_vertex import (
 from .streaming_context_manager import StreamingContextManager
 
 __all__ = ("CommandSender", "CommandSenderMachineVertex",
-           "ChipPowerMonitorMachineVertex",
-           "DataSpeedUpPacketGatherMachineVertex",
+           "ChipPowerMonitorMachineVertex", "DataOutMultiplexer",
+           "DataOutStream", "DataSpeedUpPacketGatherMachineVertex",
            "EIEIOParameters", "ExtraMonitorSupportMachineVertex",
            "LivePacketGather", "LivePacketGatherMachineVertex",
            "MultiCastCommand", "ReverseIpTagMultiCastSource",
@@ -13,10 +13,11 @@
 # limitations under the License.
 from __future__ import annotations
 from collections.abc import Sized
+from contextlib import nullcontext
 from enum import IntEnum
 from typing import (
-    Callable, Dict, Iterable, List, Sequence, Set, Tuple, Type, TypeVar,
-    TYPE_CHECKING)
+    Callable, Dict, Iterable, List, Optional, Sequence, Set, Tuple, Type,
+    TypeVar, TYPE_CHECKING)
 
 from spinn_utilities.overrides import overrides
 
@@ -386,8 +387,10 @@ class CommandSenderMachineVertex(
                parse_extra_provenance_items)
     def parse_extra_provenance_items(
             self, label: str, x: int, y: int, p: int,
-            provenance_data: Sequence[int]) -> None:
+            provenance_data: Sequence[int],
+            db: Optional[ProvenanceWriter] = None) -> None:
         _ = label
         n_commands_sent, = provenance_data
-        with ProvenanceWriter() as db:
+        with (nullcontext(db) if db is not None
+              else ProvenanceWriter()) as db:
             db.insert_core(x, y, p, "Sent_Commands", n_commands_sent)
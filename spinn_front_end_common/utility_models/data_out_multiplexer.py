@@ -0,0 +1,158 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from __future__ import annotations
+from collections import defaultdict, deque
+import logging
+import selectors
+import time
+from typing import Deque, Dict, List, Tuple, TYPE_CHECKING
+
+from spinn_utilities.log import FormatAdapter
+
+from pacman.model.placements import Placement
+
+if TYPE_CHECKING:
+    from .data_speed_up_packet_gatherer_machine_vertex import (
+        DataOutStream, DataSpeedUpPacketGatherMachineVertex)
+    from .extra_monitor_support_machine_vertex import (
+        ExtraMonitorSupportMachineVertex)
+
+log = FormatAdapter(logging.getLogger(__name__))
+
+#: index of the result, extra monitor, its placement, address and length
+_Request = Tuple[int, "ExtraMonitorSupportMachineVertex", Placement, int, int]
+
+
+class DataOutMultiplexer(object):
+    """
+    Gets data out of the machine through many
+    :py:class:`DataSpeedUpPacketGatherMachineVertex` at once, from the
+    calling thread alone.
+
+    Each gatherer does one transfer at a time, in the order they were
+    added.  The transfers of all the gatherers run together, with a
+    selector waiting on all of their connections and each transfer
+    keeping its own state and retransmission timer.
+    """
+
+    __slots__ = (
+        # The reads not yet started, by the gatherer that will do them
+        "_requests",
+        # The number of reads added
+        "_n_requests")
+
+    def __init__(self) -> None:
+        self._requests: Dict[
+            DataSpeedUpPacketGatherMachineVertex,
+            Deque[_Request]] = defaultdict(deque)
+        self._n_requests = 0
+
+    def add(self, gatherer: DataSpeedUpPacketGatherMachineVertex,
+            extra_monitor: ExtraMonitorSupportMachineVertex,
+            placement: Placement, memory_address: int,
+            length_in_bytes: int) -> int:
+        """
+        Add a read to be done by :py:meth:`read`.
+
+        :param gatherer: The gatherer to read through
+        :param extra_monitor: the extra monitor used for this data
+        :param placement: the placement of the extra monitor
+        :param memory_address: the address in SDRAM to start reading from
+        :param length_in_bytes: the length of data to read in bytes
+        :return: The index of the data in the results of :py:meth:`read`
+        """
+        index = self._n_requests
+        self._requests[gatherer].append((
+            index, extra_monitor, placement, memory_address,
+            length_in_bytes))
+        self._n_requests += 1
+        return index
+
+    def read(self) -> List[bytearray]:
+        """
+        Do all the reads added.
+
+        :return: The data of each read, in the order they were added
+        """
+        # Each stream's output is used as is, so the data is not copied
+        results = [bytearray() for _ in range(self._n_requests)]
+        # stream -> gatherer and the index of its result
+        active: Dict[DataOutStream, Tuple[
+            DataSpeedUpPacketGatherMachineVertex, int]] = dict()
+        deadlines: Dict[DataOutStream, float] = dict()
+
+        with selectors.DefaultSelector() as selector:
+            def start_next(
+                    gatherer: DataSpeedUpPacketGatherMachineVertex) -> None:
+                requests = self._requests[gatherer]
+                while requests:
+                    index, monitor, placement, address, length = (
+                        requests.popleft())
+                    if length == 0:
+                        continue
+                    stream = gatherer.start_data_out(
+                        monitor, placement, address, length)
+                    if not stream.selectable:
+                        # Proxied connections can only be waited on alone
+                        try:
+                            gatherer.wait_for_data_out(stream)
+                        finally:
+                            gatherer.end_data_out(stream)
+                        results[index] = stream.output
+                        continue
+                    active[stream] = (gatherer, index)
+                    deadlines[stream] = (
+                        time.monotonic() + gatherer.data_out_timeout)
+                    selector.register(stream, selectors.EVENT_READ, stream)
+                    return
+
+            def finish(stream: DataOutStream) -> None:
+                gatherer, index = active.pop(stream)
+                del deadlines[stream]
+                selector.unregister(stream)
+                gatherer.end_data_out(stream)
+                results[index] = stream.output
+                start_next(gatherer)
+
+            try:
+                for gatherer in list(self._requests):
+                    start_next(gatherer)
+                while active:
+                    timeout = min(deadlines.values()) - time.monotonic()
+                    for key, _ in selector.select(max(timeout, 0.0)):
+                        stream = key.data
+                        gatherer, _index = active[stream]
+                        gatherer.read_data_out(stream, 0)
+                        deadlines[stream] = (
+                            time.monotonic() + gatherer.data_out_timeout)
+                        if stream.finished:
+                            finish(stream)
+                    now = time.monotonic()
+                    for stream, deadline in list(deadlines.items()):
+                        if deadline <= now:
+                            gatherer, _index = active[stream]
+                            gatherer.timeout_data_out(stream)
+                            deadlines[stream] = (
+                                now + gatherer.data_out_timeout)
+                            if stream.finished:
+                                finish(stream)
+            finally:
+                for stream, (gatherer, _index) in active.items():
+                    try:
+                        gatherer.end_data_out(stream)
+                    except Exception:  # pylint: disable=broad-except
+                        log.exception("Error stopping a data out stream")
+        self._requests.clear()
+        self._n_requests = 0
+        return results
@@ -15,21 +15,26 @@ from __future__ import annotations
 import os
 import datetime
 import logging
+import socket
 import time
 import struct
 from enum import Enum, IntEnum
 from typing import (
-    Any, BinaryIO, Iterable, List, Optional, Set, Tuple, Union,
-    TYPE_CHECKING)
+    Any, BinaryIO, List, Optional, Set, Tuple, Union, TYPE_CHECKING)
 
-from spinn_utilities.config_holder import get_config_bool, get_report_path
+import numpy
+from numpy import integer, uint8, uint32
+from numpy.typing import NDArray
+
+from spinn_utilities.config_holder import (
+    get_config_bool, get_config_str_or_none, get_report_path)
 from spinn_utilities.overrides import overrides
 from spinn_utilities.log import FormatAdapter
 from spinn_utilities.typing.coords import XY
 
 from spinn_machine import Chip
 
-from spinnman.exceptions import SpinnmanTimeoutException
+from spinnman.exceptions import SpinnmanIOException, SpinnmanTimeoutException
 from spinnman.messages.sdp import SDPMessage, SDPHeader, SDPFlag
 from spinnman.model.enums import (
     CPUState, ExecutableType, SDP_PORTS, UserRegister)
@@ -54,7 +59,8 @@ from spinn_front_end_common.utilities.constants import (
     BYTES_PER_WORD, BYTES_PER_KB)
 from spinn_front_end_common.utilities.utility_calls import (
     get_region_base_address_offset, retarget_tag)
-from spinn_front_end_common.utilities.exceptions import SpinnFrontEndException
+from spinn_front_end_common.utilities.exceptions import (
+    ConfigurationException, SpinnFrontEndException)
 from spinn_front_end_common.utilities.scp import ReinjectorControlProcess
 from spinn_front_end_common.utilities.utility_objs import ReInjectionStatus
 from spinn_front_end_common.interface.ds import DataSpecificationGenerator
@@ -132,6 +138,306 @@ BYTES_IN_FULL_PACKET_WITH_KEY = (
 SIZE_DATA_IN_CHIP_TO_KEY_SPACE = ((3 * 48) + 2) * BYTES_PER_WORD
 
 
+class _ReceivedSeqNums(object):
+    """
+    Which sequence numbers of a data out stream have been received,
+    held as one byte per sequence number so that the missing sequence
+    numbers can be found without looking at each one in Python.
+    """
+    __slots__ = ("_received", "_n_received")
+
+    def __init__(self, max_seq_num: int):
+        """
+        :param max_seq_num: The largest sequence number of the stream
+        """
+        self._received = bytearray(max_seq_num + 1)
+        self._n_received = 0
+
+    def add(self, seq_num: int) -> None:
+        """
+        Mark a sequence number as received.
+
+        :param seq_num: The sequence number received
+        """
+        if not self._received[seq_num]:
+            self._received[seq_num] = 1
+            self._n_received += 1
+
+    @property
+    def all_received(self) -> bool:
+        """
+        Whether every sequence number has been received.
+        """
+        return self._n_received == len(self._received)
+
+    def missing(self) -> NDArray[uint32]:
+        """
+        :return: The sequence numbers of the data packets not received,
+            in order
+        """
+        received = numpy.frombuffer(
+            self._received, dtype=uint8, count=len(self._received) - 1)
+        return numpy.flatnonzero(received == 0).astype("<u4")
+
+
+class _SendPacer(object):
+    """
+    Paces the data in packets sent to a gatherer, adapting the rate by additive
+    increase while nothing is lost and multiplicative decrease when
+    something is.
+    """
+    __slots__ = ("_rate", "_next_send", "_lowest", "_highest")
+
+    #: The rate at which sending starts, in packets per second
+    INITIAL_RATE = 20000.0
+    #: The slowest rate to back off to
+    MIN_RATE = 1000.0
+    #: The fastest rate to grow to (a little over 100Mb/s of full packets)
+    MAX_RATE = 50000.0
+    #: How much the rate grows by after a round with no loss
+    INCREASE = 2000.0
+    #: What the rate is multiplied by after a round with loss
+    DECREASE = 0.5
+    #: The shortest sleep worth doing; shorter waits are allowed to build
+    #: up, so that sleeping does not limit the rate
+    MIN_SLEEP = 0.0002
+
+    def __init__(self) -> None:
+        self._rate = self.INITIAL_RATE
+        self._next_send = 0.0
+        self._lowest: Optional[float] = None
+        self._highest: Optional[float] = None
+
+    @property
+    def rate(self) -> float:
+        """
+        The current rate, in packets per second.
+        """
+        return self._rate
+
+    @property
+    def lowest(self) -> Optional[float]:
+        """
+        The lowest rate a round of sending has started at since the range
+        was last cleared, or None if there have been no rounds.
+        """
+        return self._lowest
+
+    @property
+    def highest(self) -> Optional[float]:
+        """
+        The highest rate a round of sending has started at since the range
+        was last cleared, or None if there have been no rounds.
+        """
+        return self._highest
+
+    def start_round(self) -> None:
+        """
+        Note that a round of sending is starting at the current rate.
+        """
+        if self._lowest is None or self._rate < self._lowest:
+            self._lowest = self._rate
+        if self._highest is None or self._rate > self._highest:
+            self._highest = self._rate
+
+    def clear_range(self) -> None:
+        """
+        Forget the rates rounds have started at; the rate itself is kept.
+        """
+        self._lowest = None
+        self._highest = None
+
+    def wait(self) -> None:
+        """
+        Wait until the next packet may be sent.
+        """
+        now = time.perf_counter()
+        delay = self._next_send - now
+        if delay >= self.MIN_SLEEP:
+            time.sleep(delay)
+        # Allow a little catching up after sleeping too long
+        self._next_send = (
+            max(self._next_send, now - self.MIN_SLEEP) + 1.0 / self._rate)
+
+    def increase(self) -> None:
+        """
+        Speed up after a round of sending with no loss.
+        """
+        self._rate = min(self.MAX_RATE, self._rate + self.INCREASE)
+
+    def decrease(self) -> None:
+        """
+        Slow down after a round of sending with loss.
+        """
+        self._rate = max(self.MIN_RATE, self._rate * self.DECREASE)
+
+
+class _GathererConnection(SCAMPConnection):
+    """
+    A direct connection to a gatherer, which can be waited on with
+    :py:mod:`selectors`.
+    """
+    __slots__ = ()
+
+    def fileno(self) -> int:
+        """
+        :return: The file descriptor of the socket of the connection
+        """
+        return self._socket.fileno()
+
+    def receive_into(
+            self, buffer: bytearray, timeout: Optional[float] = None) -> int:
+        """
+        Receive a packet into a buffer, so that nothing is allocated.
+
+        :param buffer: Where to put the packet
+        :param timeout: The timeout in seconds, or `None` to wait forever
+        :return: The number of bytes received
+        :raise SpinnmanTimeoutException:
+            If a timeout occurs before any data is received
+        :raise SpinnmanIOException:
+            If an error occurs receiving the data, or the packet does not fit
+            in the buffer with a byte to spare, so may have been truncated
+        """
+        try:
+            self._socket.settimeout(timeout)
+            n_bytes = self._socket.recv_into(buffer)
+        except socket.timeout as e:
+            raise SpinnmanTimeoutException("receive", timeout) from e
+        except Exception as e:  # pylint: disable=broad-except
+            raise SpinnmanIOException(f"Error receiving: {e}") from e
+        if n_bytes >= len(buffer):
+            raise SpinnmanIOException(
+                f"Received a packet of at least {n_bytes} bytes, which is "
+                "too big for the buffer")
+        return n_bytes
+
+
+class DataOutStream(object):
+    """
+    The state of a single transfer of data out of the machine through a
+    :py:class:`DataSpeedUpPacketGatherMachineVertex`.
+    """
+    __slots__ = (
+        "_placement", "_memory_address", "_transaction_id", "_connection",
+        "_output", "_view", "_max_seq_num", "_seq_nums", "_lost_seq_nums",
+        "_start", "timeout_count", "finished")
+
+    def __init__(self, placement: Placement, memory_address: int,
+                 length_in_bytes: int, transaction_id: int,
+                 connection: SCAMPConnection):
+        """
+        :param placement: The extra monitor the data comes from
+        :param memory_address: Where the data is read from
+        :param length_in_bytes: How much data is read
+        :param transaction_id: The transaction ID of the transfer
+        :param connection: The connection the data arrives on
+        """
+        self._placement = placement
+        self._memory_address = memory_address
+        self._transaction_id = transaction_id
+        self._connection = connection
+        self._output = bytearray(length_in_bytes)
+        self._view = memoryview(self._output)
+        self._max_seq_num = ceildiv(
+            length_in_bytes,
+            WORDS_PER_FULL_PACKET_WITH_SEQUENCE_NUM * BYTES_PER_WORD)
+        self._seq_nums = _ReceivedSeqNums(self._max_seq_num)
+        self._lost_seq_nums: List[int] = list()
+        self._start = float(time.time())
+        #: The number of timeouts since a packet was last received
+        self.timeout_count = 0
+        #: Whether all the data has been received
+        self.finished = False
+
+    @property
+    def selectable(self) -> bool:
+        """
+        Whether the stream can be waited on with :py:mod:`selectors`;
+        connections proxied through an allocation server can not.
+        """
+        return isinstance(self._connection, _GathererConnection)
+
+    def fileno(self) -> int:
+        """
+        :return: The file descriptor of the connection of the stream
+        """
+        if not isinstance(self._connection, _GathererConnection):
+            raise SpinnFrontEndException(
+                "the connection of the stream has no file descriptor")
+        return self._connection.fileno()
+
+    @property
+    def placement(self) -> Placement:
+        """
+        The placement of the extra monitor the data comes from.
+        """
+        return self._placement
+
+    @property
+    def memory_address(self) -> int:
+        """
+        The address the data is read from.
+        """
+        return self._memory_address
+
+    @property
+    def transaction_id(self) -> int:
+        """
+        The transaction ID of the transfer.
+        """
+        return self._transaction_id
+
+    @property
+    def connection(self) -> SCAMPConnection:
+        """
+        The connection the data arrives on.
+        """
+        return self._connection
+
+    @property
+    def output(self) -> bytearray:
+        """
+        The data received so far.
+        """
+        return self._output
+
+    @property
+    def view(self) -> memoryview:
+        """
+        A view of :py:attr:`output` to write the data received into.
+        """
+        return self._view
+
+    @property
+    def max_seq_num(self) -> int:
+        """
+        The largest sequence number of the transfer.
+        """
+        return self._max_seq_num
+
+    @property
+    def seq_nums(self) -> _ReceivedSeqNums:
+        """
+        The sequence numbers received so far.
+        """
+        return self._seq_nums
+
+    @property
+    def lost_seq_nums(self) -> List[int]:
+        """
+        The number of sequence numbers lost in each round of the transfer.
+        """
+        return self._lost_seq_nums
+
+    @property
+    def start(self) -> float:
+        """
+        The time the transfer started.
+        """
+        return self._start
+
+
 class _DataRegions(IntEnum):
     """
     DSG data regions.
@@ -146,6 +452,9 @@ class _ProvLabels(str, Enum):
     RECEIVED = "Received_SDP_Packets"
     IN_STREAMS = "Speed_Up_Input_Streams"
     OUT_STREAMS = "Speed_Up_Output_Streams"
+    LOWEST_RATE = "Data_In_Lowest_Send_Rate"
+    HIGHEST_RATE = "Data_In_Highest_Send_Rate"
+    FINAL_RATE = "Data_In_Final_Send_Rate"
 
 
 class _DataOutCommands(IntEnum):
@@ -170,16 +479,15 @@ class _DataInCommands(IntEnum):
 
 
 # precompiled structures
-_ONE_WORD = struct.Struct("<I")
 _TWO_WORDS = struct.Struct("<II")
 _THREE_WORDS = struct.Struct("<III")
 _FOUR_WORDS = struct.Struct("<IIII")
 _FIVE_WORDS = struct.Struct("<IIIII")
 
 
-# Set to true to check that the data is correct after it has been sent in.
-# This is expensive, and only works in Python 3.5 or later.
-VERIFY_SENT_DATA = False
+# The largest packet the gatherer sends (its IP tag strips the SDP header),
+# plus a byte so that a larger packet is seen instead of being truncated
+_RECEIVE_BUFFER_SIZE = WORDS_PER_FULL_PACKET * BYTES_PER_WORD + 1
 
 # provenance data size
 _PROVENANCE_DATA_SIZE = int(_FOUR_WORDS.size)
@@ -201,6 +509,29 @@ SDRAM_FOR_MISSING_SDP_SEQ_NUMS = ceildiv(
     120.0 * 1024 * BYTES_PER_KB,
     WORDS_PER_FULL_PACKET_WITH_SEQUENCE_NUM * BYTES_PER_WORD)
 
+# The size of the blocks read back directly when checking the data sent in
+_VERIFY_BLOCK_BYTES = 4 * BYTES_PER_KB
+
+# The most bytes of each side of a mismatch that are logged
+_MAX_LOGGED_BYTES = 64
+
+
+def _differing_blocks(expected: bytes, actual: bytes) -> NDArray[integer]:
+    """
+    Find the blocks of the data that differ.
+
+    :param expected: The data that should be there
+    :param actual: The data that is there; may be shorter than expected
+    :return: The index of each block that differs, in order
+    """
+    n_bytes = min(len(expected), len(actual))
+    differ = numpy.flatnonzero(
+        numpy.frombuffer(expected, dtype=uint8, count=n_bytes) !=
+        numpy.frombuffer(actual, dtype=uint8, count=n_bytes))
+    if len(actual) < len(expected):
+        differ = numpy.append(differ, n_bytes)
+    return numpy.unique(differ // _VERIFY_BLOCK_BYTES)
+
 
 class DataSpeedUpPacketGatherMachineVertex(
         MachineVertex, AbstractGeneratesDataSpecification,
@@ -229,19 +560,24 @@ class DataSpeedUpPacketGatherMachineVertex(
         "_ip_address",
         # store for the last reinjection status
         "_last_status",
-        # the max sequence number expected given a data retrieval
+        # the max sequence number of the data being sent in
         "_max_seq_num",
         # holder for missing sequence numbers for data in
         "_missing_seq_nums_data_in",
-        # holder of data from out
-        "_output",
         # my placement for future lookup
         "__placement",
         # Count of the runs for provenance data
         "_run",
         "_remote_tag",
-        # data holder for output
-        "_view")
+        # the pacing of packets sent to the gatherer
+        "_pacer",
+        # the connection to the gatherer, kept open while streaming
+        "_connection",
+        # whether the cores are set for data streaming
+        "_streaming",
+        # where packets are received, and a view of it
+        "_receive_buffer",
+        "_receive_view")
 
     #: base key (really nasty hack to tie in fixed route keys)
     BASE_KEY = 0xFFFFFFF9
@@ -258,9 +594,6 @@ class DataSpeedUpPacketGatherMachineVertex(
     END_FLAG_KEY_OFFSET = 3
     TRANSACTION_ID_KEY_OFFSET = 4
 
-    # throttle on the transmission
-    _TRANSMISSION_THROTTLE_TIME = 0.000001
-
     # the end flag is set when the high bit of the sequence number word is set
     _LAST_MESSAGE_FLAG_BIT_MASK = 0x80000000
     # corresponding mask for the actual sequence numbers
@@ -298,10 +631,8 @@ class DataSpeedUpPacketGatherMachineVertex(
         super().__init__(
             label=f"SYSTEM:PacketGatherer({x},{y})", app_vertex=None)
 
-        # data holders for the output, and sequence numbers
-        self._view: Optional[memoryview] = None
+        # the sequence numbers of data in
         self._max_seq_num = 0
-        self._output: Optional[bytearray] = None
 
         self._transaction_id = 0
 
@@ -320,16 +651,26 @@ class DataSpeedUpPacketGatherMachineVertex(
         # Stored reinjection status for resetting timeouts
         self._last_status: Optional[ReInjectionStatus] = None
 
-    def __throttled_send(
+        # The rate learnt is kept from one transfer to the next
+        self._pacer = _SendPacer()
+
+        # Opened when first needed
+        self._connection: Optional[SCAMPConnection] = None
+        self._streaming = False
+
+        # Reused for every packet received
+        self._receive_buffer = bytearray(_RECEIVE_BUFFER_SIZE)
+        self._receive_view = memoryview(self._receive_buffer)
+
+    def __paced_send(
             self, message: SDPMessage, connection: SCAMPConnection) -> None:
         """
         Slows down transmissions to allow SpiNNaker to keep up.
 
         :param message: message to send
         """
-        # send first message
+        self._pacer.wait()
         connection.send_sdp_message(message)
-        time.sleep(self._TRANSMISSION_THROTTLE_TIME)
 
     @property
     @overrides(MachineVertex.sdram_required)
@@ -532,13 +873,11 @@ class DataSpeedUpPacketGatherMachineVertex(
         # end time recording
         end = datetime.datetime.now()
 
-        if VERIFY_SENT_DATA:
-            original_data = bytes(data[offset:n_bytes + offset])
-            transceiver = FecDataView.get_transceiver()
-            verified_data = bytes(transceiver.read_memory(
-                x, y, base_address, n_bytes))
+        verify = get_config_str_or_none("Machine", "verify_data_in")
+        if verify is not None and n_bytes:
             self.__verify_sent_data(
-                original_data, verified_data, x, y, base_address, n_bytes)
+                bytes(data[offset:n_bytes + offset]), x, y, base_address,
+                verify.lower())
 
         # write report
         if get_config_bool("Reports", "write_data_speed_up_reports"):
@@ -546,18 +885,61 @@ class DataSpeedUpPacketGatherMachineVertex(
                 x=x, y=y, time_diff=end - start,
                 data_size=n_bytes, address_written_to=base_address)
 
-    @staticmethod
     def __verify_sent_data(
+            self, original_data: bytes, x: int, y: int, base_address: int,
+            verify: str) -> None:
+        """
+        Check that data has been written correctly.
+
+        :param original_data: The data that should have been written
+        :param x: chip x the data was written to
+        :param y: chip y the data was written to
+        :param base_address: where the data was written to
+        :param verify: how to check; "gatherer" or "full"
+        :raises ConfigurationException: If the way to check is unknown
+        :raises ValueError: If the data does not match
+        """
+        transceiver = FecDataView.get_transceiver()
+        n_bytes = len(original_data)
+        if verify == "full":
+            self.__compare_sent_data(
+                original_data, bytes(transceiver.read_memory(
+                    x, y, base_address, n_bytes)), x, y, base_address)
+            return
+        if verify != "gatherer":
+            raise ConfigurationException(
+                f"Unexpected cfg setting verify_data_in: {verify}")
+
+        # Read all the data back through the gatherer, and only read
+        # directly where it differs to find which way it went wrong
+        monitor = FecDataView.get_monitor_by_xy(x, y)
+        read_data = self.get_data(
+            monitor, FecDataView.get_placement_of_vertex(monitor),
+            base_address, n_bytes)
+        for block in _differing_blocks(original_data, read_data):
+            start = int(block) * _VERIFY_BLOCK_BYTES
+            expected = original_data[start:start + _VERIFY_BLOCK_BYTES]
+            self.__compare_sent_data(
+                expected, bytes(transceiver.read_memory(
+                    x, y, base_address + start, len(expected))),
+                x, y, base_address + start)
+
+    @staticmethod
+    def __compare_sent_data(
             original_data: bytes, verified_data: bytes, x: int, y: int,
-            base_address: int, n_bytes: int) -> None:
+            base_address: int) -> None:
         if original_data != verified_data:
+            mismatch = int(numpy.flatnonzero(
+                numpy.frombuffer(original_data, dtype=uint8) !=
+                numpy.frombuffer(verified_data, dtype=uint8))[0])
+            end = mismatch + _MAX_LOGGED_BYTES
             log.error("VARIANCE: chip:{},{} address:{} len:{}",
-                      x, y, base_address, n_bytes)
-            log.error("original:{}", original_data.hex())
-            log.error("verified:{}", verified_data.hex())
-            for i, (a, b) in enumerate(zip(original_data, verified_data)):
-                if a != b:
-                    raise ValueError(f"Mismatch found as position {i}")
+                      x, y, base_address, len(original_data))
+            log.error("original from {}:{}", mismatch,
+                      original_data[mismatch:end].hex())
+            log.error("verified from {}:{}", mismatch,
+                      verified_data[mismatch:end].hex())
+            raise ValueError(f"Mismatch found as position {mismatch}")
 
     def __make_data_in_message(self, payload: bytes) -> SDPMessage:
         return SDPMessage(
@@ -583,6 +965,45 @@ class DataSpeedUpPacketGatherMachineVertex(
                 flags=SDPFlag.REPLY_NOT_EXPECTED),
             data=payload)
 
+    def __get_connection(self) -> SCAMPConnection:
+        """
+        Get the connection to the gatherer, opening it if it is not already
+        open.  Anything left unread on the connection by earlier transfers
+        is discarded; if that fails, the connection is replaced.
+
+        :return: The connection, ready for use.
+        """
+        if self._connection is not None:
+            try:
+                while self._connection.is_ready_to_receive(0):
+                    self._connection.receive()
+            except Exception:  # pylint: disable=broad-except
+                log.warning("Replacing failed connection to {}", self.label)
+                self.close_connection()
+        if self._connection is None:
+            self._connection = self.__open_connection()
+        return self._connection
+
+    def close_connection(self) -> None:
+        """
+        Close the connection to the gatherer, if open; the next transfer
+        will open a new one.
+        """
+        if self._connection is not None:
+            connection, self._connection = self._connection, None
+            try:
+                connection.close()
+            except Exception:  # pylint: disable=broad-except
+                log.exception("Error closing gatherer connection")
+
+    def __end_transfer(self) -> None:
+        """
+        Close the connection after a transfer, unless streaming, when it is
+        kept for the transfers that follow.
+        """
+        if not self._streaming:
+            self.close_connection()
+
     def __open_connection(self) -> SCAMPConnection:
         """
         Open an SCP connection and make our tag target it.
@@ -597,11 +1018,15 @@ class DataSpeedUpPacketGatherMachineVertex(
                 connection = controller.open_sdp_connection(
                     self._x, self._y)
         if connection is None:
-            connection = SCAMPConnection(
+            connection = _GathererConnection(
                 self._x, self._y, remote_host=self._ip_address)
 
         assert self._remote_tag is not None
-        retarget_tag(connection, self._x, self._y, self._remote_tag)
+        try:
+            retarget_tag(connection, self._x, self._y, self._remote_tag)
+        except Exception:
+            connection.close()
+            raise
         return connection
 
     def _send_data_via_extra_monitors(
@@ -610,12 +1035,17 @@ class DataSpeedUpPacketGatherMachineVertex(
         """
         Sends data using the extra monitor cores.
 
+        The packets are paced at a rate that grows while nothing is lost and
+        shrinks when something is; the range of rates used is recorded in the
+        provenance of the gatherer.
+
         :param destination_chip: chip to send to
         :param start_address: start address in SDRAM to write data to
         :param data_to_write: the data to write
         """
         # Set up the connection
-        with self.__open_connection() as connection:
+        connection = self.__get_connection()
+        try:
             # how many packets after first one we need to send
             self._max_seq_num = ceildiv(
                 len(data_to_write), BYTES_IN_FULL_PACKET_WITH_KEY)
@@ -633,10 +1063,15 @@ class DataSpeedUpPacketGatherMachineVertex(
                 self._transaction_id + 1) & TRANSACTION_ID_CAP
             time_out_count = 0
 
+            # if the current round of sending lost any packets
+            lost = False
+
             # verify completed
             received_confirmation = False
             while not received_confirmation:
                 # send initial attempt at sending all the data
+                self._pacer.start_round()
+                lost = False
                 self._send_all_data_based_packets(
                     data_to_write, start_address, connection)
 
@@ -661,6 +1096,8 @@ class DataSpeedUpPacketGatherMachineVertex(
 
                         # Decide what to do with the packet
                         if cmd == _DataInCommands.RECEIVE_FINISHED:
+                            if not lost:
+                                self._pacer.increase()
                             received_confirmation = True
                             break
 
@@ -673,6 +1110,9 @@ class DataSpeedUpPacketGatherMachineVertex(
                         if missing is None:
                             missing = set()
                             self._missing_seq_nums_data_in.append(missing)
+                        if not lost:
+                            self._pacer.decrease()
+                            lost = True
                         seen_last, seen_all = self._read_in_missing_seq_nums(
                             data,
                             BYTES_FOR_RECEPTION_COMMAND_AND_ADDRESS_HEADER,
@@ -681,6 +1121,8 @@ class DataSpeedUpPacketGatherMachineVertex(
                         # Check that you've seen something that implies ready
                         # to retransmit.
                         if seen_all or seen_last:
+                            self._pacer.start_round()
+                            lost = False
                             self._outgoing_retransmit_missing_seq_nums(
                                 data_to_write, missing, connection)
                             missing.clear()
@@ -695,15 +1137,23 @@ class DataSpeedUpPacketGatherMachineVertex(
                                 "Failed to hear from the machine during "
                                 f"{time_out_count} attempts. "
                                 "Please try removing firewalls.") from e
+                        self._pacer.decrease()
 
                         # If we never received a packet, we will never have
                         # created the buffer, so send everything again
                         if missing is None:
                             break
 
+                        self._pacer.start_round()
+                        lost = False
                         self._outgoing_retransmit_missing_seq_nums(
                                 data_to_write, missing, connection)
                         missing.clear()
+        except Exception:
+            # What is left on the connection is unknown, so start afresh
+            self.close_connection()
+            raise
+        self.__end_transfer()
 
     def _read_in_missing_seq_nums(
             self, data: bytes, position: int,
@@ -755,7 +1205,7 @@ class DataSpeedUpPacketGatherMachineVertex(
         for missing_seq_num in missing_seqs_as_list:
             message, _length = self.__make_data_in_stream_message(
                 data_to_write, missing_seq_num, None)
-            self.__throttled_send(message, connection)
+            self.__paced_send(message, connection)
 
         # request an update on what is missing
         self.__send_tell_flag(connection)
@@ -855,7 +1305,7 @@ class DataSpeedUpPacketGatherMachineVertex(
             position_in_data += length_to_send
 
             # send the message
-            self.__throttled_send(message, connection)
+            self.__paced_send(message, connection)
             log.debug("sent sequence {} of {} bytes", seq_num, length_to_send)
 
         # check for end flag
@@ -865,8 +1315,10 @@ class DataSpeedUpPacketGatherMachineVertex(
     def set_cores_for_data_streaming(self) -> None:
         """
         Helper method for setting the router timeouts to a state usable
-        for data streaming.
+        for data streaming.  The connection is kept open for the transfers
+        that follow, until :py:meth:`unset_cores_for_data_streaming`.
         """
+        self._streaming = True
         lead_monitor = FecDataView.get_monitor_by_xy(0, 0)
         # Store the last reinjection status for resetting
         # NOTE: This assumes the status is the same on all cores
@@ -953,8 +1405,12 @@ class DataSpeedUpPacketGatherMachineVertex(
     def unset_cores_for_data_streaming(self) -> None:
         """
         Helper method for restoring the router timeouts to normal after
-        being in a state usable for data streaming.
+        being in a state usable for data streaming, and closes the
+        connection used while streaming.
         """
+        self._streaming = False
+        self.close_connection()
+
         # Set the routers to temporary values
         self.set_router_wait1_timeout(self._TEMP_TIMEOUT)
         self.set_router_wait2_timeout(self._ZERO_TIMEOUT)
@@ -1006,11 +1462,6 @@ class DataSpeedUpPacketGatherMachineVertex(
         :param length_in_bytes: the length of data to read in bytes
         :return: byte array of the data
         """
-        # create report elements
-        if (get_config_bool("Reports", "write_data_speed_up_reports")
-                and FecDataView.has_fixed_routes()):
-            self._report_routers_used_for_out(placement)
-
         start = float(time.time())
         # if asked for no data, just return a empty byte array
         if length_in_bytes == 0:
@@ -1023,36 +1474,176 @@ class DataSpeedUpPacketGatherMachineVertex(
                     self._run, "No Extraction time", end - start)
             return data
 
-        # Update the IP Tag to work through a NAT firewall
-        with self.__open_connection() as connection:
+        stream = self.start_data_out(
+            extra_monitor, placement, memory_address, length_in_bytes)
+        try:
+            self.wait_for_data_out(stream)
+        finally:
+            self.end_data_out(stream)
+        return stream.output
+
+    @property
+    def data_out_timeout(self) -> float:
+        """
+        How long to wait for a packet of a data out stream before asking
+        for any missing data again, in seconds.
+        """
+        return self._TIMEOUT_PER_RECEIVE_IN_SECONDS
+
+    def start_data_out(
+            self, extra_monitor: ExtraMonitorSupportMachineVertex,
+            placement: Placement, memory_address: int,
+            length_in_bytes: int) -> DataOutStream:
+        """
+        Start getting data from a given core and memory address, without
+        waiting for the data to arrive.
+
+        The packets of the stream must be received with
+        :py:meth:`read_data_out` (or passed to :py:meth:`receive_data_out`
+        if received elsewhere), and
+        :py:meth:`timeout_data_out` called if none arrive within
+        :py:attr:`data_out_timeout`, until the stream is finished;
+        :py:meth:`wait_for_data_out` does this on the calling thread.
+        :py:meth:`end_data_out` must then be called, even on failure.
+        Only one stream may be active on a gatherer at a time.
+
+        :param extra_monitor:
+            the extra monitor used for this data
+        :param placement:
+            placement object for where to get data from
+        :param memory_address: the address in SDRAM to start reading from
+        :param length_in_bytes: the length of data to read in bytes;
+            must not be 0
+        :return: The state of the transfer
+        """
+        # create report elements
+        if (get_config_bool("Reports", "write_data_speed_up_reports")
+                and FecDataView.has_fixed_routes()):
+            self._report_routers_used_for_out(placement)
+
+        # The IP Tag is updated to work through a NAT firewall when the
+        # connection is opened
+        connection = self.__get_connection()
+        try:
             # update transaction id for extra monitor
             extra_monitor.update_transaction_id()
-            transaction_id = extra_monitor.transaction_id
+            stream = DataOutStream(
+                placement, memory_address, length_in_bytes,
+                extra_monitor.transaction_id, connection)
 
             # send
             connection.send_sdp_message(self.__make_data_out_message(
                 placement, _FOUR_WORDS.pack(
-                    _DataOutCommands.START_SENDING, transaction_id,
+                    _DataOutCommands.START_SENDING, stream.transaction_id,
                     memory_address, length_in_bytes)))
+        except Exception:
+            self.close_connection()
+            raise
+        return stream
+
+    def wait_for_data_out(self, stream: DataOutStream) -> None:
+        """
+        Receive the packets of a stream on the calling thread until all
+        the data has been received.
+
+        :param stream: The stream to receive the data of
+        """
+        while not stream.finished:
+            try:
+                self.read_data_out(
+                    stream, self._TIMEOUT_PER_RECEIVE_IN_SECONDS)
+            except SpinnmanTimeoutException as e:
+                self.timeout_data_out(stream, e)
+
+    def read_data_out(
+            self, stream: DataOutStream, timeout: Optional[float]) -> None:
+        """
+        Receive a packet from the connection of a stream and handle it.
+        Where possible, the packet is received into a buffer that is
+        reused, so that its data is only copied once, into the output.
+
+        :param stream: The stream to receive a packet of
+        :param timeout: The timeout in seconds, or `None` to wait forever
+        :raise SpinnmanTimeoutException:
+            If a timeout occurs before any data is received
+        """
+        connection = stream.connection
+        if isinstance(connection, _GathererConnection):
+            n_bytes = connection.receive_into(self._receive_buffer, timeout)
+            self.receive_data_out(stream, self._receive_view[:n_bytes])
+        else:
+            self.receive_data_out(stream, connection.receive(timeout))
+
+    def receive_data_out(
+            self, stream: DataOutStream,
+            data: Union[bytes, memoryview]) -> None:
+        """
+        Handle a packet received on the connection of a stream.
+
+        :param stream: The stream the packet was received for
+        :param data: The packet received
+        """
+        first_packet_element, response_transaction_id = (
+            _TWO_WORDS.unpack_from(data))
+        if stream.transaction_id == response_transaction_id:
+            stream.timeout_count = 0
+            self._process_data(stream, first_packet_element, data)
+        else:
+            log.info(
+                "ignoring packet as transaction id should be {}"
+                " but is {}", stream.transaction_id, response_transaction_id)
 
-            # receive
-            self._output = bytearray(length_in_bytes)
-            self._view = memoryview(self._output)
-            self._max_seq_num = self.__calculate_max_seq_num()
-            lost_seq_nums = self._receive_data(
-                placement, connection, transaction_id)
+    def timeout_data_out(
+            self, stream: DataOutStream,
+            error: Optional[SpinnmanTimeoutException[Any]] = None) -> None:
+        """
+        Handle no packets having been received for a stream in time,
+        asking for anything missing to be sent again.
+
+        :param stream: The stream that has timed out
+        :param error: The exception that reported the timeout, if any
+        :raises SpinnFrontEndException: If this has happened too many times
+        """
+        if stream.timeout_count > TIMEOUT_RETRY_LIMIT:
+            raise SpinnFrontEndException(
+                "Failed to hear from the machine during "
+                f"{stream.timeout_count} attempts. "
+                "Please try removing firewalls") from error
+
+        stream.timeout_count += 1
+        if not stream.finished:
+            stream.finished = self._determine_and_retransmit_missing_seq_nums(
+                stream)
+
+    def end_data_out(self, stream: DataOutStream) -> None:
+        """
+        Stop a stream; if it finished the time taken and the sequences lost
+        are recorded.  Its connection is closed unless it finished while
+        streaming, so that the next transfer starts afresh.
 
+        :param stream: The stream to end
+        """
+        try:
             # Stop anything else getting through (and reduce traffic)
-            connection.send_sdp_message(self.__make_data_out_message(
-                placement, _TWO_WORDS.pack(
-                    _DataOutCommands.CLEAR, transaction_id)))
+            stream.connection.send_sdp_message(self.__make_data_out_message(
+                stream.placement, _TWO_WORDS.pack(
+                    _DataOutCommands.CLEAR, stream.transaction_id)))
+        except Exception:
+            self.close_connection()
+            raise
+        if not stream.finished:
+            self.close_connection()
+            return
 
         end = float(time.time())
+        placement = stream.placement
+        memory_address = stream.memory_address
+        length_in_bytes = len(stream.output)
         with ProvenanceWriter() as db:
             db.insert_gatherer(
                 placement.x, placement.y, memory_address, length_in_bytes,
-                self._run, "Extraction time", end - start)
-            for lost_seq_num in lost_seq_nums:
+                self._run, "Extraction time", end - stream.start)
+            for lost_seq_num in stream.lost_seq_nums:
                 if lost_seq_num > _MINOR_LOSS_THRESHOLD:
                     db.insert_report(
                         f"During the extraction of data of {length_in_bytes} "
@@ -1064,43 +1655,7 @@ class DataSpeedUpPacketGatherMachineVertex(
                         placement.x, placement.y, memory_address,
                         length_in_bytes, self._run, "Lost_seq_nums",
                         lost_seq_num)
-
-        return self._output
-
-    def _receive_data(
-            self, placement: Placement, connection: SCAMPConnection,
-            transaction_id: int) -> List[int]:
-        seq_nums: Set[int] = set()
-        lost_seq_nums: List[int] = list()
-        timeoutcount = 0
-        finished = False
-        while not finished:
-            try:
-                data = connection.receive(self._TIMEOUT_PER_RECEIVE_IN_SECONDS)
-                response_transaction_id, = _ONE_WORD.unpack_from(data, 4)
-                if transaction_id == response_transaction_id:
-                    timeoutcount = 0
-                    seq_nums, finished = self._process_data(
-                        data, seq_nums, finished, placement,
-                        lost_seq_nums, transaction_id, connection)
-                else:
-                    log.info(
-                        "ignoring packet as transaction id should be {}"
-                        " but is {}", transaction_id, response_transaction_id)
-            except SpinnmanTimeoutException as e:
-                if timeoutcount > TIMEOUT_RETRY_LIMIT:
-                    raise SpinnFrontEndException(
-                        "Failed to hear from the machine during "
-                        f"{timeoutcount} attempts. "
-                        "Please try removing firewalls") from e
-
-                timeoutcount += 1
-                # self.__reset_connection()
-                if not finished:
-                    finished = self._determine_and_retransmit_missing_seq_nums(
-                        seq_nums, placement, lost_seq_nums, transaction_id,
-                        connection)
-        return lost_seq_nums
+        self.__end_transfer()
 
     @staticmethod
     def __describe_fixed_route_from(placement: Placement) -> List[XY]:
@@ -1140,38 +1695,24 @@ class DataSpeedUpPacketGatherMachineVertex(
                 f"[{placement.x}:{placement.y}:{placement.p}] "
                 f"= {routers_used}\n")
 
-    def __missing_seq_nums(self, seq_nums: Set[int]) -> List[int]:
-        """
-        Determine which sequence numbers we've missed.
-
-        :param seq_nums: the set already acquired
-        :return: list of missing sequence numbers
-        """
-        return [sn for sn in range(self._max_seq_num) if sn not in seq_nums]
-
     def _determine_and_retransmit_missing_seq_nums(
-            self, seq_nums: Set[int], placement: Placement,
-            lost_seq_nums: List[int], transaction_id: int,
-            connection: SCAMPConnection) -> bool:
+            self, stream: DataOutStream) -> bool:
         """
         Determine if there are any missing sequence numbers, and if so
         retransmits the missing sequence numbers back to the core for
         retransmission.
 
-        :param seq_nums: the sequence numbers already received
-        :param placement: placement instance
-        :param lost_seq_nums:
-        :param transaction_id: transaction_id
-        :param connection: how to talk to the board
+        :param stream: the stream to check
         :return: whether all packets are transmitted
         """
         # locate missing sequence numbers from pile
-        missing_seq_nums = self.__missing_seq_nums(seq_nums)
+        missing_seq_nums = stream.seq_nums.missing()
+        transaction_id = stream.transaction_id
 
-        lost_seq_nums.append(len(missing_seq_nums))
+        stream.lost_seq_nums.append(len(missing_seq_nums))
         # for seq_num in sorted(seq_nums):
         #     log.debug("from list I'm missing sequence number {}", seq_num)
-        if not missing_seq_nums:
+        if not len(missing_seq_nums):
             return True
 
         # figure n packets given the 2 formats
@@ -1235,44 +1776,35 @@ class DataSpeedUpPacketGatherMachineVertex(
                 length_left_in_packet -= WORDS_FOR_COMMAND_TRANSACTION
 
             # fill data field
-            n_word_struct(size_of_data_left_to_transmit).pack_into(
-                data, offset, *missing_seq_nums[
-                    seq_num_offset:
-                    seq_num_offset + size_of_data_left_to_transmit])
+            data[offset:] = missing_seq_nums[
+                seq_num_offset:
+                seq_num_offset + size_of_data_left_to_transmit].tobytes()
             seq_num_offset += length_left_in_packet
 
             # build SDP message and send it to the core
-            connection.send_sdp_message(self.__make_data_out_message(
-                placement, data))
+            stream.connection.send_sdp_message(self.__make_data_out_message(
+                stream.placement, data))
 
             # sleep for ensuring core doesn't lose packets
             time.sleep(self._TIMEOUT_FOR_SENDING_IN_SECONDS)
+
             # log.debug(
             #     "send SDP packet with missing sequence numbers: {} of {}",
             #     _packet_count + 1, n_packets)
         return False
 
     def _process_data(
-            self, data: bytes, seq_nums: Set[int], finished: bool,
-            placement: Placement, lost_seq_nums: List[int],
-            transaction_id: int,
-            connection: SCAMPConnection) -> Tuple[Set[int], bool]:
+            self, stream: DataOutStream, first_packet_element: int,
+            data: Union[bytes, memoryview]) -> None:
         """
         Take a packet and process it see if we're finished yet.
 
+        :param stream: the stream the packet is for; updated
+        :param first_packet_element:
+            the first word of the packet, with the sequence number and flags
         :param data: the packet data
-        :param seq_nums: the list of sequence numbers received so far
-        :param finished: bool which states if finished or not
-        :param placement:
-            placement object for location on machine
-        :param transaction_id: the transaction ID for this stream
-        :param lost_seq_nums:
-            the list of n sequence numbers lost per iteration
-        :return: set of data items, if its the first packet, the list of
-            sequence numbers, the sequence number received and if its finished
         """
         length_of_data = len(data)
-        first_packet_element, = _ONE_WORD.unpack_from(data, 0)
 
         # get flags
         seq_num = first_packet_element & self._SEQUENCE_NUMBER_MASK
@@ -1280,10 +1812,10 @@ class DataSpeedUpPacketGatherMachineVertex(
             first_packet_element & self._LAST_MESSAGE_FLAG_BIT_MASK) != 0
 
         # check sequence number not insane
-        if seq_num > self._max_seq_num:
+        if seq_num > stream.max_seq_num:
             raise ValueError(
                 f"got an insane sequence number. got {seq_num} when "
-                f"the max is {self._max_seq_num} "
+                f"the max is {stream.max_seq_num} "
                 f"with a length of {length_of_data}")
 
         # figure offset for where data is to be put
@@ -1298,35 +1830,36 @@ class DataSpeedUpPacketGatherMachineVertex(
         if (not is_end_of_stream or
                 length_of_data != BYTES_FOR_SEQ_AND_TRANSACTION_ID):
             self.__write_into_view(
-                offset, true_data_length, data,
+                stream, offset, true_data_length, data,
                 BYTES_FOR_SEQ_AND_TRANSACTION_ID, length_of_data)
 
         # add sequence number to list
-        seq_nums.add(seq_num)
+        stream.seq_nums.add(seq_num)
 
         # if received a last flag on its own, its during retransmission.
         #  check and try again if required
         if is_end_of_stream:
-            if not self.__check(seq_nums):
-                finished = self._determine_and_retransmit_missing_seq_nums(
-                    seq_nums, placement, lost_seq_nums,
-                    transaction_id, connection)
+            if not stream.seq_nums.all_received:
+                stream.finished = (
+                    self._determine_and_retransmit_missing_seq_nums(stream))
             else:
-                finished = True
-        return seq_nums, finished
+                stream.finished = True
 
     @staticmethod
     def __offset(seq_num: int) -> int:
         return (seq_num * WORDS_PER_FULL_PACKET_WITH_SEQUENCE_NUM *
                 BYTES_PER_WORD)
 
+    @staticmethod
     def __write_into_view(
-            self, view_start_position: int, view_end_position: int,
-            data: bytes, data_start_position: int,
+            stream: DataOutStream, view_start_position: int,
+            view_end_position: int, data: Union[bytes, memoryview],
+            data_start_position: int,
             data_end_position: int) -> None:
         """
         Puts data into the view.
 
+        :param stream: the stream with the view to write to
         :param view_start_position: where in view to start
         :param view_end_position: where in view to end
         :param data: the data holder to write from
@@ -1334,40 +1867,12 @@ class DataSpeedUpPacketGatherMachineVertex(
         :param data_end_position: where in data holder to end
         :raises Exception: If the position to write to is crazy
         """
-        if self._view is None or self._output is None:
-            raise SpinnFrontEndException("no current target buffer")
-        if view_end_position > len(self._output):
+        if view_end_position > len(stream.output):
             raise ValueError(
                 f"End position {view_end_position} > "
-                f"output length {len(self._output)}")
-        self._view[view_start_position: view_end_position] = \
-            data[data_start_position:data_end_position]
-
-    def __check(self, seq_nums: Iterable[int]) -> bool:
-        """
-        Verify if the sequence numbers are correct.
-
-        :param seq_nums: the received sequence numbers
-        :return: Whether all the sequence numbers have been received
-        """
-        # hand back
-        seq_nums = sorted(seq_nums)
-        max_needed = self.__calculate_max_seq_num()
-        if len(seq_nums) > max_needed + 1:
-            raise ValueError(f"too many seq_nums: {len(seq_nums)}")
-        return len(seq_nums) == max_needed + 1
-
-    def __calculate_max_seq_num(self) -> int:
-        """
-        Deduce the max sequence number expected to be received.
-
-        :return: the biggest sequence number expected
-        """
-        if self._output is None:
-            raise SpinnFrontEndException("no receiving buffer")
-        return ceildiv(
-            len(self._output),
-            WORDS_PER_FULL_PACKET_WITH_SEQUENCE_NUM * BYTES_PER_WORD)
+                f"output length {len(stream.output)}")
+        stream.view[view_start_position: view_end_position] = \
+            memoryview(data)[data_start_position:data_end_position]
 
     @staticmethod
     def __provenance_address(x: int, y: int, p: int) -> int:
@@ -1393,3 +1898,11 @@ class DataSpeedUpPacketGatherMachineVertex(
             db.insert_core(x, y, p, _ProvLabels.RECEIVED, n_sdp_recvd)
             db.insert_core(x, y, p, _ProvLabels.IN_STREAMS, n_in_streams)
             db.insert_core(x, y, p, _ProvLabels.OUT_STREAMS, n_out_streams)
+            if self._pacer.lowest is not None:
+                db.insert_core(
+                    x, y, p, _ProvLabels.LOWEST_RATE, self._pacer.lowest)
+                db.insert_core(
+                    x, y, p, _ProvLabels.HIGHEST_RATE, self._pacer.highest)
+                db.insert_core(
+                    x, y, p, _ProvLabels.FINAL_RATE, self._pacer.rate)
+        self._pacer.clear_range()
@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 from __future__ import annotations
+from contextlib import nullcontext
 from enum import IntEnum
 import struct
 from typing import List, Optional, Sequence, Tuple, TYPE_CHECKING
@@ -130,10 +131,12 @@ class LivePacketGatherMachineVertex(
         ProvidesProvenanceDataFromMachineImpl.parse_extra_provenance_items)
     def parse_extra_provenance_items(
             self, label: str, x: int, y: int, p: int,
-            provenance_data: Sequence[int]) -> None:
+            provenance_data: Sequence[int],
+            db: Optional[ProvenanceWriter] = None) -> None:
         (lost, lost_payload, events, messages) = provenance_data
 
-        with ProvenanceWriter() as db:
+        with (nullcontext(db) if db is not None
+              else ProvenanceWriter()) as db:
             db.insert_core(x, y, p, "lost_packets_without_payload", lost)
             if lost > 0:
                 db.insert_report(
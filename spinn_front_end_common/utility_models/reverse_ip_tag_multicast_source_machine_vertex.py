@@ -15,6 +15,7 @@
 from __future__ import annotations
 
 import sys
+from contextlib import nullcontext
 from enum import IntEnum
 import logging
 import math
@@ -765,10 +766,12 @@ class ReverseIPTagMulticastSourceMachineVertex(
         ProvidesProvenanceDataFromMachineImpl.parse_extra_provenance_items)
     def parse_extra_provenance_items(
             self, label: str, x: int, y: int, p: int,
-            provenance_data: Sequence[int]) -> None:
+            provenance_data: Sequence[int],
+            db: Optional[ProvenanceWriter] = None) -> None:
         n_rcv, n_snt, bad_key, bad_pkt, late = provenance_data
 
-        with ProvenanceWriter() as db:
+        with (nullcontext(db) if db is not None
+              else ProvenanceWriter()) as db:
             db.insert_core(x, y, p, "Received_sdp_packets", n_rcv)
             if n_rcv == 0 and self._send_buffer_times is None:
                 db.insert_report(
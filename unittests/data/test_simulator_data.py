@@ -460,6 +460,24 @@ class TestSimulatorData(unittest.TestCase):
         with self.assertRaises(TypeError):
             writer.set_database_file_path(1)  # type: ignore[arg-type]
 
+    def test_previous_ds_database_path(self) -> None:
+        writer = FecDataWriter.setup()
+        self.assertIsNone(FecDataView.get_previous_ds_database_path())
+        path = os.path.abspath(__file__)
+        writer.set_ds_database_path(path)
+        self.assertEqual(path, FecDataView.get_previous_ds_database_path())
+        writer.start_run()
+        writer.finish_run()
+        writer.hard_reset()
+        # Kept after a reset, even a second one
+        self.assertEqual(path, FecDataView.get_previous_ds_database_path())
+        writer.start_run()
+        writer.finish_run()
+        writer.hard_reset()
+        self.assertEqual(path, FecDataView.get_previous_ds_database_path())
+        writer = FecDataWriter.setup()
+        self.assertIsNone(FecDataView.get_previous_ds_database_path())
+
     def test_executable_targets(self) -> None:
         writer = FecDataWriter.setup()
         with self.assertRaises(DataNotYetAvialable):
@@ -12,14 +12,20 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import mmap
+import struct
 import unittest
+from unittest import mock
 import os
-from typing import Sequence, Tuple
+from typing import List, Sequence, Tuple
 
 from spinn_utilities.config_holder import set_config
 from spinn_utilities.overrides import overrides
 
+from spinnman.transceiver.mockable_transceiver import MockableTransceiver
+
 from spinn_machine.version.version_strings import VersionStrings
+from spinn_machine.virtual_machine import virtual_machine_by_boards
 
 from pacman.model.graphs.machine import SimpleMachineVertex
 from pacman.model.placements import Placement, Placements
@@ -30,6 +36,8 @@ from spinn_front_end_common.interface.buffer_management.buffer_models import (
     AbstractReceiveBuffersToHost, AbstractReceiveRegionsToHost)
 from spinn_front_end_common.interface.buffer_management.storage_objects \
     import BufferDatabase
+from spinn_front_end_common.interface.buffer_management.storage_objects.\
+    buffer_database import RegionData
 from spinn_front_end_common.interface.config_setup import unittest_setup
 from spinn_front_end_common.utilities.exceptions import (
     BufferedRegionNotPresent)
@@ -47,6 +55,51 @@ class MockAbstractReceiveBuffersToHost(
         raise NotImplementedError
 
 
+class _MockRecorder(SimpleMachineVertex, AbstractReceiveBuffersToHost):
+
+    def __init__(self, regions: Sequence[int], address: int):
+        super().__init__(None)
+        self._regions = regions
+        self._address = address
+
+    @overrides(AbstractReceiveBuffersToHost.get_recorded_region_ids)
+    def get_recorded_region_ids(self) -> Sequence[int]:
+        return self._regions
+
+    @overrides(AbstractReceiveBuffersToHost.get_recording_region_base_address)
+    def get_recording_region_base_address(self, placement: Placement) -> int:
+        return self._address
+
+
+class _MockDownloader(SimpleMachineVertex, AbstractReceiveRegionsToHost):
+
+    def __init__(self, regions: Sequence[Tuple[int, int, int]]):
+        super().__init__(None)
+        self._regions = regions
+
+    @overrides(AbstractReceiveRegionsToHost.get_download_regions)
+    def get_download_regions(self, placement: Placement) -> Sequence[
+            Tuple[int, int, int]]:
+        return self._regions
+
+
+class _MemoryTransceiver(MockableTransceiver):
+    """
+    Pretend transceiver that reads from a single block of memory.
+    """
+
+    def __init__(self, memory: bytearray) -> None:
+        self.memory = memory
+        self.reads: List[Tuple[int, int]] = list()
+
+    @overrides(MockableTransceiver.read_memory)
+    def read_memory(
+            self, x: int, y: int, base_address: int, length: int,
+            cpu: int = 0) -> bytearray:
+        self.reads.append((base_address, length))
+        return self.memory[base_address:base_address + length]
+
+
 class MockAbstractReceiveRegionsToHost(
         SimpleMachineVertex, AbstractReceiveRegionsToHost):
 
@@ -142,6 +195,246 @@ class TestBufferedDatabase(unittest.TestCase):
 
             self.assertTrue(os.path.isfile(f), "DB still exists")
 
+    def test_recording_chunks(self) -> None:
+        set_config("Machine", "versions", VersionStrings.ANY.text)
+        writer = FecDataWriter.mock()
+        p1 = Placement(
+            MockAbstractReceiveBuffersToHost(None, label="V1"), 1, 2, 3)
+        writer.set_placements(Placements([p1]))
+        bm = BufferManager()
+        with self.assertRaises(BufferedRegionNotPresent):
+            list(bm.iter_recording_chunks(p1, 0))
+
+        with BufferDatabase() as brd:
+            brd.start_new_extraction()
+            brd.store_recording(1, 2, 3, 0, False, b"abc")
+            brd.start_new_extraction()
+            brd.store_recording(1, 2, 3, 0, True, b"")
+            brd.start_new_extraction()
+            brd.store_recording(1, 2, 3, 0, False, b"de")
+            chunks = [(bytes(data), missing) for data, missing in
+                      brd.iter_recording_chunks(1, 2, 3, 0)]
+            self.assertEqual(
+                [(b"abc", False), (b"", True), (b"de", False)], chunks)
+
+        chunks = [(bytes(data), missing) for data, missing in
+                  bm.iter_recording_chunks(p1, 0)]
+        self.assertEqual(
+            [(b"abc", False), (b"", True), (b"de", False)], chunks)
+
+    def test_store_many(self) -> None:
+        set_config("Machine", "versions", VersionStrings.ANY.text)
+        FecDataWriter.mock()
+        with BufferDatabase() as brd:
+            brd.start_new_extraction()
+            brd.store_recordings([
+                (1, 2, 3, 0, False, b"abc"), (1, 2, 3, 1, True, b"xy"),
+                (1, 2, 4, 0, False, b"z")])
+            brd.store_downloads([(1, 2, 3, 0, False, b"dl")])
+            brd.start_new_extraction()
+            brd.store_recordings([
+                (1, 2, 3, 0, False, b"def"), (1, 2, 4, 0, False, b"")])
+            brd.store_downloads([(1, 2, 3, 0, True, b"dl2")])
+
+            data, missing = brd.get_recording(1, 2, 3, 0)
+            self.assertFalse(missing)
+            self.assertEqual(b"abcdef", bytes(data))
+            data, missing = brd.get_recording(1, 2, 3, 1)
+            self.assertTrue(missing)
+            self.assertEqual(b"xy", bytes(data))
+            data, missing = brd.get_recording(1, 2, 4, 0)
+            self.assertFalse(missing)
+            self.assertEqual(b"z", bytes(data))
+            data, missing = brd.get_download_by_extraction_id(
+                1, 2, 3, 0, -1)
+            self.assertTrue(missing)
+            self.assertEqual(b"dl2", bytes(data))
+            data, missing = brd.get_download_by_extraction_id(1, 2, 3, 0, 1)
+            self.assertFalse(missing)
+            self.assertEqual(b"dl", bytes(data))
+
+    def test_compression(self) -> None:
+        for codec in ["zlib", "lzma"]:
+            unittest_setup()
+            set_config("Machine", "versions", VersionStrings.ANY.text)
+            set_config("Buffers", "compression_codec", codec)
+            FecDataWriter.mock()
+            data1 = bytes(range(256)) * 100
+            data2 = b"x" * 5000
+            with BufferDatabase() as brd:
+                brd.start_new_extraction()
+                brd.store_recording(1, 2, 3, 0, False, data1)
+                brd.store_download(1, 2, 3, 0, False, data2)
+                brd.start_new_extraction()
+                brd.store_recordings([(1, 2, 3, 0, False, data2)])
+                brd.store_downloads([(1, 2, 3, 0, False, b"")])
+
+                data, _ = brd.get_recording(1, 2, 3, 0)
+                self.assertEqual(data1 + data2, bytes(data))
+                data, _ = brd.get_recording_by_extraction_id(
+                    1, 2, 3, 0, -1)
+                self.assertEqual(data2, bytes(data))
+                self.assertEqual([data1, data2], [
+                    bytes(chunk) for chunk, _ in
+                    brd.iter_recording_chunks(1, 2, 3, 0)])
+                data, _ = brd.get_download_by_extraction_id(1, 2, 3, 0, 1)
+                self.assertEqual(data2, bytes(data))
+                data, _ = brd.get_download_by_extraction_id(1, 2, 3, 0, 2)
+                self.assertEqual(b"", bytes(data))
+                for row in brd.cursor().execute(
+                        "SELECT sum(length(content)) AS stored "
+                        "FROM recording_data"):
+                    self.assertLess(row["stored"], len(data1) + len(data2))
+
+    def test_sidecar(self) -> None:
+        set_config("Machine", "versions", VersionStrings.ANY.text)
+        set_config("Buffers", "sidecar_threshold", "100")
+        set_config("Buffers", "compression_codec", "zlib")
+        writer = FecDataWriter.mock()
+        p1 = Placement(
+            MockAbstractReceiveBuffersToHost(None, label="V1"), 1, 2, 3)
+        writer.set_placements(Placements([p1]))
+        bm = BufferManager()
+        big1 = bytes(range(200))
+        big2 = b"y" * 150
+        with BufferDatabase() as brd:
+            brd.start_new_extraction()
+            brd.store_recording(1, 2, 3, 0, False, big1)
+            brd.store_recording(1, 2, 3, 1, False, b"small")
+            brd.start_new_extraction()
+            # Once in the sidecar even small data goes there
+            brd.store_recordings([
+                (1, 2, 3, 0, True, b"abc"), (1, 2, 3, 1, False, big2)])
+            brd.start_new_extraction()
+            brd.store_recordings([(1, 2, 3, 0, False, big2)])
+            for row in brd.cursor().execute(
+                    "SELECT count(*) AS n FROM recording_data "
+                    "WHERE sidecar_offset IS NOT NULL"):
+                self.assertEqual(4, row["n"])
+            data, missing = brd.get_recording(1, 2, 3, 0)
+            self.assertTrue(missing)
+            self.assertEqual(big1 + b"abc" + big2, bytes(data))
+            self.assertIsInstance(data.obj, mmap.mmap)
+            self.assertEqual([big1, b"abc", big2], [
+                bytes(chunk) for chunk, _ in
+                brd.iter_recording_chunks(1, 2, 3, 0)])
+            data, _ = brd.get_recording_by_extraction_id(1, 2, 3, 0, 2)
+            self.assertEqual(b"abc", bytes(data))
+            data, _ = brd.get_recording(1, 2, 3, 1)
+            self.assertEqual(b"small" + big2, bytes(data))
+
+        held, _ = bm.get_recording(p1, 0)
+        self.assertEqual(big1 + b"abc" + big2, bytes(held))
+        bm.clear_recorded_data(1, 2, 3, 0)
+        data, missing = bm.get_recording(p1, 0)
+        self.assertTrue(missing)
+        self.assertEqual(b"", bytes(data))
+        # Data already handed out can still be read
+        self.assertEqual(big1 + b"abc" + big2, bytes(held))
+
+    def test_sidecar_mapping(self) -> None:
+        set_config("Buffers", "sidecar_threshold", "100")
+        set_config("Buffers", "compression_codec", "None")
+        size = 3 * mmap.ALLOCATIONGRANULARITY
+        big1 = b"a" * size
+        big2 = b"b" * size
+        with BufferDatabase() as brd:
+            brd.start_new_extraction()
+            brd.store_recording(1, 2, 3, 0, False, big1)
+            brd.start_new_extraction()
+            brd.store_recording(1, 2, 3, 0, False, big2)
+            # Only the part of the file holding the data is mapped
+            data, _ = brd.get_recording_by_extraction_id(1, 2, 3, 0, 2)
+            self.assertEqual(big2, bytes(data))
+            assert isinstance(data.obj, mmap.mmap)
+            self.assertLessEqual(
+                len(data.obj), size + mmap.ALLOCATIONGRANULARITY)
+
+            # A file that can not be removed yet is left for a later clear
+            held, _ = brd.get_recording(1, 2, 3, 0)
+            first = brd._sidecar_path(1)
+            with mock.patch("os.remove", side_effect=PermissionError):
+                brd.clear_recording_region(1, 2, 3, 0)
+            self.assertTrue(os.path.exists(first))
+            self.assertEqual(big1 + big2, bytes(held))
+            del data, held
+            brd.start_new_extraction()
+            brd.store_recording(1, 2, 3, 0, False, big2)
+            second = brd._sidecar_path(1)
+            self.assertNotEqual(first, second)
+            data, _ = brd.get_recording(1, 2, 3, 0)
+            self.assertEqual(big2, bytes(data))
+            del data
+            brd.clear_recording_region(1, 2, 3, 0)
+            self.assertFalse(os.path.exists(first))
+            self.assertFalse(os.path.exists(second))
+
+    def test_extract_by_board(self) -> None:
+        set_config("Machine", "versions", VersionStrings.BIG.text)
+        set_config("Machine", "enable_advanced_monitor_support", "False")
+        set_config("Buffers", "n_extraction_threads", "4")
+        set_config("Buffers", "compression_codec", "zlib")
+        writer = FecDataWriter.mock()
+        machine = virtual_machine_by_boards(3)
+        writer.set_machine(machine)
+        info = Placements([])
+        for chip in machine.ethernet_connected_chips:
+            for x, y in machine.get_existing_xys_on_board(chip):
+                info.add_placement(Placement(
+                    MockAbstractReceiveBuffersToHost(None), x, y, 1))
+        writer.set_placements(info)
+
+        class _MockBufferManager(BufferManager):
+            def _read_by_chip(self, placements: List[Placement]) -> List[
+                    Tuple[List[RegionData], List[RegionData]]]:
+                return [
+                    ([(placement.x, placement.y, placement.p, 0, False,
+                       f"{placement.x},{placement.y}".encode())], [])
+                    for placement in placements]
+
+        bm = _MockBufferManager()
+        bm.extract_data()
+        for placement in info:
+            data, missing = bm.get_recording(placement, 0)
+            self.assertFalse(missing)
+            self.assertEqual(
+                f"{placement.x},{placement.y}".encode(), bytes(data))
+
+    def test_read_by_chip(self) -> None:
+        set_config("Machine", "versions", VersionStrings.ANY.text)
+        set_config("Machine", "enable_advanced_monitor_support", "False")
+        writer = FecDataWriter.mock()
+        memory = bytearray(0x2000)
+        memory[0x1000:0x101C] = bytes(range(0x1C))
+
+        # Two adjacent headers, with regions one after the other
+        memory[0x100:0x11C] = struct.pack(
+            "<7I", 2, 10, 10, 0x1000, 10, 6 | 0x80000000, 0x100A)
+        memory[0x11C:0x12C] = struct.pack("<4I", 1, 4, 4, 0x1010)
+        info = Placements([])
+        p1 = Placement(_MockRecorder([0, 1], 0x100), 0, 0, 1)
+        p2 = Placement(_MockRecorder([0], 0x11C), 0, 0, 2)
+        p3 = Placement(_MockDownloader([(0, 0x1014, 8)]), 0, 0, 3)
+        info.add_placement(p1)
+        info.add_placement(p2)
+        info.add_placement(p3)
+        writer.set_placements(info)
+        transceiver = _MemoryTransceiver(memory)
+        writer.set_transceiver(transceiver)
+
+        bm = BufferManager()
+        bm.extract_data()
+        self.assertEqual([(0x100, 44), (0x1000, 0x1C)], transceiver.reads)
+        for placement, region, expected, expect_missing in [
+                (p1, 0, range(10), False), (p1, 1, range(10, 16), True),
+                (p2, 0, range(16, 20), False)]:
+            data, missing = bm.get_recording(placement, region)
+            self.assertEqual(bytes(expected), bytes(data))
+            self.assertEqual(expect_missing, missing)
+        data, missing = bm.get_download(p3, 0)
+        self.assertEqual(bytes(range(20, 28)), bytes(data))
+        self.assertFalse(missing)
+
     def test_download(self) -> None:
         set_config("Machine", "versions", VersionStrings.ANY.text)
         writer = FecDataWriter.mock()
@@ -219,6 +512,72 @@ class TestBufferedDatabase(unittest.TestCase):
         self.assertTrue(missing, "data should be 'missing'")
         self.assertEqual(bytes(data), b"")
 
+    def test_recording_cache(self) -> None:
+        set_config("Machine", "versions", VersionStrings.ANY.text)
+        set_config("Buffers", "recording_cache_bytes", "8")
+        writer = FecDataWriter.mock()
+
+        info = Placements([])
+        p1 = Placement(
+            MockAbstractReceiveBuffersToHost(None, label="V1"), 1, 2, 3)
+        p2 = Placement(
+            MockAbstractReceiveRegionsToHost(None, label="V2"), 1, 2, 4)
+        info.add_placement(p1)
+        info.add_placement(p2)
+        writer.set_placements(info)
+
+        bm = BufferManager()
+        cache = bm.recording_cache
+        assert cache is not None
+        with BufferDatabase() as brd:
+            brd.start_new_extraction()
+            brd.store_recording(1, 2, 3, 0, False, b"abc")
+            brd.store_download(1, 2, 4, 0, False, b"defg")
+
+        for _ in range(2):
+            data, _ = bm.get_recording(p1, 0)
+            self.assertEqual(b"abc", bytes(data))
+            data, _ = bm.get_download(p2, 0)
+            self.assertEqual(b"defg", bytes(data))
+        # A hit does not need the database at all
+        with mock.patch(
+                "spinn_front_end_common.interface.buffer_management."
+                "buffer_manager.BufferDatabase", side_effect=AssertionError):
+            data, _ = bm.get_download(p2, 0)
+        self.assertEqual(3, cache.hits)
+        self.assertEqual(2, cache.misses)
+        self.assertEqual(7, cache.n_bytes)
+        with self.assertRaises(TypeError):
+            data[0] = 0
+
+        # New data is seen once there is a new extraction; one not made by
+        # the manager is only seen after a reset
+        with BufferDatabase() as brd:
+            brd.start_new_extraction()
+            brd.store_recording(1, 2, 3, 0, False, b"hij")
+            brd.store_download(1, 2, 4, 0, False, b"klmno")
+        bm.reset()
+        data, _ = bm.get_recording(p1, 0)
+        self.assertEqual(b"abchij", bytes(data))
+        self.assertEqual(3, cache.misses)
+
+        # Too big to keep both, so the least recently used is dropped
+        data, _ = bm.get_download(p2, 0)
+        self.assertEqual(b"klmno", bytes(data))
+        self.assertEqual(5, cache.n_bytes)
+        data, _ = bm.get_recording(p1, 0)
+        self.assertEqual(6, cache.n_bytes)
+        self.assertEqual(5, cache.misses)
+
+        bm.clear_recorded_data(1, 2, 3, 0)
+        self.assertEqual(0, cache.n_bytes)
+        data, missing = bm.get_recording(p1, 0)
+        self.assertTrue(missing)
+        self.assertEqual(b"", bytes(data))
+
+        bm.reset()
+        self.assertEqual(0, cache.n_bytes)
+
     def test_not_recording_type(self) -> None:
         writer = FecDataWriter.mock()
         info = Placements([])
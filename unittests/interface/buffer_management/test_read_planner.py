@@ -0,0 +1,62 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+from typing import List, Tuple
+
+from spinn_front_end_common.interface.buffer_management.read_planner import (
+    ReadPlanner)
+
+_MEMORY = bytes(range(256))
+
+
+class TestReadPlanner(unittest.TestCase):
+
+    def _read(self, planner: ReadPlanner) -> Tuple[
+            List[bytes], List[Tuple[int, int]]]:
+        transfers: List[Tuple[int, int]] = list()
+
+        def reader(address: int, size: int) -> bytes:
+            transfers.append((address, size))
+            return _MEMORY[address:address + size]
+        return [bytes(view) for view in planner.read(reader)], transfers
+
+    def test_merge(self) -> None:
+        planner = ReadPlanner()
+        reads = [(20, 10), (0, 10), (10, 5), (12, 2), (40, 4), (50, 0)]
+        for address, size in reads:
+            planner.add(address, size)
+        data, transfers = self._read(planner)
+        self.assertEqual([(0, 15), (20, 10), (40, 4)], transfers)
+        self.assertEqual(
+            [_MEMORY[address:address + size] for address, size in reads],
+            data)
+
+    def test_gap(self) -> None:
+        planner = ReadPlanner(max_gap=5)
+        self.assertEqual(0, planner.add(0, 10))
+        self.assertEqual(1, planner.add(15, 10))
+        self.assertEqual(2, planner.add(31, 1))
+        data, transfers = self._read(planner)
+        self.assertEqual([(0, 25), (31, 1)], transfers)
+        self.assertEqual([_MEMORY[0:10], _MEMORY[15:25], _MEMORY[31:32]], data)
+
+    def test_empty(self) -> None:
+        data, transfers = self._read(ReadPlanner())
+        self.assertEqual([], data)
+        self.assertEqual([], transfers)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -12,9 +12,12 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import io
 from sqlite3 import IntegrityError
 import unittest
 
+import numpy
+
 from spinn_utilities.config_holder import set_config
 from spinn_utilities.overrides import overrides
 
@@ -32,7 +35,8 @@ from spinn_front_end_common.data.fec_data_writer import (
     FecDataView, FecDataWriter)
 from spinn_front_end_common.interface.config_setup import unittest_setup
 from spinn_front_end_common.interface.ds import \
-    DataSpecificationGenerator, DataSpecificationReloader, DsSqlliteDatabase
+    DataSpecificationGenerator, DataSpecificationReloader, DataType, \
+    DsSqlliteDatabase
 from spinn_front_end_common.utilities.constants import (
     APP_PTR_TABLE_BYTE_SIZE)
 from spinn_front_end_common.utilities.exceptions import (
@@ -209,6 +213,55 @@ class TestDataSpecification(unittest.TestCase):
             self.assertEqual(12, db.get_max_content_size(True))
             self.assertEqual([(12, 1), (4, 1)], db.get_content_sizes(True))
 
+    def test_shared_content(self) -> None:
+        set_config("Machine", "versions", VersionStrings.FOUR_PLUS.text)
+        vertex = _TestVertexWithBinary(
+            "binary", ExecutableType.USES_SIMULATION_INTERFACE)
+        with DsSqlliteDatabase() as db:
+            for p in (2, 3):
+                dsg = DataSpecificationGenerator(0, 1, p, vertex, db)
+                dsg.reserve_memory_region(1, 100)
+                dsg.reserve_memory_region(2, 100)
+                dsg.switch_write_focus(1)
+                dsg.write_array([0xFFFFFFFF, 2, 3])
+                dsg.switch_write_focus(2)
+                dsg.write_value(p)
+                dsg.end_specification()
+            db.set_region_pointer(0, 1, 2, 1, 100)
+
+            # The same content of region 1 is only stored once
+            rows = list(db.cursor().execute(
+                "SELECT COUNT(*) AS num FROM content"))
+            self.assertEqual(3, rows[0]["num"])
+            self.assertEqual([(12, 2), (4, 2)], db.get_content_sizes(False))
+
+            self.assertEqual(
+                [(1, 100, b"\xff\xff\xff\xff\x02\x00\x00\x00\x03\x00\x00\x00",
+                  4), (2, None, b"\x02\x00\x00\x00", 2)],
+                list(db.get_region_pointers_contents_and_checksums(0, 1, 2)))
+
+    def test_java_content(self) -> None:
+        set_config("Machine", "versions", VersionStrings.FOUR_PLUS.text)
+        set_config("Java", "use_java", "True")
+        vertex = _TestVertexWithBinary(
+            "binary", ExecutableType.USES_SIMULATION_INTERFACE)
+        with DsSqlliteDatabase() as db:
+            for p in (2, 3):
+                dsg = DataSpecificationGenerator(0, 1, p, vertex, db)
+                dsg.reserve_memory_region(1, 100)
+                dsg.switch_write_focus(1)
+                dsg.write_array([0xFFFFFFFF, 2, 3])
+                dsg.end_specification()
+
+            # Java reads the content of each region from the region itself
+            rows = list(db.cursor().execute(
+                "SELECT p, content FROM region ORDER BY p"))
+            content = b"\xff\xff\xff\xff\x02\x00\x00\x00\x03\x00\x00\x00"
+            self.assertEqual(
+                [(2, content), (3, content)],
+                [(row["p"], row["content"]) for row in rows])
+            self.assertEqual([(12, 2)], db.get_content_sizes(False))
+
     def test_switch_write_focus(self) -> None:
         set_config("Machine", "versions", VersionStrings.ANY.text)
         vertex = _TestVertexWithBinary(
@@ -289,6 +342,32 @@ class TestDataSpecification(unittest.TestCase):
             with self.assertRaises(DsDatabaseException):
                 db.get_region_pointer(1, 2, 3, 9)
 
+    def test_pointers_many(self) -> None:
+        set_config("Machine", "versions", VersionStrings.FOUR_PLUS.text)
+        vertex = _TestVertexWithBinary("binary", ExecutableType.SYSTEM)
+        with DsSqlliteDatabase() as db:
+            for p in (1, 2):
+                dsg = DataSpecificationGenerator(1, 1, p, vertex, db)
+                dsg.reserve_memory_region(2, 100 * p)
+                dsg.reserve_memory_region(1, 12)
+            DataSpecificationGenerator(1, 1, 3, vertex, db)
+            self.assertEqual(
+                {(1, 1, 1): {1: 12, 2: 100}, (1, 1, 2): {1: 12, 2: 200}},
+                db.get_region_sizes_by_core(True))
+            self.assertEqual({}, db.get_region_sizes_by_core(False))
+
+            db.set_start_addresses([(1, 1, 1, 1000), (1, 1, 3, 3000)])
+            self.assertEqual(1000, db.get_start_address(1, 1, 1))
+            self.assertEqual(3000, db.get_start_address(1, 1, 3))
+            db.set_region_pointers([(1, 1, 1, 1, 1400), (1, 1, 2, 2, 2400)])
+            self.assertEqual(1400, db.get_region_pointer(1, 1, 1, 1))
+            self.assertEqual(2400, db.get_region_pointer(1, 1, 2, 2))
+
+            with self.assertRaises(DsDatabaseException):
+                db.set_start_addresses([(1, 1, 2, 2000), (1, 3, 4, 123)])
+            with self.assertRaises(DsDatabaseException):
+                db.set_region_pointers([(1, 1, 2, 1, 2000), (1, 1, 3, 1, 0)])
+
     def test_write(self) -> None:
         set_config("Machine", "versions", VersionStrings.FOUR_PLUS.text)
         vertex = _TestVertexWithBinary(
@@ -343,6 +422,65 @@ class TestDataSpecification(unittest.TestCase):
                 db.set_region_content(
                     0, 1, 4, 5, bytearray(b'\x0c\x00\x00\x00'), "test")
 
+    def test_rewrite_empty_content(self) -> None:
+        set_config("Machine", "versions", VersionStrings.FOUR_PLUS.text)
+        vertex = _TestVertexWithBinary(
+            "binary", ExecutableType.SYSTEM)
+        with DsSqlliteDatabase() as db:
+            dsg = DataSpecificationGenerator(0, 1, 2, vertex, db)
+            dsg.reserve_memory_region(1, 100, "test")
+            db.set_region_content(0, 1, 2, 1, b"", None)
+            # Empty content can be replaced
+            db.set_region_content(0, 1, 2, 1, b"\x01\x00\x00\x00", None)
+            (_, _, content), = db.get_region_pointers_and_content(0, 1, 2)
+            self.assertEqual(b"\x01\x00\x00\x00", content)
+            with self.assertRaises(DsDatabaseException):
+                db.set_region_content(0, 1, 2, 1, b"", None)
+
+    def test_write_large(self) -> None:
+        set_config("Machine", "versions", VersionStrings.FOUR_PLUS.text)
+        vertex = _TestVertexWithBinary(
+            "binary", ExecutableType.SYSTEM)
+        data = numpy.arange(200000, dtype="uint32")
+        with DsSqlliteDatabase() as db:
+            dsg = DataSpecificationGenerator(0, 1, 2, vertex, db)
+            dsg.reserve_memory_region(1, 1000000, "big")
+            dsg.reserve_memory_region(2, 8, "small")
+            dsg.switch_write_focus(1)
+            dsg.write_value(7)
+            # Grows beyond what was allocated at the start
+            dsg.write_array(data)
+            dsg.write_array([-1, -2], DataType.INT32)
+            # No debug text when not reporting
+            self.assertIsNone(dsg._content_debug)
+            dsg.switch_write_focus(2)
+            dsg.write_array([1, 2, 3])
+            # Writing too much is still only found at the end of the region
+            with self.assertRaises(DataSpecException):
+                dsg.end_specification()
+
+            regions = {region: content for region, _, content
+                       in db.get_regions_content(0, 1, 2)}
+            self.assertEqual(
+                numpy.array([7], dtype="uint32").tobytes() + data.tobytes() +
+                numpy.array([-1, -2], dtype="int32").tobytes(),
+                regions[1])
+
+    def test_write_reported(self) -> None:
+        set_config("Machine", "versions", VersionStrings.FOUR_PLUS.text)
+        vertex = _TestVertexWithBinary(
+            "binary", ExecutableType.SYSTEM)
+        report = io.StringIO()
+        with DsSqlliteDatabase() as db:
+            dsg = DataSpecificationGenerator(0, 1, 2, vertex, db, report)
+            dsg.reserve_memory_region(1, 100, "reported")
+            dsg.switch_write_focus(1)
+            dsg.write_value(7)
+            dsg.write_array([8, 9])
+            self.assertEqual("7:UINT32 [8, 9]:Array ", dsg._debug_text)
+            dsg.end_specification()
+        self.assertIn("WRITE_ARRAY 2 elements in 8 bytes", report.getvalue())
+
     def test_ds_cores(self) -> None:
         set_config("Machine", "versions", VersionStrings.FOUR_PLUS.text)
         vertex = _TestVertexWithBinary(
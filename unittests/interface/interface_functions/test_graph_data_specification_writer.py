@@ -0,0 +1,215 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import threading
+from typing import Dict, List, Optional, Tuple
+import unittest
+
+from spinn_utilities.config_holder import set_config
+from spinn_utilities.overrides import overrides
+
+from spinn_machine.version.version_strings import VersionStrings
+from spinn_machine.virtual_machine import virtual_machine_by_boards
+
+from spinnman.model.enums import ExecutableType
+
+from pacman.model.graphs.machine import SimpleMachineVertex
+from pacman.model.placements import Placement, Placements
+from pacman.model.resources import ConstantSDRAM
+
+from spinn_front_end_common.abstract_models import (
+    AbstractHasAssociatedBinary, AbstractGeneratesDataSpecification,
+    AbstractGeneratesThreadSafeDataSpecification,
+    AbstractHasDataSpecificationFingerprint)
+from spinn_front_end_common.data.fec_data_writer import FecDataWriter
+from spinn_front_end_common.interface.config_setup import unittest_setup
+from spinn_front_end_common.interface.ds import (
+    DataSpecificationGenerator, DsSqlliteDatabase)
+from spinn_front_end_common.interface.interface_functions import (
+    graph_data_specification_writer)
+from spinn_front_end_common.utilities.exceptions import (
+    ConfigurationException, DataSpecException)
+
+
+class _TestVertex(SimpleMachineVertex, AbstractHasAssociatedBinary,
+                  AbstractGeneratesDataSpecification):
+
+    def __init__(self, size: int, reference: bool = False,
+                 referenced: Optional[int] = None):
+        super().__init__(ConstantSDRAM(size))
+        self._size = size
+        self._reference = reference
+        self._referenced = referenced
+        self.n_generated = 0
+        self.thread_name = ""
+
+    @overrides(AbstractHasAssociatedBinary.get_binary_file_name)
+    def get_binary_file_name(self) -> str:
+        return "binary"
+
+    @overrides(AbstractHasAssociatedBinary.get_binary_start_type)
+    def get_binary_start_type(self) -> ExecutableType:
+        return ExecutableType.USES_SIMULATION_INTERFACE
+
+    @overrides(AbstractGeneratesDataSpecification.generate_data_specification)
+    def generate_data_specification(self, spec: DataSpecificationGenerator,
+                                    placement: Placement) -> None:
+        self.n_generated += 1
+        self.thread_name = threading.current_thread().name
+        spec.reserve_memory_region(
+            0, self._size, reference=self._referenced)
+        if self._reference:
+            spec.reference_memory_region(1, 99)
+        spec.switch_write_focus(0)
+        spec.write_array(list(range(
+            placement.x, placement.x + min(self._size, 400) // 4)))
+        spec.end_specification()
+
+
+class _ThreadSafeVertex(_TestVertex,
+                        AbstractGeneratesThreadSafeDataSpecification):
+    pass
+
+
+class _FingerprintVertex(_ThreadSafeVertex,
+                         AbstractHasDataSpecificationFingerprint):
+
+    def __init__(self, size: int, fingerprint: Optional[bytes],
+                 reference: bool = False, referenced: Optional[int] = None):
+        super().__init__(size, reference, referenced)
+        self.fingerprint = fingerprint
+
+    @overrides(AbstractHasDataSpecificationFingerprint
+               .get_data_specification_fingerprint)
+    def get_data_specification_fingerprint(
+            self, placement: Placement) -> Optional[bytes]:
+        return self.fingerprint
+
+
+class TestGraphDataSpecificationWriter(unittest.TestCase):
+
+    def setUp(self) -> None:
+        unittest_setup()
+        set_config("Machine", "versions", VersionStrings.ANY.text)
+        set_config("Reports", "write_text_specs", "False")
+        self.writer = FecDataWriter.mock()
+        self.writer.set_machine(virtual_machine_by_boards(1))
+        self.writer.set_max_run_time_steps(100)
+
+    def _run(self, n_threads: int, vertices: List[_TestVertex]) -> Dict[
+            Tuple[int, int, int], List[Tuple[int, int, bytes]]]:
+        set_config(
+            "Mapping", "n_data_specification_threads", str(n_threads))
+        placements = [
+            Placement(vertex, i % 4, 0, 1 + i // 4)
+            for i, vertex in enumerate(vertices)]
+        self.writer.set_placements(Placements(placements))
+        path = graph_data_specification_writer()
+        contents = dict()
+        with DsSqlliteDatabase(path) as db:
+            for placement in placements:
+                xyp = (placement.x, placement.y, placement.p)
+                contents[xyp] = list(db.get_regions_content(*xyp))
+        os.remove(path)
+        return contents
+
+    def test_threads_match_serial(self) -> None:
+        vertices: List[_TestVertex] = [
+            _ThreadSafeVertex(100 + i * 4) for i in range(20)]
+        serial = self._run(1, vertices)
+        self.assertEqual(20, len(serial))
+        self.assertEqual(serial, self._run(4, vertices))
+
+    def test_threads_only_thread_safe(self) -> None:
+        vertices: List[_TestVertex] = [
+            _ThreadSafeVertex(100) if i % 2 else _TestVertex(100)
+            for i in range(20)]
+        self._run(4, vertices)
+        for vertex in vertices:
+            self.assertEqual(
+                isinstance(vertex,
+                           AbstractGeneratesThreadSafeDataSpecification),
+                vertex.thread_name.startswith("DataSpecGenerator"))
+
+    def test_threads_check_sdram(self) -> None:
+        vertices: List[_TestVertex] = [
+            _ThreadSafeVertex(100) for _ in range(20)]
+        # Too big to share the chip, whichever thread generates it
+        sdram = self.writer.get_chip_at(0, 0).sdram
+        vertices.append(_ThreadSafeVertex(sdram))
+        with self.assertRaises(ConfigurationException):
+            self._run(4, vertices)
+
+    def test_threads_check_references(self) -> None:
+        vertices: List[_TestVertex] = [
+            _ThreadSafeVertex(100) for _ in range(20)]
+        vertices[7] = _ThreadSafeVertex(100, reference=True)
+        with self.assertRaises(DataSpecException):
+            self._run(4, vertices)
+
+    def test_fingerprint_reuse(self) -> None:
+        vertices: List[_TestVertex] = [
+            _TestVertex(100, referenced=99), _FingerprintVertex(100, b"a"),
+            _FingerprintVertex(100, b"b"), _FingerprintVertex(100, None)]
+        self.writer.set_placements(Placements([
+            Placement(vertex, 0, 0, 1 + i)
+            for i, vertex in enumerate(vertices)]))
+        first_path = graph_data_specification_writer()
+        self.writer.set_ds_database_path(first_path)
+        with DsSqlliteDatabase(first_path) as db:
+            self.assertEqual(b"a", db.get_fingerprint(0, 0, 2))
+            self.assertIsNone(db.get_fingerprint(0, 0, 4))
+            first = list(db.get_regions(0, 0, 2))
+
+        changed = vertices[2]
+        assert isinstance(changed, _FingerprintVertex)
+        changed.fingerprint = b"changed"
+        set_config("Reports", "path_dataspec_database", "ds_again.sqlite3")
+        for n_threads in ("1", "4"):
+            set_config("Mapping", "n_data_specification_threads", n_threads)
+            path = graph_data_specification_writer()
+            self.assertEqual(
+                [2, 1, 2, 2], [vertex.n_generated for vertex in vertices])
+            with DsSqlliteDatabase(path) as db:
+                self.assertEqual(first, list(db.get_regions(0, 0, 2)))
+            os.remove(path)
+            for vertex in vertices:
+                vertex.n_generated = 1
+        os.remove(first_path)
+
+    def test_fingerprint_references_not_reused(self) -> None:
+        vertices: List[_TestVertex] = [
+            _FingerprintVertex(100, b"a", referenced=99),
+            _FingerprintVertex(100, b"b", reference=True),
+            _FingerprintVertex(100, b"c")]
+        self.writer.set_placements(Placements([
+            Placement(vertex, 0, 0, 1 + i)
+            for i, vertex in enumerate(vertices)]))
+        first_path = graph_data_specification_writer()
+        self.writer.set_ds_database_path(first_path)
+        set_config("Reports", "path_dataspec_database", "ds_again.sqlite3")
+        path = graph_data_specification_writer()
+        # Only the core without references is reused
+        self.assertEqual(
+            [2, 2, 1], [vertex.n_generated for vertex in vertices])
+        with DsSqlliteDatabase(path) as db:
+            self.assertEqual(
+                [(1, 99, None)], list(db.get_references(0, 0, 2)))
+        os.remove(path)
+        os.remove(first_path)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -21,9 +21,10 @@ from spinn_utilities.config_holder import set_config
 from spinn_utilities.overrides import overrides
 
 from spinn_machine.version.version_strings import VersionStrings
+from spinn_machine.virtual_machine import virtual_machine_by_boards
 
 from spinnman.transceiver.version5transceiver import Version5Transceiver
-from spinnman.model.enums import ExecutableType
+from spinnman.model.enums import ExecutableType, UserRegister
 
 from pacman.model.graphs.machine import SimpleMachineVertex
 from pacman.model.placements import Placement, Placements
@@ -38,7 +39,7 @@ from spinn_front_end_common.interface.interface_functions import (
 from spinn_front_end_common.interface.config_setup import unittest_setup
 from spinn_front_end_common.interface.ds import DsSqlliteDatabase
 from spinn_front_end_common.utilities.constants import (
-    BYTES_PER_WORD, MAX_MEM_REGIONS)
+    BYTES_PER_WORD, CORE_DATA_SDRAM_BASE_TAG, MAX_MEM_REGIONS)
 from spinn_front_end_common.utilities.exceptions import DataSpecException
 
 
@@ -65,6 +66,19 @@ class _MockTransceiver(Version5Transceiver):
         self._next_address += size
         return address
 
+    @overrides(Version5Transceiver.malloc_sdram_multi)
+    def malloc_sdram_multi(
+            self, allocations: List[Tuple[int, int, int, int, int]]
+            ) -> List[int]:
+        return [self.malloc_sdram(*allocation) for allocation in allocations]
+
+    @overrides(Version5Transceiver.write_user_many)
+    def write_user_many(
+            self, values: List[Tuple[int, int, int, UserRegister, int]],
+            description: Optional[str] = None) -> None:
+        for x, y, p, user, value in values:
+            self.write_user(x, y, p, user, value)
+
     @overrides(Version5Transceiver.write_memory)
     def write_memory(
             self, x: int, y: int, base_address: int,
@@ -83,6 +97,17 @@ class _MockTransceiver(Version5Transceiver):
         pass
 
 
+class _ByCoreTransceiver(_MockTransceiver):
+    """ Pretend transceiver where the memory of each core does not depend on
+    the order the cores are allocated in
+    """
+
+    @overrides(_MockTransceiver.malloc_sdram)
+    def malloc_sdram(
+            self, x: int, y: int, size: int, app_id: int, tag: int = 0) -> int:
+        return ((x * 256 + y) * 32 + tag - CORE_DATA_SDRAM_BASE_TAG) * 0x1000
+
+
 class _TestVertexWithBinary(SimpleMachineVertex, AbstractHasAssociatedBinary,
                             AbstractGeneratesDataSpecification):
 
@@ -325,6 +350,56 @@ class TestLoadDataSpecification(unittest.TestCase):
             with self.assertRaises(DataSpecException):
                 load_application_data_specs()
 
+    def test_load_by_board(self) -> None:
+        set_config("Machine", "versions", VersionStrings.FOUR_PLUS.text)
+        writer = FecDataWriter.mock()
+        writer.set_machine(virtual_machine_by_boards(3))
+        vertex = _TestVertexWithBinary(
+            "binary", ExecutableType.USES_SIMULATION_INTERFACE)
+        with DsSqlliteDatabase() as db:
+            for chip in writer.get_machine().chips:
+                for p in (1, 2):
+                    spec = DataSpecificationGenerator(
+                        chip.x, chip.y, p, vertex, db)
+                    spec.reserve_memory_region(0, 100)
+                    spec.switch_write_focus(0)
+                    spec.write_array([chip.x, chip.y, p])
+                    spec.end_specification()
+
+        transceiver = _ByCoreTransceiver()
+        writer.set_transceiver(transceiver)
+        written = dict()
+        for n_threads in ("1", "4"):
+            set_config("Machine", "n_loading_threads", n_threads)
+            transceiver.regions_written.clear()
+            load_application_data_specs()
+            written[n_threads] = sorted(transceiver.regions_written)
+        # User 0, header and table, and region 0 of each core
+        self.assertEqual(3 * 48 * 2 * 3, len(written["1"]))
+        self.assertEqual(written["1"], written["4"])
+
+    def test_load_by_board_error(self) -> None:
+        set_config("Machine", "versions", VersionStrings.FOUR_PLUS.text)
+        set_config("Machine", "n_loading_threads", "4")
+        writer = FecDataWriter.mock()
+        writer.set_machine(virtual_machine_by_boards(2))
+        writer.set_transceiver(_MockTransceiver())
+        vertex = _TestVertexWithBinary(
+            "binary", ExecutableType.USES_SIMULATION_INTERFACE)
+        with DsSqlliteDatabase() as db:
+            for chip in writer.get_machine().chips:
+                spec = DataSpecificationGenerator(
+                    chip.x, chip.y, 1, vertex, db)
+                spec.reserve_memory_region(0, 12)
+                spec.end_specification()
+            spec = DataSpecificationGenerator(0, 0, 2, vertex, db)
+            spec.reference_memory_region(0, 1)
+            spec.end_specification()
+
+        # DataSpecException because one of the regions can't be found
+        with self.assertRaises(DataSpecException):
+            load_application_data_specs()
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,312 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import struct
+from typing import Any, Dict, List, Sequence, Tuple
+import unittest
+from unittest import mock
+
+from testfixtures.logcapture import LogCapture
+
+from spinn_utilities.config_holder import set_config
+from spinn_utilities.overrides import overrides
+
+from spinn_machine.version.version_strings import VersionStrings
+from spinn_machine.virtual_machine import virtual_machine_by_boards
+from spinnman.model.enums import ExecutableType
+from spinnman.transceiver.mockable_transceiver import MockableTransceiver
+
+from pacman.model.graphs.machine import SimpleMachineVertex
+from pacman.model.placements import Placement
+
+from spinn_front_end_common.abstract_models import (
+    AbstractGeneratesDataSpecification, AbstractHasAssociatedBinary)
+from spinn_front_end_common.data.fec_data_writer import FecDataWriter
+from spinn_front_end_common.interface.config_setup import unittest_setup
+from spinn_front_end_common.interface.ds import (
+    DataSpecificationGenerator, DsSqlliteDatabase)
+from spinn_front_end_common.interface.interface_functions import (
+    placements_provenance_gatherer)
+from spinn_front_end_common.interface.provenance import (
+    AbstractProvidesProvenanceDataFromMachine, ProvenanceReader,
+    ProvenanceWriter, ProvidesProvenanceDataFromMachineImpl)
+from spinn_front_end_common.utilities.constants import APP_PTR_TABLE_BYTE_SIZE
+
+
+class _ReadVertex(SimpleMachineVertex, ProvidesProvenanceDataFromMachineImpl):
+
+    def __init__(self, calls: List[str], fail: bool = False):
+        super().__init__(None)
+        self._calls = calls
+        self._fail = fail
+
+    @property
+    @overrides(ProvidesProvenanceDataFromMachineImpl._provenance_region_id)
+    def _provenance_region_id(self) -> int:
+        return 0
+
+    @property
+    @overrides(
+        ProvidesProvenanceDataFromMachineImpl._n_additional_data_items)
+    def _n_additional_data_items(self) -> int:
+        return 0
+
+    @overrides(ProvidesProvenanceDataFromMachineImpl._read_provenance_data)
+    def _read_provenance_data(self, placement: Placement) -> Sequence[int]:
+        self._calls.append("read")
+        if self._fail:
+            raise ValueError(f"Failed {placement.x} {placement.y}")
+        # No values that need reporting
+        return [0] * self.N_SYSTEM_PROVENANCE_WORDS
+
+
+class _OldParseVertex(_ReadVertex):
+    """
+    Parses its extra provenance with an override that opens its own writer.
+    """
+
+    @property
+    @overrides(
+        ProvidesProvenanceDataFromMachineImpl._n_additional_data_items)
+    def _n_additional_data_items(self) -> int:
+        return 1
+
+    @overrides(ProvidesProvenanceDataFromMachineImpl._read_provenance_data)
+    def _read_provenance_data(self, placement: Placement) -> Sequence[int]:
+        return [0] * self.N_SYSTEM_PROVENANCE_WORDS + [placement.p]
+
+    # As written before the writer was passed in
+    @overrides(
+        ProvidesProvenanceDataFromMachineImpl.parse_extra_provenance_items)
+    def parse_extra_provenance_items(  # type: ignore[override]
+            self, label: str, x: int, y: int, p: int,
+            provenance_data: Sequence[int]) -> None:
+        with ProvenanceWriter() as db:
+            db.insert_core(x, y, p, "Old", provenance_data[0])
+
+
+class _BulkVertex(SimpleMachineVertex, AbstractHasAssociatedBinary,
+                  AbstractGeneratesDataSpecification,
+                  ProvidesProvenanceDataFromMachineImpl):
+
+    def __init__(self) -> None:
+        super().__init__(None)
+
+    @property
+    @overrides(ProvidesProvenanceDataFromMachineImpl._provenance_region_id)
+    def _provenance_region_id(self) -> int:
+        return 0
+
+    @property
+    @overrides(
+        ProvidesProvenanceDataFromMachineImpl._n_additional_data_items)
+    def _n_additional_data_items(self) -> int:
+        return 0
+
+    @overrides(AbstractHasAssociatedBinary.get_binary_file_name)
+    def get_binary_file_name(self) -> str:
+        return "bulk.aplx"
+
+    @overrides(AbstractHasAssociatedBinary.get_binary_start_type)
+    def get_binary_start_type(self) -> ExecutableType:
+        return ExecutableType.USES_SIMULATION_INTERFACE
+
+    @overrides(AbstractGeneratesDataSpecification.generate_data_specification)
+    def generate_data_specification(self, spec: DataSpecificationGenerator,
+                                    placement: Placement) -> None:
+        pass
+
+
+class _MemoryTransceiver(MockableTransceiver):
+    """
+    Reads from regions of memory put in it, recording the reads done.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.memory: Dict[Tuple[int, int, int], bytes] = dict()
+        self.reads: List[Tuple[int, int, int, int]] = list()
+
+    @overrides(MockableTransceiver.read_memory)
+    def read_memory(
+            self, x: int, y: int, base_address: int, length: int,
+            cpu: int = 0) -> bytearray:
+        self.reads.append((x, y, base_address, length))
+        data = bytearray(length)
+        for (m_x, m_y, address), content in self.memory.items():
+            offset = address - base_address
+            if (m_x, m_y) == (x, y) and 0 <= offset < length:
+                data[offset:offset + len(content)] = content
+        return data
+
+
+class _OwnVertex(SimpleMachineVertex,
+                 AbstractProvidesProvenanceDataFromMachine):
+
+    def __init__(self, calls: List[str], done: List[Placement]):
+        super().__init__(None)
+        self._calls = calls
+        self._done = done
+
+    @overrides(AbstractProvidesProvenanceDataFromMachine
+               .get_provenance_data_from_machine)
+    def get_provenance_data_from_machine(self, placement: Placement) -> None:
+        self._calls.append("own")
+        self._done.append(placement)
+        raise KeyError(f"Own {placement.x} {placement.y}")
+
+
+class TestPlacementsProvenanceGatherer(unittest.TestCase):
+
+    def setUp(self) -> None:
+        unittest_setup()
+        set_config("Machine", "versions", VersionStrings.FOUR_PLUS.text)
+        set_config("Reports", "write_provenance", "True")
+
+    def _gather(self, n_threads: int, placements: List[Placement]) -> List[
+            str]:
+        set_config("Reports", "n_provenance_threads", str(n_threads))
+        with LogCapture() as lc:
+            placements_provenance_gatherer(len(placements), placements)
+        # The traceback differs depending on which thread did the read
+        return [str(record.msg).strip().splitlines()[-1]
+                for record in lc.records]
+
+    def test_threads_match_serial(self) -> None:
+        writer = FecDataWriter.mock()
+        writer.set_machine(virtual_machine_by_boards(3))
+        done: List[Placement] = list()
+        calls: List[str] = list()
+        placements = list()
+        for i, chip in enumerate(writer.get_machine().chips):
+            x, y = chip.x, chip.y
+            placements.append(
+                Placement(_ReadVertex(calls, i % 20 == 7), x, y, 1))
+            placements.append(Placement(_ReadVertex(calls), x, y, 2))
+            if i % 30 == 3:
+                placements.append(
+                    Placement(_OwnVertex(calls, done), x, y, 3))
+
+        serial = self._gather(1, placements)
+        with ProvenanceReader() as db:
+            expected = db.run_query(
+                "SELECT x, y, p, description, the_value "
+                "FROM core_provenance_view")
+        # Ignore the first run's provenance
+        writer = FecDataWriter.mock()
+        writer.set_machine(virtual_machine_by_boards(3))
+        serial_done = list(done)
+        done.clear()
+        calls.clear()
+
+        threaded = self._gather(4, placements)
+        # Vertices reading their own provenance wait for the workers
+        self.assertEqual(
+            sorted(calls, key=lambda call: call == "own"), calls)
+        with ProvenanceReader() as db:
+            self.assertEqual(expected, db.run_query(
+                "SELECT x, y, p, description, the_value "
+                "FROM core_provenance_view"))
+        self.assertEqual(serial, threaded)
+        self.assertEqual(serial_done, done)
+        self.assertEqual(
+            ["Errors found during provenance gathering:",
+             "KeyError: 'Own 0 3'", "ValueError: Failed 1 3"],
+            serial[:3])
+
+    def test_shared_writer(self) -> None:
+        writer = FecDataWriter.mock()
+        writer.set_machine(virtual_machine_by_boards(1))
+        calls: List[str] = list()
+        placements = [
+            Placement(_OldParseVertex(calls) if p % 3 == 0
+                      else _ReadVertex(calls), 0, 0, p)
+            for p in range(1, 10)]
+        opened: List[ProvenanceWriter] = list()
+        real_init = ProvenanceWriter.__init__
+
+        def init(db: ProvenanceWriter, *args: Any) -> None:
+            opened.append(db)
+            real_init(db, *args)
+
+        with mock.patch.object(ProvenanceWriter, "__init__", init):
+            self.assertEqual([], self._gather(1, placements))
+        # One writer for each run of vertices that take one, and one for
+        # each parse of a vertex whose override opens its own
+        self.assertEqual(3 + 3 * 2, len(opened))
+        with ProvenanceReader() as db:
+            self.assertEqual([(3, 3), (6, 6), (9, 9)], db.run_query(
+                "SELECT p, the_value FROM core_provenance_view "
+                "WHERE description = 'Old' ORDER BY p"))
+            self.assertEqual([(9, )], db.run_query(
+                "SELECT count(*) FROM core_provenance_view "
+                "WHERE description = ?",
+                [ProvidesProvenanceDataFromMachineImpl._TIMER_TICK_OVERRUN]))
+
+    def test_read_by_chip(self) -> None:
+        writer = FecDataWriter.mock()
+        writer.set_machine(virtual_machine_by_boards(1))
+        transceiver = _MemoryTransceiver()
+        writer.set_transceiver(transceiver)
+        size = _BulkVertex().get_provenance_data_size(0)
+        # The size of the other region of each core; 3, 4 and 5 are
+        # allocated one after the other, as are 6 and 7, with a gap between
+        # 5 and 6.  The provenance of 8 is too far beyond that of 7.
+        other_sizes = {
+            (0, 0, 3): 200, (0, 0, 4): 200, (0, 0, 5): 200,
+            (0, 0, 6): 200, (0, 0, 7): 0x10000, (0, 0, 8): 200,
+            (1, 0, 3): 200}
+        starts = {(0, 0): 0x10000, (1, 0): 0x20000}
+        placements = list()
+        addresses = dict()
+        with DsSqlliteDatabase() as ds_db:
+            for (x, y, p), other_size in other_sizes.items():
+                vertex = _BulkVertex()
+                placements.append(Placement(vertex, x, y, p))
+                spec = DataSpecificationGenerator(x, y, p, vertex, ds_db)
+                spec.reserve_memory_region(0, size)
+                spec.reserve_memory_region(1, other_size)
+            for (x, y, p), _, malloc_size, _ in sorted(
+                    ds_db.get_info_for_cores()):
+                if p == 6:
+                    starts[x, y] += 256
+                ds_db.set_start_address(x, y, p, starts[x, y])
+                addresses[x, y, p] = starts[x, y] + APP_PTR_TABLE_BYTE_SIZE
+                starts[x, y] += malloc_size
+                ds_db.set_region_pointer(x, y, p, 0, addresses[x, y, p])
+                transceiver.memory[x, y, addresses[x, y, p]] = struct.pack(
+                    "<6I", 100 * x + p, 0, 0, 0, 0, 0)
+        writer.set_ds_database_path(writer.get_ds_database_path())
+
+        self._gather(1, placements)
+        # Cores 3, 4 and 5 are read together, as are 6 and 7
+        self.assertEqual(
+            [(0, 0, addresses[0, 0, 3],
+              addresses[0, 0, 5] + size - addresses[0, 0, 3]),
+             (0, 0, addresses[0, 0, 6],
+              addresses[0, 0, 7] + size - addresses[0, 0, 6]),
+             (0, 0, addresses[0, 0, 8], size),
+             (1, 0, addresses[1, 0, 3], size)], transceiver.reads)
+        with ProvenanceReader() as db:
+            self.assertEqual(
+                [(x, y, p, 100 * x + p) for x, y, p in sorted(addresses)],
+                db.run_query(
+                    "SELECT x, y, p, the_value FROM core_provenance_view "
+                    "WHERE description = ? ORDER BY x, y, p",
+                    [ProvidesProvenanceDataFromMachineImpl
+                     ._TIMES_TRANSMISSION_SPIKES_OVERRAN]))
+
+
+if __name__ == "__main__":
+    unittest.main()
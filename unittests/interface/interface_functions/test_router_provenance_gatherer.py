@@ -0,0 +1,127 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from typing import Any, Iterator, List, Sequence, Tuple
+import unittest
+from unittest import mock
+
+from testfixtures.logcapture import LogCapture
+
+from spinn_utilities.config_holder import set_config
+from spinn_utilities.overrides import overrides
+
+from spinn_machine.version.version_strings import VersionStrings
+from spinn_machine.virtual_machine import virtual_machine_by_boards
+from spinnman.exceptions import SpinnmanException
+from spinnman.model import RouterDiagnostics
+from spinnman.transceiver.mockable_transceiver import MockableTransceiver
+
+from pacman.model.routing_tables import (
+    MulticastRoutingTables, UnCompressedMulticastRoutingTable)
+
+from spinn_front_end_common.data.fec_data_writer import FecDataWriter
+from spinn_front_end_common.interface.config_setup import unittest_setup
+from spinn_front_end_common.interface.interface_functions import (
+    router_provenance_gatherer)
+from spinn_front_end_common.interface.provenance import ProvenanceReader
+
+
+class _DiagnosticsTransceiver(MockableTransceiver):
+    """
+    Returns router diagnostics based on the chip, failing for some chips.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.reads: List[Tuple[int, int]] = list()
+
+    @overrides(MockableTransceiver.get_router_diagnostics)
+    def get_router_diagnostics(self, x: int, y: int) -> RouterDiagnostics:
+        self.reads.append((x, y))
+        if (x + y) % 7 == 0:
+            raise SpinnmanException(f"No router at {x}, {y}")
+        return RouterDiagnostics(0, 0, [x, y, x + y] + [0] * 13)
+
+
+class TestRouterProvenanceGatherer(unittest.TestCase):
+
+    def setUp(self) -> None:
+        unittest_setup()
+        set_config("Machine", "versions", VersionStrings.FOUR_PLUS.text)
+        set_config("Reports", "write_provenance", "True")
+
+    def _gather(self, n_threads: int) -> Tuple[
+            List[str], List[Sequence[object]]]:
+        set_config(
+            "Reports", "n_router_provenance_threads", str(n_threads))
+        writer = FecDataWriter.mock()
+        writer.set_machine(virtual_machine_by_boards(3))
+        transceiver = _DiagnosticsTransceiver()
+        writer.set_transceiver(transceiver)
+        writer.set_uncompressed(MulticastRoutingTables(
+            UnCompressedMulticastRoutingTable(chip.x, chip.y)
+            for i, chip in enumerate(writer.get_machine().chips)
+            if i % 5 == 0))
+        with LogCapture() as lc:
+            router_provenance_gatherer("Run")
+        self.assertEqual(
+            sorted(set(transceiver.reads)), sorted(
+                (chip.x, chip.y) for chip in writer.get_machine().chips))
+        with ProvenanceReader() as db:
+            rows = db.run_query(
+                "SELECT x, y, description, the_value, expected "
+                "FROM router_provenance ORDER BY chip_id")
+        return [record.getMessage() for record in lc.records], list(rows)
+
+    def test_threads_match_serial(self) -> None:
+        serial_log, serial_rows = self._gather(1)
+        threaded_log, threaded_rows = self._gather(4)
+        self.assertEqual(serial_rows, threaded_rows)
+        self.assertEqual(serial_log, threaded_log)
+        self.assertIn(
+            "Could not read routing diagnostics from 0,0", serial_log)
+        self.assertIn((1, 0, "RunLocal_Multicast_Packets", 1, 0), serial_rows)
+
+    def test_chip_not_read(self) -> None:
+        set_config("Reports", "n_router_provenance_threads", "4")
+        writer = FecDataWriter.mock()
+        writer.set_machine(virtual_machine_by_boards(1))
+        writer.set_transceiver(_DiagnosticsTransceiver())
+        writer.set_uncompressed(MulticastRoutingTables([
+            UnCompressedMulticastRoutingTable(1, 1)]))
+
+        class _NoWorkers(object):
+            def __init__(self, *args: Any) -> None:
+                pass
+
+            def __enter__(self) -> Iterator[object]:
+                return iter(())
+
+            def __exit__(self, *args: Any) -> None:
+                pass
+
+        # Workers that finish without reading a chip are reported like a
+        # failed read rather than stopping the gathering
+        with mock.patch(
+                "spinn_front_end_common.interface.interface_functions."
+                "router_provenance_gatherer.BoardWorkers", _NoWorkers), \
+                LogCapture() as lc:
+            router_provenance_gatherer("Run")
+        self.assertIn(
+            "Could not read routing diagnostics from 1,1",
+            [record.getMessage() for record in lc.records])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -154,6 +154,125 @@ class TestProvenanceDatabase(unittest.TestCase):
             db.insert_core(1, 3, 2, "des2", 67)
             db.insert_core(1, 3, 1, "des1", 48)
 
+    def test_buffered(self) -> None:
+        with ProvenanceWriter() as db:
+            for i in range(ProvenanceWriter._FLUSH_SIZE + 1):
+                db.insert_core(1, 3, i % 3, "des1", i)
+            db.insert_router(1, 3, "des1", 34)
+            # Only the full buffer has been written so far
+            for table, count in (
+                    ("core_provenance", ProvenanceWriter._FLUSH_SIZE),
+                    ("router_provenance", 0)):
+                row = db.cursor().execute(
+                    f"SELECT COUNT(*) AS num FROM {table}").fetchone()
+                self.assertEqual(count, row["num"])
+        with ProvenanceReader() as db:
+            data = db.run_query(
+                "SELECT COUNT(*), SUM(the_value) FROM core_provenance")
+            n_values = ProvenanceWriter._FLUSH_SIZE + 1
+            self.assertEqual(
+                [(n_values, n_values * (n_values - 1) // 2)], data)
+            self.assertEqual(
+                [(1, 3, 34)], db.get_router_by_chip("des1"))
+
+        # Nothing buffered is written if there is an error
+        with self.assertRaises(KeyError):
+            with ProvenanceWriter() as db:
+                db.insert_monitor(1, 3, "des1", 34)
+                raise KeyError("oops")
+        with ProvenanceReader() as db:
+            self.assertEqual([], db.get_monitor_by_chip("des1"))
+
+    def test_summaries(self) -> None:
+        with ProvenanceWriter() as db:
+            db.insert_router(1, 3, "des1", 34, True)
+            db.insert_router(1, 2, "des1", 45, True)
+            db.insert_core(1, 3, 2, "des1", 34)
+            db.insert_core(1, 3, 2, "des1", 12)
+        with ProvenanceReader() as db:
+            # Computed from the views until materialised
+            router_summary = db.get_summary("router_summary")
+            self.assertEqual(
+                [("des1", 34, 45, 39.5, 79, 2, 1.0)], router_summary)
+            core_stats = db.get_summary("core_stats")
+            self.assertEqual(
+                [(None, 1, 3, 2, "des1", 12, 34, 23.0, 46, 2)], core_stats)
+            self.assertEqual([], db.get_summary("monitor_stats"))
+            with self.assertRaises(KeyError):
+                db.get_summary("reports")
+
+        with ProvenanceWriter() as db:
+            db.materialise_summaries()
+        with ProvenanceReader() as db:
+            # Now read from the tables, with the same values
+            self.assertEqual(
+                router_summary, db.run_query("SELECT * FROM router_summary"))
+            self.assertEqual(router_summary, db.get_summary("router_summary"))
+            self.assertEqual(core_stats, db.get_summary("core_stats"))
+
+        with ProvenanceWriter() as db:
+            db.insert_router(1, 3, "des1", 50, True)
+        with ProvenanceReader() as db:
+            # Writing routers empties only the router tables
+            self.assertEqual(
+                [], db.run_query("SELECT * FROM router_summary"))
+            self.assertEqual(
+                [("des1", 34, 50, 43.0, 129, 3, 1.0)],
+                db.get_summary("router_summary"))
+            self.assertEqual(
+                core_stats, db.run_query("SELECT * FROM core_stats"))
+
+        with ProvenanceWriter() as db:
+            db.cursor().execute(
+                "UPDATE core SET core_name = 'pop' "
+                "WHERE x = 1 AND y = 3 AND processor = 2")
+        with ProvenanceReader() as db:
+            # Renaming cores empties the core statistics
+            self.assertEqual([], db.run_query("SELECT * FROM core_stats"))
+
+    def test_by_chip_summaries(self) -> None:
+        with ProvenanceWriter() as db:
+            db.insert_router(1, 3, "des1", 34, True)
+            db.insert_router(1, 2, "des1", 45, True)
+            db.insert_router(1, 3, "des2", 67)
+            db.insert_router(1, 3, "des1", 48)
+            db.insert_monitor(1, 3, "des1", 34)
+            db.insert_monitor(1, 2, "des1", 45)
+        with ProvenanceReader() as db:
+            routers = sorted(db.get_router_by_chip("des1"))
+            monitors = sorted(db.get_monitor_by_chip("des1"))
+        self.assertEqual([(1, 2, 45), (1, 3, 34), (1, 3, 48)], routers)
+        self.assertEqual([(1, 2, 45), (1, 3, 34)], monitors)
+
+        with ProvenanceWriter() as db:
+            db.materialise_summaries()
+        with ProvenanceReader() as db:
+            # The same values, whether or not there is one per chip
+            self.assertEqual(routers, sorted(db.get_router_by_chip("des1")))
+            self.assertEqual(monitors, sorted(db.get_monitor_by_chip("des1")))
+            self.assertEqual([(1, 3, 67)], db.get_router_by_chip("des2"))
+            self.assertEqual([], db.get_router_by_chip("junk"))
+
+        with ProvenanceWriter() as db:
+            db.insert_monitor(1, 2, "des1", 11)
+        with ProvenanceReader() as db:
+            # Written after the summaries so read from the provenance
+            self.assertEqual(
+                [(1, 2, 11), (1, 2, 45), (1, 3, 34)],
+                sorted(db.get_monitor_by_chip("des1")))
+
+    def test_description_indexes(self) -> None:
+        with ProvenanceWriter() as db:
+            db.insert_router(1, 3, "des1", 34, True)
+            db.insert_monitor(1, 3, "des1", 34)
+        with ProvenanceReader() as db:
+            for table in ("router_provenance", "monitor_provenance"):
+                plan = db.run_query(
+                    "EXPLAIN QUERY PLAN SELECT the_value "
+                    f"FROM {table} WHERE description = ?", ["des1"])
+                self.assertIn(
+                    f"USING INDEX {table}_description", str(plan))
+
     def test_messages(self) -> None:
         set_config("Reports", "provenance_report_cutoff", "3")
         with LogCapture() as lc:
@@ -0,0 +1,85 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import threading
+import time
+from typing import Iterator, List, Optional, Tuple
+import unittest
+
+from spinn_front_end_common.utilities.board_workers import BoardWorkers
+
+
+class TestBoardWorkers(unittest.TestCase):
+
+    def test_results(self) -> None:
+        threads = set()
+
+        def work(items: List[Optional[int]]) -> Iterator[
+                Tuple[str, Optional[int]]]:
+            threads.add(threading.current_thread().name)
+            for item in items:
+                yield threading.current_thread().name, item
+
+        boards: List[List[Optional[int]]] = [[1, 2, None], [3], [], [4, 5]]
+        with BoardWorkers(boards, work, 2, "Tester") as workers:
+            results = list(workers)
+        # None is a result like any other
+        self.assertCountEqual(
+            [1, 2, None, 3, 4, 5], [item for _, item in results])
+        self.assertTrue(all(name.startswith("Tester") for name in threads))
+        self.assertLessEqual(len(threads), 2)
+
+        # Each board is done in order by one thread
+        for board in filter(None, boards):
+            self.assertEqual(board, [
+                item for _, item in results if item in board])
+            self.assertEqual(1, len(
+                {name for name, item in results if item in board}))
+
+    def test_error(self) -> None:
+        def work(items: List[int]) -> Iterator[int]:
+            for item in items:
+                if item < 0:
+                    raise ValueError(item)
+                yield item
+
+        with self.assertRaises(ValueError):
+            with BoardWorkers([[1, -1], [2, 3]], work, 2, "Tester") as w:
+                for _ in w:
+                    pass
+
+    def test_stop_early(self) -> None:
+        started = list()
+
+        def work(board: str) -> Iterator[str]:
+            started.append(board)
+            yield board
+            # Still busy when the results stop being wanted
+            time.sleep(0.2)
+            yield board
+
+        with self.assertRaises(ValueError):
+            with BoardWorkers(["a", "b", "c"], work, 1, "Tester") as w:
+                for _ in w:
+                    raise ValueError()
+        # The boards not started are never started
+        self.assertEqual(["a"], started)
+
+    def test_empty(self) -> None:
+        with BoardWorkers[List[int], int]([], list, 4, "Tester") as workers:
+            self.assertEqual([], list(workers))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,123 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import socket
+import unittest
+from typing import Any, List, Optional, cast
+
+from pacman.model.graphs.machine import SimpleMachineVertex
+from pacman.model.placements import Placement
+
+from spinn_front_end_common.interface.config_setup import unittest_setup
+from spinn_front_end_common.utility_models import (
+    DataOutMultiplexer, DataSpeedUpPacketGatherMachineVertex,
+    ExtraMonitorSupportMachineVertex)
+
+
+class _FakeConnection(object):
+    def __init__(self, sock: socket.socket):
+        self.sock = sock
+
+    def receive(self, timeout: Optional[float] = None) -> bytes:
+        self.sock.settimeout(timeout)
+        return self.sock.recv(1024)
+
+
+class _FakeStream(object):
+    """
+    Gets data from one end of a socket pair, with the gatherer sending the
+    data into the other end in chunks.
+    """
+    selectable = True
+
+    def __init__(self, length: int):
+        self.sock, self.sender = socket.socketpair(
+            socket.AF_UNIX, socket.SOCK_DGRAM)
+        self.connection = _FakeConnection(self.sock)
+        self.output = bytearray()
+        self.length = length
+        self.finished = False
+
+    def fileno(self) -> int:
+        return self.sock.fileno()
+
+
+class _FakeGatherer(object):
+    data_out_timeout = 0.05
+
+    def __init__(self, name: str, drop_last: bool = False):
+        self.name = name
+        self.drop_last = drop_last
+        self.active: Optional[_FakeStream] = None
+        self.n_timeouts = 0
+        self.dropped: List[bytes] = list()
+
+    def start_data_out(
+            self, extra_monitor: Any, placement: Placement,
+            memory_address: int, length_in_bytes: int) -> _FakeStream:
+        assert self.active is None, "only one stream per gatherer"
+        self.active = stream = _FakeStream(length_in_bytes)
+        data = (f"{self.name}{memory_address}".encode() *
+                length_in_bytes)[:length_in_bytes]
+        chunks = [data[i:i + 3] for i in range(0, length_in_bytes, 3)]
+        if self.drop_last:
+            self.drop_last = False
+            self.dropped = chunks[-1:]
+            chunks = chunks[:-1]
+        for chunk in chunks:
+            stream.sender.send(chunk)
+        return stream
+
+    def read_data_out(
+            self, stream: _FakeStream, timeout: Optional[float]) -> None:
+        stream.output += stream.connection.receive(timeout)
+        stream.finished = len(stream.output) == stream.length
+
+    def timeout_data_out(self, stream: _FakeStream) -> None:
+        self.n_timeouts += 1
+        for chunk in self.dropped:
+            stream.sender.send(chunk)
+
+    def end_data_out(self, stream: _FakeStream) -> None:
+        stream.sock.close()
+        stream.sender.close()
+        self.active = None
+
+
+class TestDataOutMultiplexer(unittest.TestCase):
+
+    def setUp(self) -> None:
+        unittest_setup()
+
+    def test_read(self) -> None:
+        gatherers = [_FakeGatherer("a"), _FakeGatherer("b", drop_last=True)]
+        monitor = cast(ExtraMonitorSupportMachineVertex, None)
+        placement = Placement(SimpleMachineVertex(None), 0, 0, 1)
+        multiplexer = DataOutMultiplexer()
+        expected: List[bytes] = list()
+        for address, length in [(1, 10), (2, 0), (3, 7)]:
+            for gatherer in gatherers:
+                self.assertEqual(len(expected), multiplexer.add(
+                    cast(DataSpeedUpPacketGatherMachineVertex, gatherer),
+                    monitor, placement, address, length))
+                expected.append(
+                    (f"{gatherer.name}{address}".encode() * length)[:length])
+        self.assertEqual(expected, [bytes(data) for data in
+                                    multiplexer.read()])
+        self.assertEqual(0, gatherers[0].n_timeouts)
+        self.assertEqual(1, gatherers[1].n_timeouts)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,154 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import socket
+import struct
+import time
+import unittest
+from typing import List, cast
+
+from spinnman.connections.udp_packet_connections import SCAMPConnection
+from spinnman.exceptions import SpinnmanIOException
+from spinnman.messages.sdp import SDPMessage
+
+from pacman.model.graphs.machine import SimpleMachineVertex
+from pacman.model.placements import Placement
+
+from spinn_front_end_common.interface.config_setup import unittest_setup
+from spinn_front_end_common.utility_models import (
+    DataOutStream, DataSpeedUpPacketGatherMachineVertex)
+from spinn_front_end_common.utility_models.\
+    data_speed_up_packet_gatherer_machine_vertex import (
+        _differing_blocks, _GathererConnection, _ReceivedSeqNums, _SendPacer,
+        WORDS_PER_FULL_PACKET, WORDS_PER_FULL_PACKET_WITH_SEQUENCE_NUM,
+        _RECEIVE_BUFFER_SIZE, _VERIFY_BLOCK_BYTES)
+
+_BYTES_PER_PACKET = WORDS_PER_FULL_PACKET_WITH_SEQUENCE_NUM * 4
+_LAST = 0x80000000
+_TRANSACTION_ID = 7
+
+
+class _MockConnection(object):
+    def __init__(self) -> None:
+        self.sent: List[SDPMessage] = list()
+
+    def send_sdp_message(self, message: SDPMessage) -> None:
+        self.sent.append(message)
+
+
+class TestDataSpeedUpPacketGatherer(unittest.TestCase):
+
+    def setUp(self) -> None:
+        unittest_setup()
+
+    def test_received_seq_nums(self) -> None:
+        seq_nums = _ReceivedSeqNums(10)
+        for seq_num in [0, 3, 3, 4, 9, 10]:
+            seq_nums.add(seq_num)
+        self.assertFalse(seq_nums.all_received)
+        self.assertEqual([1, 2, 5, 6, 7, 8], list(seq_nums.missing()))
+        for seq_num in [1, 2, 5, 6, 7, 8]:
+            seq_nums.add(seq_num)
+        self.assertTrue(seq_nums.all_received)
+        self.assertEqual(0, len(seq_nums.missing()))
+
+    def test_differing_blocks(self) -> None:
+        data = bytes(i % 256 for i in range(_VERIFY_BLOCK_BYTES * 3 + 3))
+        self.assertEqual([], list(_differing_blocks(data, data)))
+        changed = bytearray(data)
+        # Swapping words keeps the sum but is still found
+        changed[0:4], changed[4:8] = data[4:8], data[0:4]
+        changed[-1] ^= 1
+        self.assertEqual([0, 3], list(_differing_blocks(data, bytes(changed))))
+        self.assertEqual(
+            [2], list(_differing_blocks(data, data[:_VERIFY_BLOCK_BYTES * 2])))
+        self.assertEqual([], list(_differing_blocks(b"", b"")))
+
+    def test_receive_into(self) -> None:
+        connection = _GathererConnection(local_host="127.0.0.1")
+        sender = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        try:
+            buffer = bytearray(_RECEIVE_BUFFER_SIZE)
+            full = bytes(i % 256 for i in range(WORDS_PER_FULL_PACKET * 4))
+            sender.sendto(full, ("127.0.0.1", connection.local_port))
+            self.assertEqual(len(full), connection.receive_into(buffer, 1))
+            self.assertEqual(full, buffer[:len(full)])
+            # A larger packet would be truncated so is an error
+            sender.sendto(full + b"xx", ("127.0.0.1", connection.local_port))
+            with self.assertRaises(SpinnmanIOException):
+                connection.receive_into(buffer, 1)
+        finally:
+            sender.close()
+            connection.close()
+
+    def test_send_pacer(self) -> None:
+        pacer = _SendPacer()
+        self.assertEqual(_SendPacer.INITIAL_RATE, pacer.rate)
+        self.assertIsNone(pacer.lowest)
+        pacer.start_round()
+        pacer.increase()
+        pacer.start_round()
+        self.assertEqual(_SendPacer.INITIAL_RATE, pacer.lowest)
+        self.assertEqual(
+            _SendPacer.INITIAL_RATE + _SendPacer.INCREASE, pacer.highest)
+        pacer.clear_range()
+        self.assertIsNone(pacer.lowest)
+        self.assertIsNone(pacer.highest)
+        self.assertEqual(
+            _SendPacer.INITIAL_RATE + _SendPacer.INCREASE, pacer.rate)
+        pacer.decrease()
+        self.assertEqual(
+            (_SendPacer.INITIAL_RATE + _SendPacer.INCREASE) *
+            _SendPacer.DECREASE, pacer.rate)
+        for _ in range(100):
+            pacer.increase()
+        self.assertEqual(_SendPacer.MAX_RATE, pacer.rate)
+        for _ in range(100):
+            pacer.decrease()
+        self.assertEqual(_SendPacer.MIN_RATE, pacer.rate)
+
+        # At the slowest rate, 21 packets take at least 20 gaps
+        start = time.perf_counter()
+        for _ in range(21):
+            pacer.wait()
+        self.assertGreaterEqual(
+            time.perf_counter() - start,
+            20 / _SendPacer.MIN_RATE - _SendPacer.MIN_SLEEP)
+
+    def test_retransmit(self) -> None:
+        gatherer = DataSpeedUpPacketGatherMachineVertex(0, 0, "127.0.0.1")
+        expected = bytes(i % 251 for i in range(_BYTES_PER_PACKET * 3))
+        connection = _MockConnection()
+        stream = DataOutStream(
+            Placement(SimpleMachineVertex(None), 0, 0, 1), 0, len(expected),
+            _TRANSACTION_ID, cast(SCAMPConnection, connection))
+
+        def packet(seq_num: int, flags: int = 0) -> bytes:
+            start = seq_num * _BYTES_PER_PACKET
+            return struct.pack(
+                "<II", seq_num | flags, _TRANSACTION_ID) + expected[
+                    start:start + _BYTES_PER_PACKET]
+        for data in [packet(0), packet(2, _LAST), packet(1)]:
+            gatherer.receive_data_out(stream, data)
+        self.assertFalse(stream.finished)
+        gatherer.receive_data_out(stream, memoryview(packet(3, _LAST)))
+        self.assertTrue(stream.finished)
+        self.assertEqual(
+            [struct.pack("<IIII", 1000, _TRANSACTION_ID, 1, 1)],
+            [message.data for message in connection.sent])
+        self.assertEqual(expected, stream.output)
+
+
+if __name__ == '__main__':
+    unittest.main()